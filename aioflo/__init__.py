@@ -1,2 +1,45 @@
-"""Define the aioflo package."""
-from .api import async_get_api  # noqa
+"""Define the aioflo package.
+
+Public names are imported from their submodules on first access, so importing the
+package itself stays cheap (which matters for short-lived processes).
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .alarm import Alarm  # noqa
+    from .api import API, async_get_api  # noqa
+    from .device import Device  # noqa
+    from .location import Location  # noqa
+    from .manager import APIManager  # noqa
+    from .presence import Presence  # noqa
+    from .user import User  # noqa
+    from .water import Water  # noqa
+
+# Public names, mapped to the submodules that define them:
+_LAZY_ATTRS: Dict[str, str] = {
+    "API": "api",
+    "APIManager": "manager",
+    "Alarm": "alarm",
+    "Device": "device",
+    "Location": "location",
+    "Presence": "presence",
+    "User": "user",
+    "Water": "water",
+    "async_get_api": "api",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule the first time it's accessed."""
+    if (module_name := _LAZY_ATTRS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Return the module's attributes (including ones that haven't been imported)."""
+    return sorted({*globals(), *_LAZY_ATTRS})
@@ -1,16 +1,213 @@
 """Define /alarms endpoints."""
-from typing import Awaitable, Callable
+import asyncio
+from collections import defaultdict
+import logging
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 from .const import API_V2_BASE
+from .models import AlarmDefinition
+from .transport import TimeoutT
 
+_LOGGER = logging.getLogger(__name__)
 
-class Alarm:  # pylint: disable=too-few-public-methods
+DEFAULT_CATALOG_TTL: int = 86400
+
+
+class AlarmCatalog:
+    """Define an index of alarm definitions.
+
+    Alarms can be looked up by ID or name, or grouped by severity or by whether they
+    shut off the water, in constant time.
+
+    :param alarms: The alarm definitions to index
+    :type alarms: ``Iterable[aioflo.models.AlarmDefinition]``
+    """
+
+    def __init__(self, alarms: Iterable[AlarmDefinition]) -> None:
+        """Initialize."""
+        by_severity: Dict[Optional[str], List[AlarmDefinition]] = defaultdict(list)
+        by_shutoff: Dict[bool, List[AlarmDefinition]] = defaultdict(list)
+
+        self._by_id: Dict[int, AlarmDefinition] = {}
+        self._by_name: Dict[str, AlarmDefinition] = {}
+
+        for alarm in alarms:
+            self._by_id[alarm.id] = alarm
+            if alarm.name is not None:
+                self._by_name[alarm.name] = alarm
+            by_severity[alarm.severity].append(alarm)
+            by_shutoff[bool(alarm.is_shutoff)].append(alarm)
+
+        self._by_severity: Dict[Optional[str], Tuple[AlarmDefinition, ...]] = {
+            severity: tuple(alarms) for severity, alarms in by_severity.items()
+        }
+        self._by_shutoff: Dict[bool, Tuple[AlarmDefinition, ...]] = {
+            is_shutoff: tuple(alarms) for is_shutoff, alarms in by_shutoff.items()
+        }
+
+    def __contains__(self, alarm_id: object) -> bool:
+        """Return whether an alarm ID is in the catalog."""
+        return alarm_id in self._by_id
+
+    def __iter__(self) -> Iterator[AlarmDefinition]:
+        """Iterate over all alarm definitions."""
+        return iter(self._by_id.values())
+
+    def __len__(self) -> int:
+        """Return the number of alarm definitions."""
+        return len(self._by_id)
+
+    @classmethod
+    def from_response(cls, data: Mapping[str, Any]) -> "AlarmCatalog":
+        """Create a catalog from the response to :meth:`Alarm.get_all`.
+
+        :param data: The decoded response
+        :type data: ``dict``
+        :rtype: :meth:`aioflo.alarm.AlarmCatalog`
+        """
+        return cls(AlarmDefinition.from_dict(item) for item in data.get("items", []))
+
+    def get(self, alarm_id: int) -> Optional[AlarmDefinition]:
+        """Return the alarm definition with an ID (or ``None`` if there isn't one).
+
+        :param alarm_id: An alarm ID
+        :type alarm_id: ``int``
+        :rtype: :meth:`aioflo.models.AlarmDefinition`
+        """
+        return self._by_id.get(alarm_id)
+
+    def get_by_name(self, name: str) -> Optional[AlarmDefinition]:
+        """Return the alarm definition with a name (or ``None`` if there isn't one).
+
+        :param name: An alarm name (e.g., ``"health_test_skipped"``)
+        :type name: ``str``
+        :rtype: :meth:`aioflo.models.AlarmDefinition`
+        """
+        return self._by_name.get(name)
+
+    def get_by_severity(self, severity: str) -> Tuple[AlarmDefinition, ...]:
+        """Return the alarm definitions with a severity.
+
+        :param severity: An alarm severity (e.g., ``"critical"``)
+        :type severity: ``str``
+        :rtype: ``Tuple[aioflo.models.AlarmDefinition, ...]``
+        """
+        return self._by_severity.get(severity, ())
+
+    def get_by_shutoff(self, is_shutoff: bool = True) -> Tuple[AlarmDefinition, ...]:
+        """Return the alarm definitions that do (or don't) shut off the water.
+
+        :param is_shutoff: Whether to return alarms that shut off the water
+        :type is_shutoff: ``bool``
+        :rtype: ``Tuple[aioflo.models.AlarmDefinition, ...]``
+        """
+        return self._by_shutoff.get(is_shutoff, ())
+
+
+class Alarm:
     """Define an object to handle the endpoints."""
 
     def __init__(self, request: Callable[..., Awaitable]) -> None:
         """Initialize."""
+        self._catalog: Optional[AlarmCatalog] = None
+        self._catalog_refresh_task: Optional[asyncio.Task] = None
+        self._catalog_source: Any = None
+        self._catalog_updated: float = 0.0
         self._request: Callable[..., Awaitable] = request
 
-    async def get_all(self):
-        """Get all alarms."""
-        return await self._request("get", f"{API_V2_BASE}/alarms")
+    async def _async_refresh_catalog(self, timeout: Optional[TimeoutT]) -> AlarmCatalog:
+        """Retrieve and index all alarm definitions."""
+        data = await self.get_all(timeout=timeout)
+
+        # A cached or not-modified (HTTP 304) response is the same object as before,
+        # so there's nothing to re-index:
+        if self._catalog is None or data is not self._catalog_source:
+            self._catalog = AlarmCatalog.from_response(data)
+            self._catalog_source = data
+        self._catalog_updated = time.monotonic()
+        return self._catalog
+
+    @staticmethod
+    def _handle_catalog_refresh_done(task: asyncio.Task) -> None:
+        """Log (and mark as retrieved) any error from a catalog refresh task."""
+        if task.cancelled():
+            return
+        if err := task.exception():
+            _LOGGER.warning("Unable to retrieve the alarm catalog: %s", err)
+
+    def _start_catalog_refresh(self, timeout: Optional[TimeoutT]) -> asyncio.Task:
+        """Start retrieving the alarm catalog in a task.
+
+        Any error is logged (and marked as retrieved) even if every caller waiting on
+        the task has been cancelled.
+        """
+        self._catalog_refresh_task = asyncio.create_task(
+            self._async_refresh_catalog(timeout)
+        )
+        self._catalog_refresh_task.add_done_callback(self._handle_catalog_refresh_done)
+        return self._catalog_refresh_task
+
+    def cancel_catalog_refresh(self) -> None:
+        """Cancel a background refresh of the alarm catalog (if one is running)."""
+        if self._catalog_refresh_task and not self._catalog_refresh_task.done():
+            self._catalog_refresh_task.cancel()
+
+    async def get_all(self, *, raw: bool = False, timeout: Optional[TimeoutT] = None):
+        """Get all alarms.
+
+        :param raw: Return the undecoded response body
+        :type raw: ``bool``
+        :param timeout: A time limit for the request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
+        :rtype: ``dict`` (or ``bytes`` if ``raw``)
+        """
+        return await self._request(
+            "get", f"{API_V2_BASE}/alarms", raw=raw, timeout=timeout
+        )
+
+    async def get_catalog(
+        self,
+        *,
+        max_age: float = DEFAULT_CATALOG_TTL,
+        timeout: Optional[TimeoutT] = None,
+    ) -> AlarmCatalog:
+        """Get an index of all alarm definitions.
+
+        The catalog is only retrieved the first time; after that, the stored catalog
+        is returned immediately and, once it is older than ``max_age``, refreshed in
+        the background (if a refresh fails, the stored catalog is kept).
+
+        :param max_age: The number of seconds after which to refresh the catalog
+        :type max_age: ``float``
+        :param timeout: A time limit for retrieving the catalog (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
+        :rtype: :meth:`aioflo.alarm.AlarmCatalog`
+        """
+        if self._catalog is None:
+            if (task := self._catalog_refresh_task) is None or task.done():
+                task = self._start_catalog_refresh(timeout)
+            # The fetch is shared (and shielded) so that a cancelled caller doesn't
+            # cancel it for everyone else:
+            return await asyncio.shield(task)
+
+        if time.monotonic() - self._catalog_updated >= max_age and (
+            not self._catalog_refresh_task or self._catalog_refresh_task.done()
+        ):
+            _LOGGER.debug("Refreshing the alarm catalog in the background")
+            self._start_catalog_refresh(timeout)
+
+        return self._catalog
@@ -1,20 +1,60 @@
 """Define a base client for interacting with Flo."""
-from datetime import datetime
+import asyncio
+from collections import Counter
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from functools import partial
+import json
 import logging
-from typing import Optional
-from urllib.parse import urlparse
-
-from aiohttp import ClientSession, ClientTimeout
-from aiohttp.client_exceptions import ClientError
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlsplit
 
 from .alarm import Alarm
+from .cache import ResponseCache, ValidatedResponse, ValidatorCache, is_invalidated_by
+from .const import API_V2_BASE
 from .device import Device
-from .errors import RequestError
+from .errors import (
+    FloError,
+    RateLimitError,
+    RequestError,
+    RequestTimeoutError,
+    ResponseError,
+)
+from .instrumentation import Instrumentation, RequestEvent, call_hook
 from .location import Location
 from .presence import Presence
+from .ratelimit import RateLimiter, parse_retry_after
+from .retry import RetryPolicy
+from .transport import (
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    AiohttpTransport,
+    Timeout,
+    TimeoutT,
+    Transport,
+    TransportResponse,
+    get_timeout,
+)
 from .user import User
+from .util import get_request_key, get_resource
+from .util.json import JSONLoads, json_loads as default_json_loads
 from .water import Water
 
+if TYPE_CHECKING:  # pragma: no cover
+    from aiohttp import ClientSession
+
 _LOGGER = logging.getLogger(__name__)
 
 API_V1_BASE: str = "https://api.meetflo.com/api/v1"
@@ -27,23 +67,137 @@ DEFAULT_HEADER_USER_AGENT: str = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_2) "
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/79.0.3945.117 Safari/537.36"
 )
-DEFAULT_TIMEOUT: int = 10
+DEFAULT_HEADERS: Dict[str, str] = {
+    "Accept": DEFAULT_HEADER_ACCEPT,
+    "Content-Type": DEFAULT_HEADER_CONTENT_TYPE,
+    "Origin": DEFAULT_HEADER_ORIGIN,
+    "Referrer": DEFAULT_HEADER_REFERER,
+    "User-Agent": DEFAULT_HEADER_USER_AGENT,
+}
+
+DEFAULT_TOKEN_REFRESH_MARGIN: int = 300
+
+# In-flight reads are keyed on the resource they read, the request, whether the raw
+# body was requested, and the timeout it was sent with:
+InFlightKeyT = Tuple[Optional[str], Hashable, bool, Optional[Timeout]]
+
+
+@asynccontextmanager
+async def _no_concurrency_slot() -> AsyncIterator[None]:
+    """Define a concurrency slot that is always available."""
+    yield
 
 
 class API:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
-    """Define the API object."""
+    """Define the API object.
+
+    :param username: A Flo email address
+    :type username: ``str``
+    :param password: A Flo password
+    :type password: ``str``
+    :param session: An ``aiohttp`` ``ClientSession`` (if not provided, a pooled session
+        owned by this object is created on first use)
+    :type session: ``aiohttp.client.ClientSession``
+    :param transport: An optional transport to send requests with (if provided,
+        ``session`` and the connection pool settings are ignored)
+    :type transport: :meth:`aioflo.transport.Transport`
+    :param connection_limit: The max number of pooled connections (0 for no limit)
+    :type connection_limit: ``int``
+    :param connection_limit_per_host: The max number of pooled connections per host
+        (0 for no limit)
+    :type connection_limit_per_host: ``int``
+    :param dns_cache_ttl: The number of seconds to cache DNS lookups (``None`` to
+        cache forever)
+    :type dns_cache_ttl: ``int``
+    :param keepalive_timeout: The number of seconds to keep idle connections alive
+    :type keepalive_timeout: ``float``
+    :param token_refresh_margin: The number of seconds before the access token expires
+        at which to refresh it in the background
+    :type token_refresh_margin: ``int``
+    :param cache: An optional cache for responses to read-only requests
+    :type cache: :meth:`aioflo.cache.ResponseCache`
+    :param coalesce_requests: Whether identical, concurrent read requests should share
+        a single round trip
+    :type coalesce_requests: ``bool``
+    :param rate_limiter: An optional rate limiter for all requests (which can be shared
+        between API objects)
+    :type rate_limiter: :meth:`aioflo.ratelimit.RateLimiter`
+    :param retry_policy: An optional policy for retrying failed requests
+    :type retry_policy: :meth:`aioflo.retry.RetryPolicy`
+    :param json_loads: A custom function to decode JSON responses with (defaults to
+        orjson or ujson if installed, falling back to the standard library)
+    :type json_loads: ``Callable[[bytes], Any]``
+    :param validator_cache: An optional store of ``ETag``/``Last-Modified`` validators
+        used to make read requests conditional (reusing the stored body on HTTP 304)
+    :type validator_cache: :meth:`aioflo.cache.ValidatorCache`
+    :param instrumentation: Optional hooks to report request metrics to
+    :type instrumentation: :meth:`aioflo.instrumentation.Instrumentation`
+    :param concurrency_slot: An optional callable that returns an async context
+        manager to hold for the duration of each HTTP request (e.g., to cap how many
+        requests are in flight across many API objects)
+    :type concurrency_slot: ``Callable[[], AsyncContextManager]``
+    :param timeout: An optional default time limit for every request (in seconds or
+        as a :meth:`aioflo.transport.Timeout`), including those made with a session
+        passed in by the caller; endpoint methods can override it per call
+    :type timeout: ``Union[float, aioflo.transport.Timeout]``
+    """
 
     def __init__(
-        self, username: str, password: str, *, session: Optional[ClientSession] = None
+        self,
+        username: str,
+        password: str,
+        *,
+        session: Optional["ClientSession"] = None,
+        transport: Optional[Transport] = None,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        connection_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        token_refresh_margin: int = DEFAULT_TOKEN_REFRESH_MARGIN,
+        cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        json_loads: JSONLoads = default_json_loads,
+        validator_cache: Optional[ValidatorCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        concurrency_slot: Callable[[], AsyncContextManager] = _no_concurrency_slot,
+        timeout: Optional[TimeoutT] = None,
     ) -> None:
         """Initialize."""
+        self._coalesce_requests: bool = coalesce_requests
+        self._concurrency_slot: Callable[[], AsyncContextManager] = concurrency_slot
+        self._default_headers: Dict[str, Dict[str, str]] = {}
+        self._in_flight_reads: Dict[InFlightKeyT, asyncio.Task] = {}
+        self._in_flight_waiters: Counter = Counter()
+        self._instrumentation: Optional[Instrumentation] = instrumentation
+        self._json_loads: JSONLoads = json_loads
         self._password: str = password
-        self._session: ClientSession = session
+        self._rate_limiter: Optional[RateLimiter] = rate_limiter
+        self._retry_policy: Optional[RetryPolicy] = retry_policy
+        self._timeout: Optional[Timeout] = get_timeout(timeout)
         self._token: Optional[str] = None
         self._token_expiration: Optional[datetime] = None
+        self._token_refresh_margin: timedelta = timedelta(seconds=token_refresh_margin)
+        self._token_refresh_task: Optional[asyncio.Task] = None
         self._user_id: Optional[str] = None
         self._username: str = username
 
+        self._owns_transport: bool = transport is None
+        self.transport: Transport = transport or AiohttpTransport(
+            session=session,
+            connection_limit=connection_limit,
+            connection_limit_per_host=connection_limit_per_host,
+            dns_cache_ttl=dns_cache_ttl,
+            keepalive_timeout=keepalive_timeout,
+        )
+
+        self.cache: Optional[ResponseCache] = cache
+        self.validator_cache: Optional[ValidatorCache] = validator_cache
+
+        for base_url in (API_V1_BASE, API_V2_BASE):
+            self._get_default_headers(base_url)
+
         self.alarm: Alarm = Alarm(self._request)
         self.location: Location = Location(self._request)
         self.water: Water = Water(self._request)
@@ -53,59 +207,416 @@ class API:  # pylint: disable=too-few-public-methods,too-many-instance-attribute
         # These endpoints will get instantiated post-authentication:
         self.user: Optional[User] = None
 
-    async def _request(self, method: str, url: str, **kwargs) -> dict:
-        """Make a request against the API."""
-        if self._token_expiration and datetime.now() >= self._token_expiration:
-            _LOGGER.info("Requesting new access token to replace expired one")
-
-            # Nullify the token so that the authentication request doesn't use it:
-            self._token = None
-
-            # Nullify the expiration so the authentication request doesn't get caught
-            # here:
-            self._token_expiration = None
-
-            await self.async_authenticate()
-
-        kwargs.setdefault("headers", {})
-        kwargs["headers"].update(
-            {
-                "Accept": DEFAULT_HEADER_ACCEPT,
-                "Content-Type": DEFAULT_HEADER_CONTENT_TYPE,
-                "Host": urlparse(url).netloc,
-                "Origin": DEFAULT_HEADER_ORIGIN,
-                "Referrer": DEFAULT_HEADER_REFERER,
-                "User-Agent": DEFAULT_HEADER_USER_AGENT,
+    async def __aenter__(self) -> "API":
+        """Enter the runtime context (the connection pool is created lazily)."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Exit the runtime context and release pooled connections."""
+        await self.close()
+
+    def _get_default_headers(self, url: str) -> Dict[str, str]:
+        """Return the default headers for a URL (built once per origin).
+
+        The origin is sliced out of the URL rather than parsed, since this happens on
+        every request.
+        """
+        origin_end = url.find("/", url.find("//") + 2)
+        origin = url if origin_end == -1 else url[:origin_end]
+
+        if (headers := self._default_headers.get(origin)) is None:
+            headers = self._default_headers[origin] = {
+                **DEFAULT_HEADERS,
+                "Host": urlsplit(origin).netloc,
             }
-        )
 
-        if self._token:
-            kwargs["headers"]["Authorization"] = self._token
+        return headers
+
+    async def close(self) -> None:
+        """Close the connection pool owned by this object (if any).
+
+        Any in-flight reads are cancelled. Sessions and transports passed in by the
+        caller are left untouched.
+        """
+        if self._token_refresh_task and not self._token_refresh_task.done():
+            self._token_refresh_task.cancel()
+        self.alarm.cancel_catalog_refresh()
+
+        if in_flight_reads := list(self._in_flight_reads.values()):
+            for task in in_flight_reads:
+                task.cancel()
+            await asyncio.gather(*in_flight_reads, return_exceptions=True)
+
+        if self._owns_transport:
+            await self.transport.close()
+
+    def _async_schedule_token_refresh(self) -> asyncio.Task:
+        """Schedule a token refresh, reusing one that is already in flight.
+
+        Every coroutine that needs a new token awaits the same task, so only a single
+        authentication request is made no matter how many requests are waiting.
+        """
+        if not self._token_refresh_task or self._token_refresh_task.done():
+            self._token_refresh_task = asyncio.create_task(self.async_authenticate())
+            self._token_refresh_task.add_done_callback(self._handle_token_refresh_done)
+        return self._token_refresh_task
+
+    @staticmethod
+    def _handle_token_refresh_done(task: asyncio.Task) -> None:
+        """Log (and mark as retrieved) any error from a token refresh task."""
+        if task.cancelled():
+            return
+        if err := task.exception():
+            _LOGGER.warning("Unable to refresh access token: %s", err)
 
-        use_running_session = self._session and not self._session.closed
+    async def _async_ensure_token(self) -> None:
+        """Ensure that the access token is valid before making a request.
 
-        if use_running_session:
-            session = self._session
-        else:
-            session = ClientSession(timeout=ClientTimeout(total=DEFAULT_TIMEOUT))
+        An expired token blocks until a new one is obtained; a token that is within
+        the refresh margin of expiring is refreshed in the background while the
+        request proceeds with the (still valid) current token.
+        """
+        if not self._token_expiration:
+            return
 
+        now = datetime.now()
+        if now >= self._token_expiration:
+            if not self._token_refresh_task or self._token_refresh_task.done():
+                _LOGGER.info("Requesting new access token to replace expired one")
+            # Shield the shared task so that cancelling one waiter doesn't cancel the
+            # refresh for everyone else:
+            await asyncio.shield(self._async_schedule_token_refresh())
+        elif now >= self._token_expiration - self._token_refresh_margin:
+            if not self._token_refresh_task or self._token_refresh_task.done():
+                _LOGGER.debug("Refreshing access token ahead of its expiration")
+            self._async_schedule_token_refresh()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        idempotent: bool = False,
+        bypass_cache: bool = False,
+        timeout: Optional[TimeoutT] = None,
+        **kwargs,
+    ) -> Any:
+        """Make an authenticated request against the API.
+
+        Reads are always considered idempotent; writes are only retried if the caller
+        marks them as ``idempotent``. If ``raw=True`` is passed, the undecoded response
+        body is returned as ``bytes`` (and never cached). A read with
+        ``bypass_cache=True`` always goes to the API (though its response is still
+        cached). ``timeout`` (or the default one) limits the whole call, and is passed
+        on to the transport for each HTTP request.
+        """
+        if (request_timeout := get_timeout(timeout) or self._timeout) is None:
+            return await self._async_request(
+                method, url, idempotent, bypass_cache, **kwargs
+            )
+
+        kwargs["timeout"] = request_timeout
+        if request_timeout.total is None:
+            return await self._async_request(
+                method, url, idempotent, bypass_cache, **kwargs
+            )
+
+        # Anything still in flight when the deadline passes is cancelled (shared work,
+        # like a coalesced read or a token refresh, is shielded and carries on):
         try:
-            async with session.request(method, url, **kwargs) as resp:
-                data: dict = await resp.json(content_type=None)
-                resp.raise_for_status()
-                return data
-        except ClientError as err:
-            raise RequestError(f"There was an error while requesting {url}") from err
+            return await asyncio.wait_for(
+                self._async_request(method, url, idempotent, bypass_cache, **kwargs),
+                request_timeout.total,
+            )
+        except asyncio.TimeoutError as err:
+            raise RequestTimeoutError(
+                f"Timed out after {request_timeout.total} seconds while requesting "
+                f"{url}"
+            ) from err
+
+    async def _async_request(
+        self, method: str, url: str, idempotent: bool, bypass_cache: bool, **kwargs
+    ) -> Any:
+        """Make an authenticated request against the API (without a deadline)."""
+        if method.lower() != "get":
+            try:
+                return await self._async_send_with_retries(
+                    method, url, idempotent, **kwargs
+                )
+            finally:
+                # A write (even a failed one) may have changed the resource, so any
+                # cached (or in-flight) reads of it can no longer be trusted:
+                if self.cache is not None:
+                    self.cache.invalidate(url)
+                self._drop_in_flight_reads(url)
+
+        params = kwargs.get("params")
+        raw = kwargs.get("raw", False)
+
+        if self.cache is not None and not raw and not bypass_cache:
+            found, cached_data = self.cache.get(method, url, params)
+            if found:
+                if self._instrumentation is not None:
+                    call_hook(self._instrumentation, "on_cache_hit", method, url)
+                return cached_data
+
+        if not self._coalesce_requests:
+            return await self._async_read(method, url, **kwargs)
+
+        # Identical reads that are already in flight share a single round trip (the
+        # timeout is part of the key so that one caller's deadline never applies to
+        # another):
+        key = (
+            get_resource(url),
+            get_request_key(method, url, params),
+            raw,
+            kwargs.get("timeout"),
+        )
+        if (task := self._in_flight_reads.get(key)) is None:
+            task = asyncio.create_task(self._async_read(method, url, **kwargs))
+            task.add_done_callback(partial(self._handle_in_flight_read_done, key))
+            self._in_flight_reads[key] = task
+
+        # Shield the shared task so that cancelling one waiter doesn't cancel the
+        # request for everyone else:
+        self._in_flight_waiters[task] += 1
+        try:
+            return await asyncio.shield(task)
         finally:
-            if not use_running_session:
-                await session.close()
+            self._in_flight_waiters[task] -= 1
+            if not self._in_flight_waiters[task]:
+                del self._in_flight_waiters[task]
+                # If every waiter timed out or was cancelled, nobody needs the result:
+                if not task.done():
+                    task.cancel()
+                    if self._in_flight_reads.get(key) is task:
+                        del self._in_flight_reads[key]
+
+    def _handle_in_flight_read_done(
+        self, key: InFlightKeyT, task: asyncio.Task
+    ) -> None:
+        """Stop tracking a completed read (and mark any error as retrieved)."""
+        if self._in_flight_reads.get(key) is task:
+            del self._in_flight_reads[key]
+        if not task.cancelled():
+            task.exception()
+
+    def _drop_in_flight_reads(self, url: str) -> None:
+        """Stop sharing in-flight reads made stale by a write to a URL's resource.
+
+        Callers that are already waiting still get the result, but new callers start a
+        fresh read instead of joining one that may have been sent before a write.
+        """
+        if (resource := get_resource(url)) is None:
+            return
+
+        for key in [
+            key for key in self._in_flight_reads if is_invalidated_by(key[0], resource)
+        ]:
+            del self._in_flight_reads[key]
+
+    async def _async_read(self, method: str, url: str, **kwargs) -> dict:
+        """Make an authenticated read request and cache its response."""
+        if self.cache is None or kwargs.get("raw"):
+            return await self._async_send_with_retries(method, url, True, **kwargs)
+
+        # If the resource is invalidated while the read is in flight, the response may
+        # predate a write, so it isn't cached:
+        generation = self.cache.get_generation(url)
+        data = await self._async_send_with_retries(method, url, True, **kwargs)
+        self.cache.set(method, url, kwargs.get("params"), data, generation=generation)
+        return data
+
+    async def _async_send_with_retries(
+        self, method: str, url: str, idempotent: bool, **kwargs
+    ) -> dict:
+        """Send an authenticated request, retrying it according to the retry policy."""
+        attempt = 1
+
+        while True:
+            try:
+                return await self._async_authorized_send(method, url, **kwargs)
+            except FloError as err:
+                if (
+                    not idempotent
+                    or self._retry_policy is None
+                    or attempt >= self._retry_policy.max_attempts
+                    or not self._retry_policy.is_retryable(err)
+                ):
+                    raise
+
+                delay = self._retry_policy.get_delay(attempt, err)
+                _LOGGER.debug(
+                    "Retrying %s %s in %.2f seconds (attempt %s failed: %s)",
+                    method.upper(),
+                    url,
+                    delay,
+                    attempt,
+                    err,
+                )
+                if self._instrumentation is not None:
+                    call_hook(
+                        self._instrumentation, "on_retry", method, url, attempt, delay
+                    )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _async_authorized_send(self, method: str, url: str, **kwargs) -> dict:
+        """Send a request to the API with a valid access token."""
+        await self._async_ensure_token()
+        return await self._async_send(method, url, self._token, **kwargs)
+
+    async def _async_send(
+        self,
+        method: str,
+        url: str,
+        token: Optional[str],
+        *,
+        raw: bool = False,
+        **kwargs,
+    ) -> Any:
+        """Send a request to the API (optionally with an access token)."""
+        # The default headers are shared, so only copy them when adding to them:
+        headers = self._get_default_headers(url)
+        if extra_headers := kwargs.pop("headers", None):
+            headers = {**headers, **extra_headers}
+        if token:
+            headers = {**headers, "Authorization": token}
+
+        validated = None
+        if self.validator_cache is not None and method.lower() == "get":
+            if validated := self.validator_cache.get(method, url, kwargs.get("params")):
+                headers = {**headers, **validated.get_headers()}
+
+        event = None
+        if (instrumentation := self._instrumentation) is not None:
+            # Serialize JSON payloads up front so that their size can be reported:
+            if (payload := kwargs.pop("json", None)) is not None:
+                kwargs["data"] = json.dumps(payload).encode()
+            event = RequestEvent(method, url, len(kwargs.get("data") or b""))
+
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+
+        async with self._concurrency_slot():
+            if instrumentation is not None and event is not None:
+                # Time spent waiting for a token or a slot isn't part of the latency:
+                event.mark_sent()
+                call_hook(instrumentation, "on_request_start", event)
+
+            try:
+                body, validated = await self._async_http_request(
+                    method, url, headers, validated, event, **kwargs
+                )
+            except BaseException as err:
+                # Every started request is reported as finished (whatever went wrong)
+                # so that hooks can clean up after it:
+                if instrumentation is not None and event is not None:
+                    event.finish()
+                    call_hook(instrumentation, "on_request_error", event, err)
+                raise
+
+        if instrumentation is not None and event is not None:
+            event.bytes_received = len(body or b"")
+            event.finish()
+            call_hook(instrumentation, "on_request_end", event)
+
+        if validated is not None:
+            return self._decode_validated(url, validated, raw)
+        if raw:
+            return body
+        # Without a stored response, there's always a body:
+        assert body is not None
+        return self._decode(url, body)
+
+    async def _async_http_request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        validated: Optional[ValidatedResponse],
+        event: Optional[RequestEvent],
+        **kwargs,
+    ) -> Tuple[Optional[bytes], Optional[ValidatedResponse]]:
+        """Make an HTTP request and return its body (``None`` if not modified).
+
+        Also returns the stored response that the body belongs to (if any).
+        """
+        resp = await self.transport.request(method, url, headers=headers, **kwargs)
+
+        if event is not None:
+            event.status = resp.status
+
+        retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.on_response(resp.status, retry_after)
+
+        if resp.status == 429:
+            raise RateLimitError(f"Rate limited while requesting {url}", retry_after)
+
+        if resp.status == 304 and validated is not None:
+            # The stored response is still current (and only exists because there's
+            # a validator cache):
+            assert self.validator_cache is not None
+            self.validator_cache.record_not_modified(url)
+            return None, validated
+
+        if resp.status >= 400:
+            raise ResponseError(
+                f"There was an error while requesting {url}", resp.status
+            )
+
+        return resp.body, self._store_validated(method, url, kwargs.get("params"), resp)
+
+    def _store_validated(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict],
+        resp: TransportResponse,
+    ) -> Optional[ValidatedResponse]:
+        """Store a read response that has validators (if enabled)."""
+        if self.validator_cache is None or method.lower() != "get":
+            return None
+        return self.validator_cache.set(
+            method,
+            url,
+            params,
+            resp.headers.get("ETag"),
+            resp.headers.get("Last-Modified"),
+            resp.body,
+        )
+
+    def _decode(self, url: str, body: bytes) -> Any:
+        """Decode a JSON response body."""
+        if not body:
+            return None
+
+        try:
+            return self._json_loads(body)
+        except ValueError as err:
+            raise RequestError(f"Received invalid JSON from {url}") from err
+
+    def _decode_validated(
+        self, url: str, validated: ValidatedResponse, raw: bool
+    ) -> Any:
+        """Return a stored response body (decoding it only once)."""
+        if raw:
+            return validated.body
+        if not validated.decoded:
+            validated.data = self._decode(url, validated.body)
+            validated.decoded = True
+        return validated.data
 
     async def async_authenticate(self) -> None:
         """Authenticate the user and set the access token with its expiration."""
-        auth_response: dict = await self._request(
+        auth_response: dict = await self._async_send(
             "post",
             f"{API_V1_BASE}/users/auth",
+            None,
             json={"username": self._username, "password": self._password},
+            timeout=self._timeout,
         )
 
         self._token = auth_response["token"]
@@ -121,10 +632,19 @@ class API:  # pylint: disable=too-few-public-methods,too-many-instance-attribute
 
 
 async def async_get_api(
-    username: str, password: str, *, session: Optional[ClientSession] = None
+    username: str,
+    password: str,
+    *,
+    session: Optional["ClientSession"] = None,
+    **kwargs: Any,
 ) -> API:
     """Instantiate an authenticated API object.
 
+    If no session is provided, the returned object owns a pooled session; use it as
+    an async context manager (or call :meth:`aioflo.api.API.close`) to release it.
+    Any additional keyword arguments (e.g., connection pool or cache settings) are
+    passed through to :meth:`aioflo.api.API`.
+
     :param session: An ``aiohttp`` ``ClientSession``
     :type session: ``aiohttp.client.ClientSession``
     :param email: A Flo email address
@@ -133,6 +653,10 @@ async def async_get_api(
     :type password: ``str``
     :rtype: :meth:`aioflo.api.API`
     """
-    api = API(username, password, session=session)
-    await api.async_authenticate()
+    api = API(username, password, session=session, **kwargs)
+    try:
+        await api.async_authenticate()
+    except Exception:
+        await api.close()
+        raise
     return api
@@ -0,0 +1,157 @@
+"""Define helpers for sending a command to many targets at once."""
+import asyncio
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+from .errors import FloError, RequestError, RequestTimeoutError
+
+COMMAND_FAILED = "failed"
+COMMAND_SUCCEEDED = "succeeded"
+COMMAND_TIMED_OUT = "timed_out"
+
+DEFAULT_COMMAND_TIMEOUT: float = 30.0
+DEFAULT_VERIFY_INTERVAL: float = 2.0
+# Without a command timeout, verification gives up after this many reads:
+MAX_VERIFY_ATTEMPTS: int = 30
+
+
+class CommandResult(NamedTuple):
+    """Define the outcome of a command for a single target.
+
+    ``error`` is the ``FloError`` that caused a failure or timeout (``None`` if the
+    command succeeded) and ``elapsed`` is the number of seconds the command took.
+    """
+
+    target_id: str
+    status: str
+    error: Optional[FloError]
+    elapsed: float
+
+
+class BatchResult:
+    """Define the outcome of a command sent to many targets.
+
+    :param results: The per-target results
+    :type results: ``Iterable[aioflo.batch.CommandResult]``
+    :param elapsed: The number of seconds the whole batch took
+    :type elapsed: ``float``
+    """
+
+    def __init__(self, results: Iterable[CommandResult], elapsed: float) -> None:
+        """Initialize."""
+        self.elapsed: float = elapsed
+        self.results: Dict[str, CommandResult] = {
+            result.target_id: result for result in results
+        }
+
+    def __getitem__(self, target_id: str) -> CommandResult:
+        """Return the result for a target."""
+        return self.results[target_id]
+
+    def __iter__(self) -> Iterator[CommandResult]:
+        """Iterate over the per-target results."""
+        return iter(self.results.values())
+
+    def __len__(self) -> int:
+        """Return the number of targets."""
+        return len(self.results)
+
+    def __repr__(self) -> str:
+        """Return a compact representation."""
+        return (
+            f"<BatchResult succeeded={len(self.succeeded)} failed={len(self.failed)} "
+            f"timed_out={len(self.timed_out)} elapsed={self.elapsed:.3f}>"
+        )
+
+    def _get_target_ids(self, status: str) -> List[str]:
+        """Return the IDs of the targets with a status."""
+        return [
+            target_id
+            for target_id, result in self.results.items()
+            if result.status == status
+        ]
+
+    @property
+    def failed(self) -> List[str]:
+        """Return the IDs of the targets whose command failed."""
+        return self._get_target_ids(COMMAND_FAILED)
+
+    @property
+    def succeeded(self) -> List[str]:
+        """Return the IDs of the targets whose command succeeded."""
+        return self._get_target_ids(COMMAND_SUCCEEDED)
+
+    @property
+    def timed_out(self) -> List[str]:
+        """Return the IDs of the targets whose command didn't finish in time."""
+        return self._get_target_ids(COMMAND_TIMED_OUT)
+
+
+async def async_run_batch(
+    func: Callable[[str], Awaitable],
+    target_ids: Iterable[str],
+    *,
+    concurrency: int,
+    timeout: Optional[float],
+) -> BatchResult:
+    """Run a command coroutine function for many targets with bounded concurrency.
+
+    Each command gets ``timeout`` seconds from when it is dispatched (waiting for a
+    free slot doesn't count against it). A command that hits its deadline, or whose
+    request times out, is reported as timed out: it may or may not have taken effect.
+    Duplicate IDs are only commanded once.
+    """
+    if concurrency < 1:
+        raise RequestError(f"Invalid concurrency: {concurrency}")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(target_id: str) -> CommandResult:
+        """Run the command for a single target."""
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                await asyncio.wait_for(func(target_id), timeout)
+            except asyncio.TimeoutError:
+                return CommandResult(
+                    target_id,
+                    COMMAND_TIMED_OUT,
+                    RequestTimeoutError(
+                        f"Command for {target_id} didn't finish in {timeout} seconds"
+                    ),
+                    time.monotonic() - start,
+                )
+            except RequestTimeoutError as err:
+                return CommandResult(
+                    target_id, COMMAND_TIMED_OUT, err, time.monotonic() - start
+                )
+            except FloError as err:
+                return CommandResult(
+                    target_id, COMMAND_FAILED, err, time.monotonic() - start
+                )
+            return CommandResult(
+                target_id, COMMAND_SUCCEEDED, None, time.monotonic() - start
+            )
+
+    start = time.monotonic()
+    tasks = [
+        asyncio.create_task(run(target_id)) for target_id in dict.fromkeys(target_ids)
+    ]
+
+    try:
+        results = await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return BatchResult(results, time.monotonic() - start)
@@ -0,0 +1,282 @@
+"""Define an in-memory cache for API responses."""
+from collections import Counter, OrderedDict
+import time
+from typing import Any, Dict, FrozenSet, Hashable, Optional, Tuple
+
+from .util import get_endpoint_template, get_request_key, get_resource
+
+DEFAULT_CACHE_MAX_ENTRIES: int = 1024
+
+# Time-to-live values (in seconds) for endpoints whose data is safe to cache; any
+# endpoint not listed here isn't cached:
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "alarms": 3600,
+    "devices/{id}": 30,
+    "locations/{id}": 60,
+    "users/{id}": 300,
+}
+
+# Responses from some collections embed the state of resources from others (e.g., a
+# location expanded with its devices, or a user with their locations), so a write to a
+# resource also invalidates every cached response from these collections:
+DEPENDENT_COLLECTIONS: Dict[str, FrozenSet[str]] = {
+    "devices": frozenset({"locations", "users"}),
+    "locations": frozenset({"devices", "users"}),
+}
+
+
+def _get_collection(resource: Optional[str]) -> Optional[str]:
+    """Return the collection (e.g., ``devices``) that a resource belongs to."""
+    if resource is None:
+        return None
+    return resource.split("/", 1)[0]
+
+
+def is_invalidated_by(resource: Optional[str], written_resource: str) -> bool:
+    """Return whether a write to one resource makes reads of another stale."""
+    if resource == written_resource:
+        return True
+    dependents = DEPENDENT_COLLECTIONS.get(_get_collection(written_resource) or "")
+    return dependents is not None and _get_collection(resource) in dependents
+
+
+class ResponseCache:
+    """Define a TTL + LRU cache for responses to read-only requests.
+
+    Entries are keyed on method, URL, and query parameters; each endpoint template
+    (e.g., ``devices/{id}``) has its own TTL. Cached responses are shared between
+    callers, so they should be treated as read-only. A write to a device or location
+    invalidates every cached device, location, and user response, since those can
+    embed each other's state.
+
+    :param ttls: Endpoint templates mapped to TTLs (in seconds); merged with (and
+        overriding) the defaults
+    :type ttls: ``Dict[str, float]``
+    :param max_entries: The max number of responses to hold before evicting the least
+        recently used
+    :type max_entries: ``int``
+    """
+
+    def __init__(
+        self,
+        *,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """Initialize."""
+        self._entries: "OrderedDict[Hashable, Tuple[float, Optional[str], Any]]" = (
+            OrderedDict()
+        )
+        # Bumped on every invalidation, so that a read that was in flight at the time
+        # can tell that its response may be stale:
+        self._clear_generation: int = 0
+        self._collection_generations: Counter = Counter()
+        self._generations: Counter = Counter()
+        self._max_entries: int = max_entries
+        self._ttls: Dict[str, float] = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+
+        self.evictions: int = 0
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    def get(
+        self, method: str, url: str, params: Optional[dict] = None
+    ) -> Tuple[bool, Any]:
+        """Return a ``(found, response)`` tuple for a request."""
+        template = get_endpoint_template(url)
+        if not self._ttls.get(template):
+            return False, None
+
+        key = get_request_key(method, url, params)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses[template] += 1
+            return False, None
+
+        expiration, _, data = entry
+        if time.monotonic() >= expiration:
+            del self._entries[key]
+            self.misses[template] += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits[template] += 1
+        return True, data
+
+    def get_generation(self, url: str) -> Hashable:
+        """Return a token that changes whenever a URL's resource is invalidated.
+
+        A read should capture this before it's sent and pass it to :meth:`set`, so that
+        a response that was in flight during a write is never cached.
+        """
+        resource = get_resource(url)
+        return (
+            self._clear_generation,
+            self._collection_generations[_get_collection(resource)],
+            self._generations[resource],
+        )
+
+    def set(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict],
+        data: Any,
+        *,
+        generation: Optional[Hashable] = None,
+    ) -> None:
+        """Cache the response to a request (if its endpoint is cacheable).
+
+        If ``generation`` (from :meth:`get_generation`) is provided and the resource
+        has been invalidated since, the response is discarded.
+        """
+        ttl = self._ttls.get(get_endpoint_template(url))
+        if not ttl:
+            return
+        if generation is not None and generation != self.get_generation(url):
+            return
+
+        key = get_request_key(method, url, params)
+        self._entries[key] = (time.monotonic() + ttl, get_resource(url), data)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """Invalidate cached responses for the resource a URL refers to.
+
+        Responses from collections that embed the resource's state (see
+        ``DEPENDENT_COLLECTIONS``) are invalidated too. If no URL is provided, the
+        entire cache is cleared.
+        """
+        if url is None:
+            self._clear_generation += 1
+            self._entries.clear()
+            return
+
+        resource = get_resource(url)
+        if resource is None:
+            return
+
+        self._generations[resource] += 1
+        for collection in DEPENDENT_COLLECTIONS.get(
+            _get_collection(resource) or "", ()
+        ):
+            self._collection_generations[collection] += 1
+
+        for key in [
+            key
+            for key, (_, entry_resource, _) in self._entries.items()
+            if is_invalidated_by(entry_resource, resource)
+        ]:
+            del self._entries[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters (overall and per endpoint template)."""
+        return {
+            "entries": len(self._entries),
+            "evictions": self.evictions,
+            "hits": sum(self.hits.values()),
+            "misses": sum(self.misses.values()),
+            "endpoints": {
+                template: {"hits": self.hits[template], "misses": self.misses[template]}
+                for template in sorted(set(self.hits) | set(self.misses))
+            },
+        }
+
+
+class ValidatedResponse:  # pylint: disable=too-few-public-methods
+    """Define a stored response body along with its validators."""
+
+    __slots__ = ("body", "data", "decoded", "etag", "last_modified")
+
+    def __init__(
+        self, etag: Optional[str], last_modified: Optional[str], body: bytes
+    ) -> None:
+        """Initialize."""
+        self.body: bytes = body
+        self.data: Any = None
+        self.decoded: bool = False
+        self.etag: Optional[str] = etag
+        self.last_modified: Optional[str] = last_modified
+
+    def get_headers(self) -> Dict[str, str]:
+        """Return the headers that make a request conditional on this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ValidatorCache:
+    """Define an LRU store of responses for conditional requests.
+
+    Responses that carry an ``ETag`` or ``Last-Modified`` header are stored (keyed on
+    method, URL, and query parameters) so that the next identical request can ask the
+    server to skip the body if nothing has changed; on HTTP 304, the stored body (and
+    its already-decoded data) is reused. Unlike :meth:`ResponseCache`, this always
+    makes a round trip, so data is never stale.
+
+    :param max_entries: The max number of responses to hold before evicting the least
+        recently used
+    :type max_entries: ``int``
+    """
+
+    def __init__(self, *, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES) -> None:
+        """Initialize."""
+        self._entries: "OrderedDict[Hashable, ValidatedResponse]" = OrderedDict()
+        self._max_entries: int = max_entries
+
+        self.not_modified: Counter = Counter()
+
+    def __len__(self) -> int:
+        """Return the number of stored responses."""
+        return len(self._entries)
+
+    def get(
+        self, method: str, url: str, params: Optional[dict] = None
+    ) -> Optional[ValidatedResponse]:
+        """Return the stored response for a request (if there is one)."""
+        key = get_request_key(method, url, params)
+        if (entry := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict],
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body: bytes,
+    ) -> Optional[ValidatedResponse]:
+        """Store a response (if it has validators) and return its entry."""
+        key = get_request_key(method, url, params)
+        if not etag and not last_modified:
+            self._entries.pop(key, None)
+            return None
+
+        entry = self._entries[key] = ValidatedResponse(etag, last_modified, body)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def record_not_modified(self, url: str) -> None:
+        """Record that the server confirmed a stored response is still current."""
+        self.not_modified[get_endpoint_template(url)] += 1
+
+    def clear(self) -> None:
+        """Remove all stored responses."""
+        self._entries.clear()
@@ -1,2 +1,3 @@
 """Define package constants."""
 API_V2_BASE: str = "https://api-gw.meetflo.com/api/v2"
+DEFAULT_CONCURRENCY: int = 10
@@ -1,58 +1,294 @@
 """Define /device endpoints."""
-from typing import Awaitable, Callable
+import asyncio
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
-from .const import API_V2_BASE
+from .batch import (
+    DEFAULT_COMMAND_TIMEOUT,
+    DEFAULT_VERIFY_INTERVAL,
+    MAX_VERIFY_ATTEMPTS,
+    BatchResult,
+    async_run_batch,
+)
+from .const import API_V2_BASE, DEFAULT_CONCURRENCY
+from .errors import FloError, RequestTimeoutError
+from .transport import TimeoutT
+from .util import async_iter_bounded
 
+VALVE_CLOSED = "closed"
+VALVE_OPEN = "open"
 
-class Device:  # pylint: disable=too-few-public-methods
+
+class Device:
     """Define an object to handle the endpoints."""
 
     def __init__(self, request: Callable[..., Awaitable]) -> None:
         """Initialize."""
         self._request: Callable[..., Awaitable] = request
 
-    async def get_info(self, device_id: str) -> dict:
+    async def _set_valve(
+        self, device_id: str, target: str, timeout: Optional[TimeoutT]
+    ) -> None:
+        """Set the valve's target state."""
+        return await self._request(
+            "post",
+            f"{API_V2_BASE}/devices/{device_id}",
+            json={"valve": {"target": target}},
+            # Setting a target state is safe to repeat:
+            idempotent=True,
+            timeout=timeout,
+        )
+
+    async def _set_valve_many(
+        self,
+        device_ids: Iterable[str],
+        target: str,
+        concurrency: int,
+        timeout: Optional[float],
+        request_timeout: Optional[TimeoutT],
+        verify: bool,
+        verify_interval: float,
+    ) -> BatchResult:
+        """Set the valve's target state for many devices."""
+
+        async def set_valve(device_id: str) -> None:
+            """Set the valve for a single device (and wait for it to get there)."""
+            await self._set_valve(device_id, target, request_timeout)
+            if not verify:
+                return
+
+            attempt = 1
+            while True:
+                # Verification reads always go to the API, so a cached response can't
+                # make the valve look like it's already there:
+                data = await self._request(
+                    "get",
+                    f"{API_V2_BASE}/devices/{device_id}",
+                    bypass_cache=True,
+                    timeout=request_timeout,
+                )
+                if data.get("valve", {}).get("lastKnown") == target:
+                    return
+
+                # The command timeout bounds verification; without one, give up
+                # after a fixed number of reads:
+                if timeout is None and attempt >= MAX_VERIFY_ATTEMPTS:
+                    raise RequestTimeoutError(
+                        f"Valve for {device_id} didn't report being {target} after "
+                        f"{attempt} reads"
+                    )
+
+                attempt += 1
+                await asyncio.sleep(verify_interval)
+
+        return await async_run_batch(
+            set_valve, device_ids, concurrency=concurrency, timeout=timeout
+        )
+
+    @overload
+    async def get_info(
+        self,
+        device_id: str,
+        *,
+        raw: Literal[False] = ...,
+        timeout: Optional[TimeoutT] = ...,
+    ) -> dict:
+        ...
+
+    @overload
+    async def get_info(
+        self,
+        device_id: str,
+        *,
+        raw: bool = ...,
+        timeout: Optional[TimeoutT] = ...,
+    ) -> Union[dict, bytes]:
+        ...
+
+    async def get_info(
+        self,
+        device_id: str,
+        *,
+        raw: bool = False,
+        timeout: Optional[TimeoutT] = None,
+    ) -> Union[dict, bytes]:
         """Return device specific data.
 
         :param device_id: Unique identifier for the device
         :type device_id: ``str``
-        :rtype: ``dict``
+        :param raw: Return the undecoded response body
+        :type raw: ``bool``
+        :param timeout: A time limit for the request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
+        :rtype: ``dict`` (or ``bytes`` if ``raw``)
+        """
+        return await self._request(
+            "get", f"{API_V2_BASE}/devices/{device_id}", raw=raw, timeout=timeout
+        )
+
+    async def get_info_many(
+        self,
+        device_ids: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: Optional[TimeoutT] = None,
+    ) -> AsyncIterator[Tuple[str, Union[dict, FloError]]]:
+        """Return device specific data for many devices, as it arrives.
+
+        Yields ``(device_id, result)`` tuples in order of completion, where ``result``
+        is either the device data or the ``FloError`` raised while fetching it.
+
+        :param device_ids: Unique identifiers for the devices
+        :type device_ids: ``Iterable[str]``
+        :param concurrency: The max number of requests to have in flight at once
+        :type concurrency: ``int``
+        :param timeout: A time limit for each request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
+        :rtype: ``AsyncIterator[Tuple[str, Union[dict, FloError]]]``
         """
-        return await self._request("get", f"{API_V2_BASE}/devices/{device_id}")
 
-    async def run_health_test(self, device_id: str) -> None:
+        async def get_info(device_id: str) -> dict:
+            """Get info for a single device."""
+            return await self.get_info(device_id, timeout=timeout)
+
+        async for result in async_iter_bounded(get_info, device_ids, concurrency):
+            yield result
+
+    async def run_health_test(
+        self, device_id: str, *, timeout: Optional[TimeoutT] = None
+    ) -> None:
         """Run a health test for a specific device.
 
         :param device_id: Unique identifier for the device
         :type device_id: ``str``
+        :param timeout: A time limit for the request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
         :rtype: ``dict``
         """
         return await self._request(
-            "post", f"{API_V2_BASE}/devices/{device_id}/healthTest/run"
+            "post", f"{API_V2_BASE}/devices/{device_id}/healthTest/run", timeout=timeout
         )
 
-    async def open_valve(self, device_id: str) -> None:
+    async def open_valve(
+        self, device_id: str, *, timeout: Optional[TimeoutT] = None
+    ) -> None:
         """Open the valve for a specific device.
 
         :param device_id: Unique identifier for the device
         :type device_id: ``str``
+        :param timeout: A time limit for the request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
         :rtype: ``dict``
         """
-        return await self._request(
-            "post",
-            f"{API_V2_BASE}/devices/{device_id}",
-            json={"valve": {"target": "open"}},
+        return await self._set_valve(device_id, VALVE_OPEN, timeout)
+
+    async def open_valve_many(
+        self,
+        device_ids: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: Optional[float] = DEFAULT_COMMAND_TIMEOUT,
+        request_timeout: Optional[TimeoutT] = None,
+        verify: bool = False,
+        verify_interval: float = DEFAULT_VERIFY_INTERVAL,
+    ) -> BatchResult:
+        """Open the valves for many devices at once.
+
+        If ``verify`` is set, each device is re-read (every ``verify_interval``
+        seconds) until its valve reports being open; that wait counts against the
+        device's ``timeout`` (without one, it gives up after 30 reads).
+
+        :param device_ids: Unique identifiers for the devices
+        :type device_ids: ``Iterable[str]``
+        :param concurrency: The max number of commands to have in flight at once
+        :type concurrency: ``int``
+        :param timeout: The number of seconds each command may take (``None`` for no
+            limit)
+        :type timeout: ``float``
+        :param request_timeout: A time limit for each request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type request_timeout: ``Union[float, aioflo.transport.Timeout]``
+        :param verify: Wait for each valve to report being open
+        :type verify: ``bool``
+        :param verify_interval: The number of seconds between verification reads
+        :type verify_interval: ``float``
+        :rtype: :meth:`aioflo.batch.BatchResult`
+        """
+        return await self._set_valve_many(
+            device_ids,
+            VALVE_OPEN,
+            concurrency,
+            timeout,
+            request_timeout,
+            verify,
+            verify_interval,
         )
 
-    async def close_valve(self, device_id: str) -> None:
+    async def close_valve(
+        self, device_id: str, *, timeout: Optional[TimeoutT] = None
+    ) -> None:
         """Close the valve for a specific device.
 
         :param device_id: Unique identifier for the device
         :type device_id: ``str``
+        :param timeout: A time limit for the request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
         :rtype: ``dict``
         """
-        return await self._request(
-            "post",
-            f"{API_V2_BASE}/devices/{device_id}",
-            json={"valve": {"target": "closed"}},
+        return await self._set_valve(device_id, VALVE_CLOSED, timeout)
+
+    async def close_valve_many(
+        self,
+        device_ids: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: Optional[float] = DEFAULT_COMMAND_TIMEOUT,
+        request_timeout: Optional[TimeoutT] = None,
+        verify: bool = False,
+        verify_interval: float = DEFAULT_VERIFY_INTERVAL,
+    ) -> BatchResult:
+        """Close the valves for many devices at once.
+
+        If ``verify`` is set, each device is re-read (every ``verify_interval``
+        seconds) until its valve reports being closed; that wait counts against the
+        device's ``timeout`` (without one, it gives up after 30 reads).
+
+        :param device_ids: Unique identifiers for the devices
+        :type device_ids: ``Iterable[str]``
+        :param concurrency: The max number of commands to have in flight at once
+        :type concurrency: ``int``
+        :param timeout: The number of seconds each command may take (``None`` for no
+            limit)
+        :type timeout: ``float``
+        :param request_timeout: A time limit for each request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type request_timeout: ``Union[float, aioflo.transport.Timeout]``
+        :param verify: Wait for each valve to report being closed
+        :type verify: ``bool``
+        :param verify_interval: The number of seconds between verification reads
+        :type verify_interval: ``float``
+        :rtype: :meth:`aioflo.batch.BatchResult`
+        """
+        return await self._set_valve_many(
+            device_ids,
+            VALVE_CLOSED,
+            concurrency,
+            timeout,
+            request_timeout,
+            verify,
+            verify_interval,
         )
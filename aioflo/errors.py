@@ -1,4 +1,5 @@
 """Define package errors."""
+from typing import Optional
 
 
 class FloError(Exception):
@@ -11,3 +12,33 @@ class RequestError(FloError):
     """Define an error related to invalid requests."""
 
     pass
+
+
+class ResponseError(RequestError):
+    """Define an error related to an unsuccessful HTTP response."""
+
+    def __init__(self, message: str, status: int) -> None:
+        """Initialize."""
+        super().__init__(message)
+        self.status = status
+
+
+class RateLimitError(ResponseError):
+    """Define an error related to being rate limited (HTTP 429)."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        """Initialize."""
+        super().__init__(message, 429)
+        self.retry_after = retry_after
+
+
+class TransportError(RequestError):
+    """Define an error related to connecting to (or communicating with) the API."""
+
+    pass
+
+
+class RequestTimeoutError(TransportError):
+    """Define an error related to a request timing out."""
+
+    pass
@@ -0,0 +1,365 @@
+"""Define hooks for instrumenting API requests."""
+from bisect import bisect_left
+from collections import Counter
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from weakref import WeakKeyDictionary
+
+from .util import get_endpoint_template
+
+_LOGGER = logging.getLogger(__name__)
+
+# Latency bucket boundaries (in seconds):
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+
+
+class RequestEvent:  # pylint: disable=too-few-public-methods
+    """Define the details of a single HTTP request.
+
+    An event is created when a request starts and filled in as it completes, so
+    hooks receive the same object at every stage. ``latency`` only covers the HTTP
+    request itself; any time spent waiting for the rate limiter or a concurrency slot
+    is reported separately as ``queued``.
+    """
+
+    __slots__ = (
+        "bytes_received",
+        "bytes_sent",
+        "endpoint",
+        "latency",
+        "method",
+        "queued",
+        "start",
+        "status",
+        "url",
+        "__weakref__",
+    )
+
+    def __init__(self, method: str, url: str, bytes_sent: int = 0) -> None:
+        """Initialize."""
+        self.bytes_received: int = 0
+        self.bytes_sent: int = bytes_sent
+        self.endpoint: str = get_endpoint_template(url)
+        self.latency: Optional[float] = None
+        self.method: str = method.upper()
+        self.queued: float = 0.0
+        self.start: float = time.perf_counter()
+        self.status: Optional[int] = None
+        self.url: str = url
+
+    def __repr__(self) -> str:
+        """Return a compact representation."""
+        return (
+            f"<RequestEvent {self.method} {self.endpoint} status={self.status} "
+            f"latency={self.latency}>"
+        )
+
+    def mark_sent(self) -> None:
+        """Record the time spent queued and restart the latency clock."""
+        now = time.perf_counter()
+        self.queued = now - self.start
+        self.start = now
+
+    def finish(self) -> None:
+        """Record the request's latency."""
+        self.latency = time.perf_counter() - self.start
+
+
+class Instrumentation:
+    """Define a base set of (no-op) instrumentation hooks.
+
+    Subclass this and override any of the hooks, then pass an instance to
+    :meth:`aioflo.api.API` via ``instrumentation``. Hooks are called synchronously
+    from the request path, so they should be quick; exceptions raised by them are
+    logged and otherwise ignored.
+    """
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """Handle an HTTP request starting."""
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        """Handle an HTTP request completing with a response."""
+
+    def on_request_error(self, event: RequestEvent, err: BaseException) -> None:
+        """Handle an HTTP request failing (including HTTP errors and cancellation)."""
+
+    def on_cache_hit(self, method: str, url: str) -> None:
+        """Handle a read being served from the response cache."""
+
+    def on_retry(self, method: str, url: str, attempt: int, delay: float) -> None:
+        """Handle a failed request being scheduled for a retry."""
+
+
+def call_hook(instrumentation: Instrumentation, name: str, *args: Any) -> None:
+    """Call an instrumentation hook, logging (rather than raising) any error."""
+    try:
+        getattr(instrumentation, name)(*args)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception("Error in instrumentation hook %s", name)
+
+
+class _EndpointStats:  # pylint: disable=too-few-public-methods
+    """Define the running statistics for a single endpoint."""
+
+    __slots__ = (
+        "bucket_counts",
+        "bytes_received",
+        "bytes_sent",
+        "count",
+        "errors",
+        "latency_max",
+        "latency_min",
+        "latency_sum",
+        "statuses",
+    )
+
+    def __init__(self, buckets: int) -> None:
+        """Initialize."""
+        self.bucket_counts: List[int] = [0] * (buckets + 1)
+        self.bytes_received: int = 0
+        self.bytes_sent: int = 0
+        self.count: int = 0
+        self.errors: int = 0
+        self.latency_max: float = 0.0
+        self.latency_min: float = float("inf")
+        self.latency_sum: float = 0.0
+        self.statuses: Counter = Counter()
+
+
+class HistogramCollector(Instrumentation):
+    """Define an in-memory collector of per-endpoint request metrics.
+
+    Latencies are counted in fixed buckets (so memory use doesn't grow with the
+    number of requests) and percentiles are estimated from them.
+
+    :param buckets: Latency bucket upper bounds (in seconds), in ascending order
+    :type buckets: ``Sequence[float]``
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """Initialize."""
+        self._buckets: Tuple[float, ...] = tuple(buckets)
+        self._stats: Dict[Tuple[str, str], _EndpointStats] = {}
+
+        self.cache_hits: Counter = Counter()
+        self.retries: Counter = Counter()
+
+    def _record(self, event: RequestEvent) -> _EndpointStats:
+        """Record the common details of a completed request."""
+        key = (event.method, event.endpoint)
+        if (stats := self._stats.get(key)) is None:
+            stats = self._stats[key] = _EndpointStats(len(self._buckets))
+
+        latency = event.latency or 0.0
+        stats.bucket_counts[bisect_left(self._buckets, latency)] += 1
+        stats.bytes_received += event.bytes_received
+        stats.bytes_sent += event.bytes_sent
+        stats.count += 1
+        stats.latency_max = max(stats.latency_max, latency)
+        stats.latency_min = min(stats.latency_min, latency)
+        stats.latency_sum += latency
+        if event.status is not None:
+            stats.statuses[event.status] += 1
+        return stats
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        """Handle an HTTP request completing with a response."""
+        self._record(event)
+
+    def on_request_error(self, event: RequestEvent, err: BaseException) -> None:
+        """Handle an HTTP request failing (including HTTP errors and cancellation)."""
+        self._record(event).errors += 1
+
+    def on_cache_hit(self, method: str, url: str) -> None:
+        """Handle a read being served from the response cache."""
+        self.cache_hits[(method.upper(), get_endpoint_template(url))] += 1
+
+    def on_retry(self, method: str, url: str, attempt: int, delay: float) -> None:
+        """Handle a failed request being scheduled for a retry."""
+        self.retries[(method.upper(), get_endpoint_template(url))] += 1
+
+    def get_percentile(self, method: str, endpoint: str, percentile: float) -> float:
+        """Return an estimated latency percentile (in seconds) for an endpoint.
+
+        The estimate is the upper bound of the bucket the percentile falls into (or
+        the max observed latency for the overflow bucket).
+
+        :param method: An HTTP method (e.g., ``"GET"``)
+        :type method: ``str``
+        :param endpoint: An endpoint template (e.g., ``"devices/{id}"``)
+        :type endpoint: ``str``
+        :param percentile: A percentile between 0 and 100
+        :type percentile: ``float``
+        :rtype: ``float``
+        """
+        stats = self._stats.get((method.upper(), endpoint))
+        if stats is None or not stats.count:
+            return 0.0
+
+        rank = stats.count * percentile / 100
+        seen = 0
+        for idx, bucket_count in enumerate(stats.bucket_counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                if idx == len(self._buckets):
+                    return stats.latency_max
+                return min(self._buckets[idx], stats.latency_max)
+        return stats.latency_max
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the collected metrics, keyed by ``"<METHOD> <endpoint>"``."""
+        keys = set(self._stats) | set(self.cache_hits) | set(self.retries)
+        results = {}
+
+        for method, endpoint in sorted(keys):
+            stats = self._stats.get((method, endpoint))
+            count = stats.count if stats else 0
+            results[f"{method} {endpoint}"] = {
+                "bytes_received": stats.bytes_received if stats else 0,
+                "bytes_sent": stats.bytes_sent if stats else 0,
+                "cache_hits": self.cache_hits[(method, endpoint)],
+                "count": count,
+                "errors": stats.errors if stats else 0,
+                "latency_max": stats.latency_max if stats else 0.0,
+                "latency_mean": stats.latency_sum / count if stats and count else 0.0,
+                "latency_min": stats.latency_min if stats and count else 0.0,
+                "latency_p50": self.get_percentile(method, endpoint, 50),
+                "latency_p95": self.get_percentile(method, endpoint, 95),
+                "latency_p99": self.get_percentile(method, endpoint, 99),
+                "retries": self.retries[(method, endpoint)],
+                "statuses": dict(stats.statuses) if stats else {},
+            }
+
+        return results
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Define an adapter that reports requests to OpenTelemetry.
+
+    Each request gets a client span and is recorded in a duration histogram, along
+    with counters for bytes, cache hits, and retries. If no meter/tracer is provided,
+    the global OpenTelemetry providers are used; if the ``opentelemetry-api`` package
+    isn't installed, every hook is a no-op.
+
+    :param meter: An optional OpenTelemetry ``Meter``
+    :type meter: ``opentelemetry.metrics.Meter``
+    :param tracer: An optional OpenTelemetry ``Tracer``
+    :type tracer: ``opentelemetry.trace.Tracer``
+    """
+
+    def __init__(self, *, meter: Any = None, tracer: Any = None) -> None:
+        """Initialize."""
+        if meter is None or tracer is None:
+            try:
+                # pylint: disable=import-outside-toplevel
+                from opentelemetry import metrics, trace  # type: ignore[import]
+            except ImportError:
+                _LOGGER.debug("OpenTelemetry isn't installed; instrumentation is off")
+            else:
+                meter = meter or metrics.get_meter("aioflo")
+                tracer = tracer or trace.get_tracer("aioflo")
+
+        # Spans are keyed weakly on their events, so a span can't outlive its request
+        # even if it's never finished:
+        self._spans: "WeakKeyDictionary[RequestEvent, Any]" = WeakKeyDictionary()
+        self._tracer: Any = tracer
+        self.enabled: bool = meter is not None or tracer is not None
+
+        self._bytes_received: Any = None
+        self._bytes_sent: Any = None
+        self._cache_hits: Any = None
+        self._duration: Any = None
+        self._retries: Any = None
+
+        if meter is not None:
+            self._bytes_received = meter.create_counter(
+                "aioflo.client.response.size", unit="By"
+            )
+            self._bytes_sent = meter.create_counter(
+                "aioflo.client.request.size", unit="By"
+            )
+            self._cache_hits = meter.create_counter("aioflo.client.cache_hits")
+            self._duration = meter.create_histogram(
+                "aioflo.client.request.duration", unit="s"
+            )
+            self._retries = meter.create_counter("aioflo.client.retries")
+
+    @staticmethod
+    def _get_attributes(event: RequestEvent) -> Dict[str, Any]:
+        """Return the metric/span attributes for a request."""
+        attributes: Dict[str, Any] = {
+            "http.request.method": event.method,
+            "aioflo.endpoint": event.endpoint,
+        }
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        return attributes
+
+    def _finish(self, event: RequestEvent, err: Optional[BaseException] = None) -> None:
+        """Record a completed request."""
+        attributes = self._get_attributes(event)
+
+        if self._duration is not None:
+            self._duration.record(event.latency or 0.0, attributes)
+            self._bytes_received.add(event.bytes_received, attributes)
+            self._bytes_sent.add(event.bytes_sent, attributes)
+
+        if (span := self._spans.pop(event, None)) is not None:
+            span.set_attributes(attributes)
+            if err is not None:
+                span.record_exception(err)
+            span.end()
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """Handle an HTTP request starting."""
+        if self._tracer is not None:
+            self._spans[event] = self._tracer.start_span(
+                f"{event.method} {event.endpoint}",
+                attributes=self._get_attributes(event),
+            )
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        """Handle an HTTP request completing with a response."""
+        self._finish(event)
+
+    def on_request_error(self, event: RequestEvent, err: BaseException) -> None:
+        """Handle an HTTP request failing (including HTTP errors and cancellation)."""
+        self._finish(event, err)
+
+    def on_cache_hit(self, method: str, url: str) -> None:
+        """Handle a read being served from the response cache."""
+        if self._cache_hits is not None:
+            self._cache_hits.add(
+                1,
+                {
+                    "http.request.method": method.upper(),
+                    "aioflo.endpoint": get_endpoint_template(url),
+                },
+            )
+
+    def on_retry(self, method: str, url: str, attempt: int, delay: float) -> None:
+        """Handle a failed request being scheduled for a retry."""
+        if self._retries is not None:
+            self._retries.add(
+                1,
+                {
+                    "http.request.method": method.upper(),
+                    "aioflo.endpoint": get_endpoint_template(url),
+                },
+            )
@@ -1,8 +1,21 @@
 """Define /location endpoints."""
-from typing import Awaitable, Callable, Optional
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
-from .const import API_V2_BASE
-from .util import raise_on_invalid_argument
+from .batch import DEFAULT_COMMAND_TIMEOUT, BatchResult, async_run_batch
+from .const import API_V2_BASE, DEFAULT_CONCURRENCY
+from .errors import FloError
+from .transport import TimeoutT
+from .util import async_iter_bounded, raise_on_invalid_argument
 
 SYSTEM_MODE_AWAY = "away"
 SYSTEM_MODE_HOME = "home"
@@ -23,7 +36,11 @@ class Location:
         self._request: Callable[..., Awaitable] = request
 
     async def _set_system_mode(
-        self, location_id: str, mode: str, additional_payload: Optional[dict] = None
+        self,
+        location_id: str,
+        mode: str,
+        additional_payload: Optional[dict] = None,
+        timeout: Optional[TimeoutT] = None,
     ) -> None:
         """Set the system mode (with optional parameters)."""
         raise_on_invalid_argument(mode, SYSTEM_MODES)
@@ -32,21 +49,74 @@ class Location:
         if additional_payload:
             payload = {**payload, **additional_payload}
         await self._request(
-            "post", f"{API_V2_BASE}/locations/{location_id}/systemMode", json=payload
+            "post",
+            f"{API_V2_BASE}/locations/{location_id}/systemMode",
+            json=payload,
+            # Setting a target mode is safe to repeat:
+            idempotent=True,
+            timeout=timeout,
+        )
+
+    async def _set_system_mode_many(
+        self,
+        location_ids: Iterable[str],
+        mode: str,
+        concurrency: int,
+        timeout: Optional[float],
+        request_timeout: Optional[TimeoutT],
+    ) -> BatchResult:
+        """Set the system mode for many locations."""
+
+        async def set_system_mode(location_id: str) -> None:
+            """Set the system mode for a single location."""
+            await self._set_system_mode(location_id, mode, timeout=request_timeout)
+
+        return await async_run_batch(
+            set_system_mode, location_ids, concurrency=concurrency, timeout=timeout
         )
 
+    @overload
     async def get_info(
         self,
         location_id: str,
-        include_device_info: bool = False,
+        include_device_info: bool = ...,
+        *,
+        raw: Literal[False] = ...,
+        timeout: Optional[TimeoutT] = ...,
     ) -> dict:
+        ...
+
+    @overload
+    async def get_info(
+        self,
+        location_id: str,
+        include_device_info: bool = ...,
+        *,
+        raw: bool = ...,
+        timeout: Optional[TimeoutT] = ...,
+    ) -> Union[dict, bytes]:
+        ...
+
+    async def get_info(
+        self,
+        location_id: str,
+        include_device_info: bool = False,
+        *,
+        raw: bool = False,
+        timeout: Optional[TimeoutT] = None,
+    ) -> Union[dict, bytes]:
         """Return user account data.
 
         :param location_id: A Flo location UUID
         :type location_id: ``str``
         :param include_device_info: Include expanded device information
         :type include_device_info: ``bool``
-        :rtype: ``dict``
+        :param raw: Return the undecoded response body
+        :type raw: ``bool``
+        :param timeout: A time limit for the request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
+        :rtype: ``dict`` (or ``bytes`` if ``raw``)
         """
         additional_info = []
         if include_device_info:
@@ -57,30 +127,133 @@ class Location:
             params["expand"] = ",".join(additional_info)
 
         return await self._request(
-            "get", f"{API_V2_BASE}/locations/{location_id}", params=params
+            "get",
+            f"{API_V2_BASE}/locations/{location_id}",
+            params=params,
+            raw=raw,
+            timeout=timeout,
         )
 
-    async def set_mode_away(self, location_id: str) -> None:
+    async def get_info_many(
+        self,
+        location_ids: Iterable[str],
+        include_device_info: bool = False,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: Optional[TimeoutT] = None,
+    ) -> AsyncIterator[Tuple[str, Union[dict, FloError]]]:
+        """Return data for many locations, as it arrives.
+
+        Yields ``(location_id, result)`` tuples in order of completion, where
+        ``result`` is either the location data or the ``FloError`` raised while
+        fetching it.
+
+        :param location_ids: Flo location UUIDs
+        :type location_ids: ``Iterable[str]``
+        :param include_device_info: Include expanded device information
+        :type include_device_info: ``bool``
+        :param concurrency: The max number of requests to have in flight at once
+        :type concurrency: ``int``
+        :param timeout: A time limit for each request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
+        :rtype: ``AsyncIterator[Tuple[str, Union[dict, FloError]]]``
+        """
+
+        async def get_info(location_id: str) -> dict:
+            """Get info for a single location."""
+            return await self.get_info(
+                location_id, include_device_info, timeout=timeout
+            )
+
+        async for result in async_iter_bounded(get_info, location_ids, concurrency):
+            yield result
+
+    async def set_mode_away(
+        self, location_id: str, *, timeout: Optional[TimeoutT] = None
+    ) -> None:
         """Set the system mode to "Away".
 
         :param location_id: A Flo location UUID
         :type location_id: ``str``
+        :param timeout: A time limit for the request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
         """
-        await self._set_system_mode(location_id, SYSTEM_MODE_AWAY)
+        await self._set_system_mode(location_id, SYSTEM_MODE_AWAY, timeout=timeout)
+
+    async def set_mode_away_many(
+        self,
+        location_ids: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: Optional[float] = DEFAULT_COMMAND_TIMEOUT,
+        request_timeout: Optional[TimeoutT] = None,
+    ) -> BatchResult:
+        """Set the system mode to "Away" for many locations at once.
 
-    async def set_mode_home(self, location_id: str) -> None:
+        :param location_ids: Flo location UUIDs
+        :type location_ids: ``Iterable[str]``
+        :param concurrency: The max number of commands to have in flight at once
+        :type concurrency: ``int``
+        :param timeout: The number of seconds each command may take (``None`` for no
+            limit)
+        :type timeout: ``float``
+        :param request_timeout: A time limit for each request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type request_timeout: ``Union[float, aioflo.transport.Timeout]``
+        :rtype: :meth:`aioflo.batch.BatchResult`
+        """
+        return await self._set_system_mode_many(
+            location_ids, SYSTEM_MODE_AWAY, concurrency, timeout, request_timeout
+        )
+
+    async def set_mode_home(
+        self, location_id: str, *, timeout: Optional[TimeoutT] = None
+    ) -> None:
         """Set the system mode to "Home".
 
         :param location_id: A Flo location UUID
         :type location_id: ``str``
+        :param timeout: A time limit for the request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
         """
-        await self._set_system_mode(location_id, SYSTEM_MODE_HOME)
+        await self._set_system_mode(location_id, SYSTEM_MODE_HOME, timeout=timeout)
+
+    async def set_mode_home_many(
+        self,
+        location_ids: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: Optional[float] = DEFAULT_COMMAND_TIMEOUT,
+        request_timeout: Optional[TimeoutT] = None,
+    ) -> BatchResult:
+        """Set the system mode to "Home" for many locations at once.
+
+        :param location_ids: Flo location UUIDs
+        :type location_ids: ``Iterable[str]``
+        :param concurrency: The max number of commands to have in flight at once
+        :type concurrency: ``int``
+        :param timeout: The number of seconds each command may take (``None`` for no
+            limit)
+        :type timeout: ``float``
+        :param request_timeout: A time limit for each request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type request_timeout: ``Union[float, aioflo.transport.Timeout]``
+        :rtype: :meth:`aioflo.batch.BatchResult`
+        """
+        return await self._set_system_mode_many(
+            location_ids, SYSTEM_MODE_HOME, concurrency, timeout, request_timeout
+        )
 
     async def set_mode_sleep(
         self,
         location_id: str,
         revert_minutes: int,
         revert_mode: Optional[str] = SYSTEM_MODE_HOME,
+        *,
+        timeout: Optional[TimeoutT] = None,
     ) -> None:
         """Set the system mode to "Home".
 
@@ -90,6 +263,9 @@ class Location:
         :type revert_minutes: ``int``
         :param revert_mode: The mode to set after sleep concludes ("away" or "home")
         :type revert_mode: ``str``
+        :param timeout: A time limit for the request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
         """
         raise_on_invalid_argument(revert_minutes, SLEEP_MINUTE_OPTIONS)
         raise_on_invalid_argument(revert_mode, SYSTEM_REVERT_MODES)
@@ -101,4 +277,5 @@ class Location:
                 "revertMinutes": revert_minutes,
                 "revertMode": revert_mode,
             },
+            timeout=timeout,
         )
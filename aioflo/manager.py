@@ -0,0 +1,264 @@
+"""Define an object to manage many Flo accounts at once."""
+import asyncio
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from functools import partial
+import logging
+import random
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
+
+from .api import API, DEFAULT_TOKEN_REFRESH_MARGIN, async_get_api
+from .const import DEFAULT_CONCURRENCY
+from .errors import FloError, RequestError
+from .transport import AiohttpTransport, Transport
+from .util import async_iter_bounded
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aiohttp import ClientSession
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY: int = 50
+DEFAULT_REFRESH_STAGGER: int = 600
+
+
+class FairConcurrencyLimiter:
+    """Define a global concurrency cap that is shared fairly between accounts.
+
+    Requests that have to wait for a slot are queued per account; when a slot frees
+    up, it goes to the next account in round-robin order, so one busy account can't
+    starve the others.
+
+    :param max_concurrency: The max number of requests in flight across all accounts
+    :type max_concurrency: ``int``
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> None:
+        """Initialize."""
+        if max_concurrency < 1:
+            raise RequestError(f"Invalid max concurrency: {max_concurrency}")
+
+        self._available: int = max_concurrency
+        self._waiters: "OrderedDict[Hashable, Deque[asyncio.Future]]" = OrderedDict()
+
+        self.max_concurrency: int = max_concurrency
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of slots currently held."""
+        return self.max_concurrency - self._available
+
+    def _release(self) -> None:
+        """Hand a freed slot to the next waiting account (or return it to the pool)."""
+        while self._waiters:
+            account, waiters = self._waiters.popitem(last=False)
+            future = waiters.popleft()
+            if waiters:
+                # Move the account to the back of the line:
+                self._waiters[account] = waiters
+            if not future.done():
+                future.set_result(None)
+                return
+
+        self._available += 1
+
+    async def _acquire(self, account: Hashable) -> None:
+        """Wait for a slot on behalf of an account."""
+        if self._available > 0 and not self._waiters:
+            self._available -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(account, deque()).append(future)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as we were cancelled; pass it on:
+                self._release()
+            else:
+                waiters = self._waiters.get(account)
+                if waiters is not None and future in waiters:
+                    waiters.remove(future)
+                    if not waiters:
+                        del self._waiters[account]
+            raise
+
+    @asynccontextmanager
+    async def slot(self, account: Hashable) -> AsyncIterator[None]:
+        """Hold a slot on behalf of an account for the duration of the block.
+
+        :param account: A key identifying the account making the request
+        :type account: ``Hashable``
+        """
+        await self._acquire(account)
+        try:
+            yield
+        finally:
+            self._release()
+
+
+class APIManager:
+    """Define an object to manage API objects for many Flo accounts.
+
+    All accounts share a single connection pool and a global concurrency cap (shared
+    fairly between accounts). Each account's background token refresh is staggered
+    by a random amount so that accounts added together don't all refresh at once.
+
+    :param session: An ``aiohttp`` ``ClientSession`` to share between accounts (if
+        not provided, a pooled session owned by this object is created on first use)
+    :type session: ``aiohttp.client.ClientSession``
+    :param transport: An optional transport to share between accounts (if provided,
+        ``session`` is ignored)
+    :type transport: :meth:`aioflo.transport.Transport`
+    :param max_concurrency: The max number of requests in flight across all accounts
+    :type max_concurrency: ``int``
+    :param token_refresh_margin: The minimum number of seconds before an access token
+        expires at which to refresh it in the background
+    :type token_refresh_margin: ``int``
+    :param refresh_stagger: The max number of extra seconds (chosen at random per
+        account) to add to ``token_refresh_margin``
+    :type refresh_stagger: ``int``
+    :param api_kwargs: Additional keyword arguments to pass to each
+        :meth:`aioflo.api.API` (e.g., a shared cache or rate limiter)
+    """
+
+    def __init__(
+        self,
+        *,
+        session: Optional["ClientSession"] = None,
+        transport: Optional[Transport] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        token_refresh_margin: int = DEFAULT_TOKEN_REFRESH_MARGIN,
+        refresh_stagger: int = DEFAULT_REFRESH_STAGGER,
+        **api_kwargs: Any,
+    ) -> None:
+        """Initialize."""
+        self._api_kwargs: Dict[str, Any] = api_kwargs
+        self._apis: Dict[str, API] = {}
+        self._limiter: FairConcurrencyLimiter = FairConcurrencyLimiter(max_concurrency)
+        self._owns_transport: bool = transport is None
+        self._refresh_stagger: int = refresh_stagger
+        self._transport: Transport = transport or AiohttpTransport(session=session)
+        self._token_refresh_margin: int = token_refresh_margin
+
+    def __contains__(self, username: object) -> bool:
+        """Return whether an account is managed."""
+        return username in self._apis
+
+    def __getitem__(self, username: str) -> API:
+        """Return the API object for an account."""
+        return self._apis[username]
+
+    def __len__(self) -> int:
+        """Return the number of managed accounts."""
+        return len(self._apis)
+
+    async def __aenter__(self) -> "APIManager":
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Exit the async context manager."""
+        await self.close()
+
+    @property
+    def usernames(self) -> List[str]:
+        """Return the usernames of all managed accounts."""
+        return list(self._apis)
+
+    async def close(self) -> None:
+        """Close every managed account and release the shared connection pool."""
+        apis = list(self._apis.values())
+        self._apis.clear()
+        await asyncio.gather(*(api.close() for api in apis))
+
+        if self._owns_transport:
+            await self._transport.close()
+
+    async def async_add_account(self, username: str, password: str) -> API:
+        """Authenticate an account and start managing it.
+
+        If the account is already managed, its existing API object is returned.
+
+        :param username: A Flo email address
+        :type username: ``str``
+        :param password: A Flo password
+        :type password: ``str``
+        :rtype: :meth:`aioflo.api.API`
+        """
+        if username in self._apis:
+            return self._apis[username]
+
+        refresh_margin = self._token_refresh_margin + int(
+            random.uniform(0, self._refresh_stagger)
+        )
+        _LOGGER.debug(
+            "Adding account %s (token refresh margin: %ss)", username, refresh_margin
+        )
+
+        api = await async_get_api(
+            username,
+            password,
+            transport=self._transport,
+            token_refresh_margin=refresh_margin,
+            concurrency_slot=partial(self._limiter.slot, username),
+            **self._api_kwargs,
+        )
+
+        # Another caller may have added the same account while we authenticated:
+        if username in self._apis:
+            await api.close()
+            return self._apis[username]
+
+        self._apis[username] = api
+        return api
+
+    async def async_add_accounts(
+        self,
+        credentials: Mapping[str, str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Dict[str, Union[API, FloError]]:
+        """Authenticate and start managing many accounts.
+
+        A ``FloError`` raised while adding an account is returned in place of its API
+        object so that one bad set of credentials doesn't abort the rest.
+
+        :param credentials: A mapping of Flo email addresses to passwords
+        :type credentials: ``Mapping[str, str]``
+        :param concurrency: The max number of accounts to authenticate at once
+        :type concurrency: ``int``
+        :rtype: ``Dict[str, Union[aioflo.api.API, aioflo.errors.FloError]]``
+        """
+        results: Dict[str, Union[API, FloError]] = {}
+        async for username, result in async_iter_bounded(
+            lambda username: self.async_add_account(username, credentials[username]),
+            credentials,
+            concurrency,
+        ):
+            results[username] = result
+        return results
+
+    async def async_remove_account(self, username: str) -> None:
+        """Stop managing an account.
+
+        :param username: A Flo email address
+        :type username: ``str``
+        """
+        api = self._apis.pop(username, None)
+        if api is None:
+            raise FloError(f"Unknown account: {username}")
+        await api.close()
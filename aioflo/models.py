@@ -0,0 +1,378 @@
+"""Define typed, memory-efficient models for API payloads.
+
+Models are optional: endpoint methods still return decoded JSON, which can be turned
+into a model with its ``from_dict`` class method. Each model stores its top-level
+fields in ``__slots__`` and only keeps references to the sub-objects it exposes (the
+rest of the payload can be garbage collected). A device's firmware properties (most
+of its payload) are kept as compact JSON and only decoded when accessed; smaller
+sub-objects are parsed when first accessed.
+"""
+from datetime import datetime
+import json
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+from .util.json import json_loads
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp from the API (if there is one)."""
+    if not value:
+        return None
+    return datetime.fromisoformat(
+        f"{value[:-1]}+00:00" if value.endswith("Z") else value
+    )
+
+
+class _Model:
+    """Define a base slotted model."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        """Return a compact representation."""
+        name = getattr(self, "nickname", None) or getattr(self, "name", None)
+        return f"<{type(self).__name__} id={getattr(self, 'id')!r} name={name!r}>"
+
+
+class Telemetry(_Model):
+    """Define a device's current telemetry readings."""
+
+    __slots__ = ("gpm", "psi", "temp_f", "updated")
+
+    def __init__(
+        self,
+        gpm: Optional[float],
+        psi: Optional[float],
+        temp_f: Optional[float],
+        updated: Optional[datetime],
+    ) -> None:
+        """Initialize."""
+        self.gpm: Optional[float] = gpm
+        self.psi: Optional[float] = psi
+        self.temp_f: Optional[float] = temp_f
+        self.updated: Optional[datetime] = updated
+
+    def __repr__(self) -> str:
+        """Return a compact representation."""
+        return (
+            f"<Telemetry gpm={self.gpm} psi={self.psi} temp_f={self.temp_f} "
+            f"updated={self.updated}>"
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Telemetry":
+        """Create telemetry from a device's ``telemetry`` payload.
+
+        :param data: The payload
+        :type data: ``dict``
+        :rtype: :meth:`aioflo.models.Telemetry`
+        """
+        current = data.get("current", {})
+        return cls(
+            current.get("gpm"),
+            current.get("psi"),
+            current.get("tempF"),
+            _parse_datetime(current.get("updated")),
+        )
+
+
+class DeviceInfo(_Model):
+    """Define a device (as returned by :meth:`aioflo.device.Device.get_info`)."""
+
+    __slots__ = (
+        "_fw_properties",
+        "_last_heard_from_time",
+        "_telemetry",
+        "device_model",
+        "device_type",
+        "fw_version",
+        "id",
+        "is_connected",
+        "is_paired",
+        "location_id",
+        "mac_address",
+        "nickname",
+        "serial_number",
+        "system_mode",
+        "valve_state",
+        "valve_target",
+    )
+
+    _fw_properties: bytes
+    _last_heard_from_time: Any
+    _telemetry: Any
+    device_model: Optional[str]
+    device_type: Optional[str]
+    fw_version: Optional[str]
+    id: str
+    is_connected: Optional[bool]
+    is_paired: Optional[bool]
+    location_id: Optional[str]
+    mac_address: Optional[str]
+    nickname: Optional[str]
+    serial_number: Optional[str]
+    system_mode: Optional[str]
+    valve_state: Optional[str]
+    valve_target: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "DeviceInfo":
+        """Create a device from its payload.
+
+        :param data: The payload
+        :type data: ``dict``
+        :rtype: :meth:`aioflo.models.DeviceInfo`
+        """
+        device = cls.__new__(cls)
+        device.device_model = data.get("deviceModel")
+        device.device_type = data.get("deviceType")
+        device.fw_version = data.get("fwVersion")
+        device.id = data["id"]
+        device.is_connected = data.get("isConnected")
+        device.is_paired = data.get("isPaired")
+        device.location_id = data.get("location", {}).get("id")
+        device.mac_address = data.get("macAddress")
+        device.nickname = data.get("nickname")
+        device.serial_number = data.get("serialNumber")
+        device.system_mode = data.get("systemMode", {}).get("lastKnown")
+        device.valve_state = data.get("valve", {}).get("lastKnown")
+        device.valve_target = data.get("valve", {}).get("target")
+
+        # Firmware properties are most of the payload, so they're kept as compact JSON
+        # (far smaller than the decoded dict) until they're needed:
+        device._fw_properties = json.dumps(
+            data.get("fwProperties", {}), separators=(",", ":")
+        ).encode()
+
+        # These are parsed (and replaced) on first access:
+        device._last_heard_from_time = data.get("lastHeardFromTime")
+        device._telemetry = data.get("telemetry", {})
+        return device
+
+    @property
+    def fw_properties(self) -> Mapping[str, Any]:
+        """Return the (read-only) firmware properties.
+
+        These are decoded on every access (rather than kept around), so hold on to
+        the result when reading several properties.
+        """
+        return MappingProxyType(json_loads(self._fw_properties))
+
+    @property
+    def last_heard_from_time(self) -> Optional[datetime]:
+        """Return when the device was last heard from."""
+        if isinstance(self._last_heard_from_time, str):
+            self._last_heard_from_time = _parse_datetime(self._last_heard_from_time)
+        return self._last_heard_from_time
+
+    @property
+    def telemetry(self) -> Telemetry:
+        """Return the current telemetry readings."""
+        if not isinstance(self._telemetry, Telemetry):
+            self._telemetry = Telemetry.from_dict(self._telemetry)
+        return self._telemetry
+
+
+class LocationInfo(_Model):
+    """Define a location (as returned by :meth:`aioflo.location.Location.get_info`)."""
+
+    __slots__ = (
+        "_devices",
+        "account_id",
+        "address",
+        "city",
+        "country",
+        "device_ids",
+        "gallons_per_day_goal",
+        "id",
+        "nickname",
+        "occupants",
+        "postal_code",
+        "state",
+        "system_mode",
+        "timezone",
+    )
+
+    _devices: Tuple[DeviceInfo, ...]
+    account_id: Optional[str]
+    address: Optional[str]
+    city: Optional[str]
+    country: Optional[str]
+    device_ids: Tuple[str, ...]
+    gallons_per_day_goal: Optional[float]
+    id: str
+    nickname: Optional[str]
+    occupants: Optional[int]
+    postal_code: Optional[str]
+    state: Optional[str]
+    system_mode: Optional[str]
+    timezone: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "LocationInfo":
+        """Create a location from its payload.
+
+        :param data: The payload
+        :type data: ``dict``
+        :rtype: :meth:`aioflo.models.LocationInfo`
+        """
+        location = cls.__new__(cls)
+        location.account_id = data.get("account", {}).get("id")
+        location.address = data.get("address")
+        location.city = data.get("city")
+        location.country = data.get("country")
+        # Devices are converted up front so that their payloads aren't kept around:
+        location._devices = tuple(
+            DeviceInfo.from_dict(device) for device in data.get("devices", [])
+        )
+        location.device_ids = tuple(device.id for device in location._devices)
+        location.gallons_per_day_goal = data.get("gallonsPerDayGoal")
+        location.id = data["id"]
+        location.nickname = data.get("nickname")
+        location.occupants = data.get("occupants")
+        location.postal_code = data.get("postalCode")
+        location.state = data.get("state")
+        location.system_mode = data.get("systemMode", {}).get("target")
+        location.timezone = data.get("timezone")
+        return location
+
+    @property
+    def devices(self) -> Tuple[DeviceInfo, ...]:
+        """Return the location's devices.
+
+        Unless the location was retrieved with ``include_device_info=True``, only
+        each device's ID and MAC address are populated.
+        """
+        return self._devices
+
+
+class UserInfo(_Model):
+    """Define a user (as returned by :meth:`aioflo.user.User.get_info`)."""
+
+    __slots__ = (
+        "_alarm_settings",
+        "account_id",
+        "email",
+        "first_name",
+        "id",
+        "is_active",
+        "last_name",
+        "locale",
+        "location_ids",
+        "phone_mobile",
+        "unit_system",
+    )
+
+    _alarm_settings: Any
+    account_id: Optional[str]
+    email: Optional[str]
+    first_name: Optional[str]
+    id: str
+    is_active: Optional[bool]
+    last_name: Optional[str]
+    locale: Optional[str]
+    location_ids: Tuple[str, ...]
+    phone_mobile: Optional[str]
+    unit_system: Optional[str]
+
+    def __repr__(self) -> str:
+        """Return a compact representation."""
+        return f"<UserInfo id={self.id!r} email={self.email!r}>"
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "UserInfo":
+        """Create a user from its payload.
+
+        :param data: The payload
+        :type data: ``dict``
+        :rtype: :meth:`aioflo.models.UserInfo`
+        """
+        user = cls.__new__(cls)
+        user.account_id = data.get("account", {}).get("id")
+        user.email = data.get("email")
+        user.first_name = data.get("firstName")
+        user.id = data["id"]
+        user.is_active = data.get("isActive")
+        user.last_name = data.get("lastName")
+        user.locale = data.get("locale")
+        user.location_ids = tuple(
+            location["id"] for location in data.get("locations", [])
+        )
+        user.phone_mobile = data.get("phoneMobile")
+        user.unit_system = data.get("unitSystem")
+
+        # These are parsed (and replaced) on first access:
+        user._alarm_settings = data.get("alarmSettings", [])
+        return user
+
+    @property
+    def alarm_settings(self) -> Tuple[Mapping[str, Any], ...]:
+        """Return the (read-only) alarm settings.
+
+        These are only populated if the user was retrieved with
+        ``include_alarm_settings=True``.
+        """
+        if not isinstance(self._alarm_settings, tuple):
+            self._alarm_settings = tuple(
+                MappingProxyType(setting) for setting in self._alarm_settings
+            )
+        return self._alarm_settings
+
+
+class AlarmDefinition(_Model):
+    """Define an alarm (as returned by :meth:`aioflo.alarm.Alarm.get_all`)."""
+
+    __slots__ = (
+        "_user_actions",
+        "active",
+        "description",
+        "display_name",
+        "id",
+        "is_internal",
+        "is_shutoff",
+        "name",
+        "send_when_valve_is_closed",
+        "severity",
+    )
+
+    _user_actions: Mapping[str, Any]
+    active: Optional[bool]
+    description: Optional[str]
+    display_name: Optional[str]
+    id: int
+    is_internal: Optional[bool]
+    is_shutoff: Optional[bool]
+    name: Optional[str]
+    send_when_valve_is_closed: Optional[bool]
+    severity: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "AlarmDefinition":
+        """Create an alarm definition from its payload.
+
+        :param data: The payload (an item of the ``items`` list)
+        :type data: ``dict``
+        :rtype: :meth:`aioflo.models.AlarmDefinition`
+        """
+        alarm = cls.__new__(cls)
+        alarm.active = data.get("active")
+        alarm.description = data.get("description")
+        alarm.display_name = data.get("displayName")
+        alarm.id = data["id"]
+        alarm.is_internal = data.get("isInternal")
+        alarm.is_shutoff = data.get("isShutoff")
+        alarm.name = data.get("name")
+        alarm.send_when_valve_is_closed = data.get("sendWhenValveIsClosed")
+        alarm.severity = data.get("severity")
+
+        # These are parsed (and replaced) on first access:
+        alarm._user_actions = data.get("userActions", {})
+        return alarm
+
+    @property
+    def user_actions(self) -> Mapping[str, Any]:
+        """Return the (read-only) actions a user can take on the alarm."""
+        if not isinstance(self._user_actions, MappingProxyType):
+            self._user_actions = MappingProxyType(self._user_actions)
+        return self._user_actions
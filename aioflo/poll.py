@@ -0,0 +1,314 @@
+"""Define a coordinator to poll endpoints on jittered schedules."""
+import asyncio
+import inspect
+import logging
+import random
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, NamedTuple, Optional
+
+from .errors import FloError, RequestError, RequestTimeoutError
+from .snapshot import Change, SnapshotStore
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_JITTER: float = 0.1
+
+
+class PollUpdate(NamedTuple):
+    """Define the result of a single poll.
+
+    If the coordinator has a snapshot store, ``changes`` lists what changed since the
+    previous successful poll. An unexpected (non-``FloError``) exception raised by a
+    poll is wrapped in a ``FloError`` whose ``__cause__`` is the original.
+    """
+
+    key: Hashable
+    data: Any
+    error: Optional[FloError]
+    changes: Optional[List[Change]] = None
+
+
+UpdateCallback = Callable[[PollUpdate], Any]
+
+
+class PollJob:  # pylint: disable=too-few-public-methods
+    """Define a single scheduled poll.
+
+    :param key: A key identifying the job (e.g., ``("device", device_id)``)
+    :type key: ``Hashable``
+    :param func: A coroutine function (taking no arguments) that performs the poll
+    :type func: ``Callable[[], Awaitable[Any]]``
+    :param interval: The number of seconds between polls
+    :type interval: ``float``
+    :param timeout: The number of seconds each poll may take (``None`` for no limit)
+    :type timeout: ``float``
+    """
+
+    def __init__(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[Any]],
+        interval: float,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize."""
+        if interval <= 0:
+            raise RequestError(f"Invalid poll interval: {interval}")
+
+        self._loop_task: Optional[asyncio.Task] = None
+        self._poll_task: Optional[asyncio.Task] = None
+
+        self.func: Callable[[], Awaitable[Any]] = func
+        self.interval: float = interval
+        self.key: Hashable = key
+        self.polls: int = 0
+        self.skipped: int = 0
+        self.timeout: Optional[float] = timeout
+
+    @property
+    def running(self) -> bool:
+        """Return whether a poll is currently in progress."""
+        return self._poll_task is not None and not self._poll_task.done()
+
+
+class PollCoordinator:
+    """Define an object to poll many endpoints on independent, jittered schedules.
+
+    Each job's first poll happens at a random point within its first interval and each
+    subsequent delay is randomized by ``jitter`` (a fraction of the interval), so jobs
+    with the same interval don't all fire at once. If a job's previous poll is still
+    running when the next one is due, the new poll is skipped rather than overlapped.
+
+    Updates are delivered to registered callbacks (which may be coroutine functions)
+    and to any queues returned by :meth:`subscribe`. If a snapshot store is provided,
+    each update includes what changed since the job's previous poll and polls that
+    changed nothing aren't delivered at all.
+
+    :param jitter: The fraction of each interval by which to randomize poll times
+    :type jitter: ``float``
+    :param snapshot_store: An optional store used to detect changes between polls
+    :type snapshot_store: :meth:`aioflo.snapshot.SnapshotStore`
+    """
+
+    def __init__(
+        self,
+        *,
+        jitter: float = DEFAULT_JITTER,
+        snapshot_store: Optional[SnapshotStore] = None,
+    ) -> None:
+        """Initialize."""
+        if not 0 <= jitter < 1:
+            raise RequestError(f"Invalid jitter: {jitter}")
+
+        self._callbacks: List[UpdateCallback] = []
+        self._jitter: float = jitter
+        self._jobs: Dict[Hashable, PollJob] = {}
+        self._queues: List[asyncio.Queue] = []
+        self._snapshot_store: Optional[SnapshotStore] = snapshot_store
+        self._started: bool = False
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a job is scheduled."""
+        return key in self._jobs
+
+    def __len__(self) -> int:
+        """Return the number of scheduled jobs."""
+        return len(self._jobs)
+
+    async def __aenter__(self) -> "PollCoordinator":
+        """Start polling when entering the async context manager."""
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Stop polling when exiting the async context manager."""
+        await self.stop()
+
+    @property
+    def jobs(self) -> Dict[Hashable, PollJob]:
+        """Return the scheduled jobs, keyed by job key."""
+        return dict(self._jobs)
+
+    def _get_delay(self, interval: float) -> float:
+        """Return a jittered delay for an interval."""
+        return interval * random.uniform(1 - self._jitter, 1 + self._jitter)
+
+    def _start_job(self, job: PollJob) -> None:
+        """Start the scheduling loop for a job."""
+        # pylint: disable=protected-access
+        job._loop_task = asyncio.create_task(self._async_run_job(job))
+
+    async def _async_run_job(self, job: PollJob) -> None:
+        """Trigger polls for a job until it's cancelled."""
+        # pylint: disable=protected-access
+        await asyncio.sleep(random.uniform(0, job.interval))
+
+        while True:
+            if job.running:
+                job.skipped += 1
+                _LOGGER.debug(
+                    "Skipping poll for %s (previous poll still running)", job.key
+                )
+            else:
+                job._poll_task = asyncio.create_task(self._async_poll(job))
+            await asyncio.sleep(self._get_delay(job.interval))
+
+    async def _async_poll(self, job: PollJob) -> None:
+        """Perform a single poll and deliver its result."""
+        job.polls += 1
+        try:
+            # A poll that overruns its deadline is cancelled (and reported as an error)
+            # so that it can't hold up the job's next poll:
+            data = await asyncio.wait_for(job.func(), job.timeout)
+        except asyncio.TimeoutError:
+            err = RequestTimeoutError(
+                f"Poll for {job.key} didn't finish in {job.timeout} seconds"
+            )
+            _LOGGER.debug("Error while polling %s: %s", job.key, err)
+            await self._async_deliver(PollUpdate(job.key, None, err))
+            return
+        except FloError as err:
+            _LOGGER.debug("Error while polling %s: %s", job.key, err)
+            await self._async_deliver(PollUpdate(job.key, None, err))
+            return
+        except Exception as err:  # pylint: disable=broad-except
+            # Anything else (e.g., a bug in the job's parsing) is still reported to
+            # subscribers rather than silently killing the poll:
+            _LOGGER.exception("Unexpected error while polling %s", job.key)
+            flo_err = FloError(f"Unexpected error while polling {job.key}: {err!r}")
+            flo_err.__cause__ = err
+            await self._async_deliver(PollUpdate(job.key, None, flo_err))
+            return
+
+        if self._snapshot_store is None:
+            await self._async_deliver(PollUpdate(job.key, data, None))
+            return
+
+        changes = self._snapshot_store.update(job.key, data)
+        if changes:
+            await self._async_deliver(PollUpdate(job.key, data, None, changes))
+
+    async def _async_deliver(self, update: PollUpdate) -> None:
+        """Deliver an update to all callbacks and queues."""
+        for callback in list(self._callbacks):
+            try:
+                result = callback(update)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error in poll callback for %s", update.key)
+
+        for queue in self._queues:
+            if queue.full():
+                # Slow consumers get the most recent updates:
+                queue.get_nowait()
+            queue.put_nowait(update)
+
+    def add_job(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[Any]],
+        interval: float,
+        *,
+        timeout: Optional[float] = None,
+    ) -> PollJob:
+        """Schedule a poll (replacing any existing job with the same key).
+
+        :param key: A key identifying the job (e.g., ``("device", device_id)``)
+        :type key: ``Hashable``
+        :param func: A coroutine function (taking no arguments) that performs the poll
+        :type func: ``Callable[[], Awaitable[Any]]``
+        :param interval: The number of seconds between polls
+        :type interval: ``float``
+        :param timeout: The number of seconds each poll may take (``None`` for no
+            limit)
+        :type timeout: ``float``
+        :rtype: :meth:`aioflo.poll.PollJob`
+        """
+        self.remove_job(key)
+
+        job = PollJob(key, func, interval, timeout)
+        self._jobs[key] = job
+        if self._started:
+            self._start_job(job)
+        return job
+
+    def add_callback(self, callback: UpdateCallback) -> Callable[[], None]:
+        """Register a callback to receive every update.
+
+        :param callback: A function (or coroutine function) that takes a
+            :meth:`aioflo.poll.PollUpdate`
+        :type callback: ``Callable[[PollUpdate], Any]``
+        :rtype: ``Callable[[], None]``
+        """
+        self._callbacks.append(callback)
+
+        def remove() -> None:
+            """Unregister the callback."""
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+        return remove
+
+    def remove_job(self, key: Hashable) -> None:
+        """Unschedule a poll (cancelling it if in progress).
+
+        :param key: A key identifying the job
+        :type key: ``Hashable``
+        """
+        job = self._jobs.pop(key, None)
+        if job is None:
+            return
+
+        if self._snapshot_store is not None:
+            self._snapshot_store.remove(key)
+
+        # pylint: disable=protected-access
+        for task in (job._loop_task, job._poll_task):
+            if task is not None:
+                task.cancel()
+
+    def subscribe(self, maxsize: int = 0) -> "asyncio.Queue[PollUpdate]":
+        """Return a queue that receives every update.
+
+        If the queue is bounded and full, the oldest update is dropped to make room.
+
+        :param maxsize: The max number of updates to hold (0 for no limit)
+        :type maxsize: ``int``
+        :rtype: ``asyncio.Queue``
+        """
+        queue: "asyncio.Queue[PollUpdate]" = asyncio.Queue(maxsize)
+        self._queues.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: "asyncio.Queue[PollUpdate]") -> None:
+        """Stop delivering updates to a queue.
+
+        :param queue: A queue returned by :meth:`subscribe`
+        :type queue: ``asyncio.Queue``
+        """
+        if queue in self._queues:
+            self._queues.remove(queue)
+
+    def start(self) -> None:
+        """Start polling all scheduled jobs."""
+        if self._started:
+            return
+
+        self._started = True
+        for job in self._jobs.values():
+            self._start_job(job)
+
+    async def stop(self) -> None:
+        """Stop polling and wait for in-progress polls to be cancelled."""
+        self._started = False
+
+        tasks = []
+        for job in self._jobs.values():
+            # pylint: disable=protected-access
+            for task in (job._loop_task, job._poll_task):
+                if task is not None:
+                    task.cancel()
+                    tasks.append(task)
+            job._loop_task = job._poll_task = None
+
+        await asyncio.gather(*tasks, return_exceptions=True)
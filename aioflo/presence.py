@@ -1,7 +1,8 @@
 """Define /presence endpoints."""
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, Optional
 
 from .const import API_V2_BASE
+from .transport import TimeoutT
 
 
 class Presence:  # pylint: disable=too-few-public-methods
@@ -11,6 +12,13 @@ class Presence:  # pylint: disable=too-few-public-methods
         """Initialize."""
         self._request: Callable[..., Awaitable] = request
 
-    async def ping(self) -> dict:
-        """Send a presence ping to Flo."""
-        return await self._request("post", f"{API_V2_BASE}/presence/me")
+    async def ping(self, *, timeout: Optional[TimeoutT] = None) -> dict:
+        """Send a presence ping to Flo.
+
+        :param timeout: A time limit for the request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
+        """
+        return await self._request(
+            "post", f"{API_V2_BASE}/presence/me", timeout=timeout
+        )
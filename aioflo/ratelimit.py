@@ -0,0 +1,132 @@
+"""Define an adaptive, client-side rate limiter."""
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import time
+from typing import Optional
+
+from .errors import FloError
+
+DEFAULT_RATE: float = 10.0
+DEFAULT_MIN_RATE: float = 0.5
+# Without an explicit max rate, the limiter probes up to this multiple of its initial
+# rate:
+DEFAULT_MAX_RATE_FACTOR: float = 4.0
+
+# HTTP statuses that indicate the server wants us to slow down:
+THROTTLE_STATUSES = {429, 503}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return the number of seconds described by a ``Retry-After`` header value."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """Define a token-bucket rate limiter that adapts to throttling.
+
+    Each successful response nudges the allowed rate up (additively) towards
+    ``max_rate``, so the limiter probes for headroom above its initial rate; each
+    throttled response (HTTP 429/503) halves it (down to ``min_rate``) and, if the
+    server sent ``Retry-After``, pauses all requests until then. A single limiter can
+    be shared between API objects.
+
+    :param rate: The initial number of requests allowed per second
+    :type rate: ``float``
+    :param burst: The max number of requests that can be made at once after a lull
+        (defaults to the initial rate)
+    :type burst: ``float``
+    :param min_rate: The lowest rate to back off to
+    :type min_rate: ``float``
+    :param max_rate: The highest rate to increase to (defaults to four times the
+        initial rate)
+    :type max_rate: ``float``
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        *,
+        burst: Optional[float] = None,
+        min_rate: float = DEFAULT_MIN_RATE,
+        max_rate: Optional[float] = None,
+    ) -> None:
+        """Initialize."""
+        if rate <= 0 or min_rate <= 0:
+            raise FloError("Rates must be greater than zero")
+        if max_rate is not None and max_rate < rate:
+            raise FloError("The max rate can't be lower than the initial rate")
+
+        self._burst: float = burst or max(rate, 1.0)
+        self._lock: Optional[asyncio.Lock] = None
+        self._max_rate: float = max_rate or rate * DEFAULT_MAX_RATE_FACTOR
+        self._min_rate: float = min(min_rate, rate)
+        self._paused_until: float = 0.0
+        self._rate: float = rate
+        self._tokens: float = self._burst
+        self._updated: float = time.monotonic()
+
+        # Recover from a halving of the initial rate in roughly 50 successful
+        # requests:
+        self._increase: float = rate / 100
+
+    @property
+    def rate(self) -> float:
+        """Return the number of requests currently allowed per second."""
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill."""
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request is allowed."""
+        # Waiters queue on a lock so that tokens are handed out in FIFO order. The
+        # lock is created lazily so that it's bound to the running event loop:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def on_response(self, status: int, retry_after: Optional[float] = None) -> None:
+        """Adapt the allowed rate to the status of a response."""
+        if status in THROTTLE_STATUSES:
+            now = time.monotonic()
+            self._refill(now)
+            self._rate = max(self._min_rate, self._rate / 2)
+            self._tokens = 0.0
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+        elif status < 400:
+            self._refill(time.monotonic())
+            self._rate = min(self._max_rate, self._rate + self._increase)
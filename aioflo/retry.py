@@ -0,0 +1,78 @@
+"""Define a policy for retrying failed requests."""
+import random
+from typing import Collection, Tuple, Type
+
+from .errors import FloError, RateLimitError, ResponseError, TransportError
+
+DEFAULT_BACKOFF_BASE: float = 0.5
+DEFAULT_BACKOFF_MAX: float = 30.0
+DEFAULT_MAX_ATTEMPTS: int = 3
+DEFAULT_RETRY_EXCEPTIONS: Tuple[Type[FloError], ...] = (TransportError,)
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """Define when and how failed requests are retried.
+
+    Reads (GET requests) are retried whenever they fail with a retryable error;
+    writes are only retried if the endpoint marks them as idempotent (e.g., setting a
+    valve's target state), since repeating them must be harmless. Delays grow
+    exponentially with "full jitter" (a random delay between zero and the backoff),
+    but never undercut a server-provided ``Retry-After``.
+
+    :param max_attempts: The max number of attempts (including the first)
+    :type max_attempts: ``int``
+    :param backoff_base: The backoff (in seconds) before the first retry
+    :type backoff_base: ``float``
+    :param backoff_max: The max backoff (in seconds) between attempts
+    :type backoff_max: ``float``
+    :param jitter: Whether to randomize delays to avoid synchronized retries
+    :type jitter: ``bool``
+    :param retry_statuses: The HTTP statuses that are retryable
+    :type retry_statuses: ``Collection[int]``
+    :param retry_exceptions: The (non-HTTP) errors that are retryable
+    :type retry_exceptions: ``Tuple[Type[FloError], ...]``
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        jitter: bool = True,
+        retry_statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+        retry_exceptions: Tuple[Type[FloError], ...] = DEFAULT_RETRY_EXCEPTIONS,
+    ) -> None:
+        """Initialize."""
+        if max_attempts < 1:
+            raise FloError(f"Invalid max attempts: {max_attempts}")
+
+        self.backoff_base: float = backoff_base
+        self.backoff_max: float = backoff_max
+        self.jitter: bool = jitter
+        self.max_attempts: int = max_attempts
+        self.retry_exceptions: Tuple[Type[FloError], ...] = retry_exceptions
+        self.retry_statuses: Collection[int] = retry_statuses
+
+    def is_retryable(self, err: FloError) -> bool:
+        """Return whether an error is worth retrying."""
+        if isinstance(err, ResponseError):
+            return err.status in self.retry_statuses
+        return isinstance(err, self.retry_exceptions)
+
+    def get_delay(self, attempt: int, err: FloError) -> float:
+        """Return how long to wait (in seconds) before the next attempt.
+
+        :param attempt: The number of the attempt that just failed (starting at 1)
+        :type attempt: ``int``
+        :param err: The error that the attempt failed with
+        :type err: :meth:`aioflo.errors.FloError`
+        :rtype: ``float``
+        """
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)  # nosec
+        if isinstance(err, RateLimitError) and err.retry_after:
+            delay = max(delay, err.retry_after)
+        return delay
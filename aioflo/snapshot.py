@@ -0,0 +1,128 @@
+"""Define a store that reports what changed between response payloads."""
+from typing import Any, Dict, Hashable, List, NamedTuple, Tuple, Union
+
+PathT = Tuple[Union[str, int], ...]
+
+
+class _Missing:  # pylint: disable=too-few-public-methods
+    """Define a marker for a value that doesn't exist on one side of a change."""
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return "MISSING"
+
+
+MISSING: Any = _Missing()
+
+
+class Change(NamedTuple):
+    """Define a single changed value.
+
+    ``old`` is :data:`MISSING` for added values and ``new`` is :data:`MISSING` for
+    removed ones.
+    """
+
+    path: PathT
+    old: Any
+    new: Any
+
+
+def diff(old: Any, new: Any, path: PathT = ()) -> List[Change]:
+    """Return the changed key paths between two decoded JSON payloads.
+
+    Dicts are compared key by key and lists index by index; any other differing value
+    (including a change of type) is reported at its own path. Subtrees are compared
+    with ``==`` (which runs in C and stops at the first difference) before recursing,
+    so unchanged parts of a payload are skipped without being walked.
+
+    :param old: The previous payload
+    :type old: ``Any``
+    :param new: The current payload
+    :type new: ``Any``
+    :param path: The path of the payloads within a larger payload
+    :type path: ``Tuple[Union[str, int], ...]``
+    :rtype: ``List[aioflo.snapshot.Change]``
+    """
+    if old is new or (type(old) is type(new) and old == new):
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = []
+        for key, old_value in old.items():
+            if key in new:
+                changes.extend(diff(old_value, new[key], path + (key,)))
+            else:
+                changes.append(Change(path + (key,), old_value, MISSING))
+        for key, new_value in new.items():
+            if key not in old:
+                changes.append(Change(path + (key,), MISSING, new_value))
+        return changes
+
+    if isinstance(old, list) and isinstance(new, list):
+        changes = []
+        for idx, (old_value, new_value) in enumerate(zip(old, new)):
+            changes.extend(diff(old_value, new_value, path + (idx,)))
+        for idx in range(len(new), len(old)):
+            changes.append(Change(path + (idx,), old[idx], MISSING))
+        for idx in range(len(old), len(new)):
+            changes.append(Change(path + (idx,), MISSING, new[idx]))
+        return changes
+
+    return [Change(path, old, new)]
+
+
+class SnapshotStore:
+    """Define a store of the latest payload per resource.
+
+    Each call to :meth:`update` replaces the stored payload and returns what changed,
+    so consumers can process only the differences between polls. Stored payloads are
+    shared with callers and should be treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._snapshots: Dict[Hashable, Any] = {}
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a snapshot exists for a key."""
+        return key in self._snapshots
+
+    def __len__(self) -> int:
+        """Return the number of stored snapshots."""
+        return len(self._snapshots)
+
+    def get(self, key: Hashable) -> Any:
+        """Return the latest payload for a key (or ``None`` if there isn't one).
+
+        :param key: A key identifying the resource (e.g., ``("device", device_id)``)
+        :type key: ``Hashable``
+        :rtype: ``Any``
+        """
+        return self._snapshots.get(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Forget the payload for a key.
+
+        :param key: A key identifying the resource
+        :type key: ``Hashable``
+        """
+        self._snapshots.pop(key, None)
+
+    def update(self, key: Hashable, data: Any) -> List[Change]:
+        """Store a new payload for a key and return what changed.
+
+        The first payload for a key is reported as a single change at the root path
+        (with an old value of :data:`MISSING`).
+
+        :param key: A key identifying the resource (e.g., ``("device", device_id)``)
+        :type key: ``Hashable``
+        :param data: The new payload
+        :type data: ``Any``
+        :rtype: ``List[aioflo.snapshot.Change]``
+        """
+        old = self._snapshots.get(key, MISSING)
+        self._snapshots[key] = data
+
+        if old is MISSING:
+            return [Change((), MISSING, data)]
+        return diff(old, data)
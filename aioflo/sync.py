@@ -0,0 +1,227 @@
+"""Define helpers to incrementally sync water consumption data."""
+from abc import ABC, abstractmethod
+import asyncio
+from datetime import datetime
+import json
+import os
+import sqlite3
+import threading
+from typing import Callable, Dict, List, Optional, TypeVar
+
+from .transport import TimeoutT
+from .util import raise_on_invalid_argument
+from .water import (
+    INTERVAL_DAILY,
+    INTERVAL_HOURLY,
+    INTERVALS,
+    Water,
+    add_buckets,
+    floor_to_bucket,
+)
+
+ResultT = TypeVar("ResultT")
+
+
+class HighWaterMarkStore(ABC):
+    """Define a base store for high-water marks (one per location and interval).
+
+    Stores whose methods block (e.g., on disk I/O) should set ``blocking`` so that
+    :meth:`ConsumptionSync` calls them in the event loop's default executor; such
+    stores must be safe to call from any thread.
+    """
+
+    blocking: bool = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[datetime]:
+        """Return the high-water mark for a key (if one exists)."""
+
+    @abstractmethod
+    def set(self, key: str, value: datetime) -> None:
+        """Set the high-water mark for a key."""
+
+
+class MemoryStore(HighWaterMarkStore):
+    """Define a store that keeps high-water marks in memory."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._marks: Dict[str, datetime] = {}
+
+    def get(self, key: str) -> Optional[datetime]:
+        """Return the high-water mark for a key (if one exists)."""
+        return self._marks.get(key)
+
+    def set(self, key: str, value: datetime) -> None:
+        """Set the high-water mark for a key."""
+        self._marks[key] = value
+
+
+class JSONFileStore(HighWaterMarkStore):
+    """Define a store that persists high-water marks to a JSON file.
+
+    The file is read when the store is created and rewritten on every ``set``.
+
+    :param path: The path to the JSON file (created if it doesn't exist)
+    :type path: ``str``
+    """
+
+    blocking = True
+
+    def __init__(self, path: str) -> None:
+        """Initialize."""
+        self._lock: threading.Lock = threading.Lock()
+        self._path: str = path
+        self._marks: Dict[str, str] = {}
+
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as fptr:
+                self._marks = json.load(fptr)
+
+    def get(self, key: str) -> Optional[datetime]:
+        """Return the high-water mark for a key (if one exists)."""
+        if (value := self._marks.get(key)) is None:
+            return None
+        return datetime.fromisoformat(value)
+
+    def set(self, key: str, value: datetime) -> None:
+        """Set the high-water mark for a key."""
+        with self._lock:
+            self._marks[key] = value.isoformat()
+
+            # Write to a temporary file first so that a crash can't leave a partial
+            # file:
+            tmp_path = f"{self._path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as fptr:
+                json.dump(self._marks, fptr)
+            os.replace(tmp_path, self._path)
+
+
+class SQLiteStore(HighWaterMarkStore):
+    """Define a store that persists high-water marks to a SQLite database.
+
+    :param path: The path to the database (created if it doesn't exist)
+    :type path: ``str``
+    """
+
+    blocking = True
+
+    def __init__(self, path: str) -> None:
+        """Initialize."""
+        # Calls are serialized by the lock, so the connection can be shared with the
+        # executor's threads:
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock: threading.Lock = threading.Lock()
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS high_water_marks "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def get(self, key: str) -> Optional[datetime]:
+        """Return the high-water mark for a key (if one exists)."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM high_water_marks WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return datetime.fromisoformat(row[0])
+
+    def set(self, key: str, value: datetime) -> None:
+        """Set the high-water mark for a key."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO high_water_marks (key, value) VALUES (?, ?)",
+                (key, value.isoformat()),
+            )
+
+
+class ConsumptionSync:  # pylint: disable=too-few-public-methods
+    """Define an incremental sync of consumption data.
+
+    For each location and interval, the start of the last *complete* bucket is kept as
+    a high-water mark; each sync only requests data after it. The still-open bucket
+    is re-requested (with its updated value) on every sync, so callers should upsert
+    the returned items by ``time``.
+
+    Datetimes are naive and, like those passed to
+    :meth:`aioflo.water.Water.get_consumption_info`, in the location's time zone.
+
+    Calls to a ``blocking`` store (like :meth:`JSONFileStore` and :meth:`SQLiteStore`)
+    are made in the event loop's default executor so that disk I/O doesn't stall the
+    loop.
+
+    :param water: The ``water`` endpoint of an API object
+    :type water: :meth:`aioflo.water.Water`
+    :param store: Where to keep high-water marks (defaults to memory)
+    :type store: :meth:`aioflo.sync.HighWaterMarkStore`
+    """
+
+    def __init__(self, water: Water, store: Optional[HighWaterMarkStore] = None):
+        """Initialize."""
+        self._store: HighWaterMarkStore = store or MemoryStore()
+        self._water: Water = water
+
+    async def async_sync(
+        self,
+        location_id: str,
+        interval: str = INTERVAL_HOURLY,
+        *,
+        now: Optional[datetime] = None,
+        initial_start: Optional[datetime] = None,
+        timeout: Optional[TimeoutT] = None,
+    ) -> List[dict]:
+        """Return consumption items that are new (or still open) since the last sync.
+
+        :param location_id: A Flo location UUID
+        :type location_id: ``str``
+        :param interval: The bucket interval ("1h", "1d", or "1m")
+        :type interval: ``str``
+        :param now: The current datetime (defaults to ``datetime.now()``)
+        :type now: ``datetime.datetime``
+        :param initial_start: Where to start the first sync for a location (defaults
+            to the start of the current day)
+        :type initial_start: ``datetime.datetime``
+        :param timeout: A time limit for each request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
+        :rtype: ``List[dict]``
+        """
+        raise_on_invalid_argument(interval, INTERVALS)
+
+        key = f"{location_id}:{interval}"
+        now = now or datetime.now()
+
+        if high_water_mark := await self._async_call_store(self._store.get, key):
+            start = add_buckets(high_water_mark, interval, 1)
+        elif initial_start:
+            start = initial_start
+        else:
+            start = floor_to_bucket(now, INTERVAL_DAILY)
+
+        if start > now:
+            return []
+
+        response = await self._water.get_consumption_history(
+            location_id, start, now, interval, timeout=timeout
+        )
+
+        # Every bucket before the open one is complete (the API omits buckets without
+        # any consumption, so this is tracked independently of the items returned):
+        last_complete_bucket = add_buckets(floor_to_bucket(now, interval), interval, -1)
+        if last_complete_bucket >= start:
+            await self._async_call_store(self._store.set, key, last_complete_bucket)
+
+        return response["items"]
+
+    async def _async_call_store(self, func: Callable[..., ResultT], *args) -> ResultT:
+        """Call a store method (in the default executor if the store blocks)."""
+        if not self._store.blocking:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
@@ -0,0 +1,200 @@
+"""Define a compact, columnar container for water time-series data."""
+from array import array
+from datetime import datetime, timezone
+import math
+from typing import Any, Dict, Iterable, List, Sequence
+
+from .errors import FloError
+
+CONSUMPTION_FIELDS = ("gallonsConsumed",)
+METRIC_FIELDS = ("averageGpm", "averagePsi", "averageTempF")
+
+RESAMPLE_MEAN = "mean"
+RESAMPLE_SUM = "sum"
+
+
+def parse_timestamp(value: str) -> int:
+    """Convert an ISO 8601 timestamp from the API into epoch seconds.
+
+    Timestamps without a UTC offset are assumed to be in UTC.
+    """
+    if value.endswith("Z"):
+        value = f"{value[:-1]}+00:00"
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+class TimeSeries:
+    """Define a columnar time series backed by typed arrays.
+
+    Timestamps are stored as epoch seconds in an ``array("q")`` and each field as an
+    ``array("d")``, with ``NaN`` standing in for missing (``null``) values. This takes
+    a fraction of the memory of the equivalent list of dicts and can be handed to
+    NumPy without copying.
+    """
+
+    __slots__ = ("columns", "timestamps")
+
+    def __init__(self, timestamps: array, columns: Dict[str, array]) -> None:
+        """Initialize."""
+        for field, column in columns.items():
+            if len(column) != len(timestamps):
+                raise FloError(f"Column {field} doesn't match the number of timestamps")
+
+        self.columns: Dict[str, array] = columns
+        self.timestamps: array = timestamps
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.timestamps)
+
+    def __repr__(self) -> str:
+        """Return a compact representation."""
+        return f"<TimeSeries samples={len(self)} fields={list(self.columns)}>"
+
+    @classmethod
+    def from_items(cls, items: Iterable[dict], fields: Sequence[str]) -> "TimeSeries":
+        """Create a time series from API items (e.g., ``response["items"]``).
+
+        :param items: Items containing a ``time`` key and the requested fields
+        :type items: ``Iterable[dict]``
+        :param fields: The fields to store
+        :type fields: ``Sequence[str]``
+        :rtype: :meth:`aioflo.timeseries.TimeSeries`
+        """
+        timestamps = array("q")
+        columns = {field: array("d") for field in fields}
+
+        for item in items:
+            timestamps.append(parse_timestamp(item["time"]))
+            for field, column in columns.items():
+                value = item.get(field)
+                column.append(math.nan if value is None else value)
+
+        return cls(timestamps, columns)
+
+    @classmethod
+    def from_consumption(cls, response: dict) -> "TimeSeries":
+        """Create a time series from a consumption response.
+
+        :param response: A response from ``Water.get_consumption_info`` (or similar)
+        :type response: ``dict``
+        :rtype: :meth:`aioflo.timeseries.TimeSeries`
+        """
+        return cls.from_items(response.get("items", []), CONSUMPTION_FIELDS)
+
+    @classmethod
+    def from_metrics(cls, response: dict) -> "TimeSeries":
+        """Create a time series from a metrics response.
+
+        :param response: A response from ``Water.get_metrics`` (or similar)
+        :type response: ``dict``
+        :rtype: :meth:`aioflo.timeseries.TimeSeries`
+        """
+        return cls.from_items(response.get("items", []), METRIC_FIELDS)
+
+    def _values(self, field: str) -> List[float]:
+        """Return the non-missing values of a field."""
+        try:
+            column = self.columns[field]
+        except KeyError:
+            raise FloError(f"Unknown field: {field}") from None
+        return [value for value in column if not math.isnan(value)]
+
+    def sum(self, field: str) -> float:
+        """Return the sum of a field (ignoring missing values)."""
+        return math.fsum(self._values(field))
+
+    def mean(self, field: str) -> float:
+        """Return the mean of a field (ignoring missing values)."""
+        values = self._values(field)
+        if not values:
+            return math.nan
+        return math.fsum(values) / len(values)
+
+    def min(self, field: str) -> float:
+        """Return the minimum of a field (ignoring missing values)."""
+        return min(self._values(field), default=math.nan)
+
+    def max(self, field: str) -> float:
+        """Return the maximum of a field (ignoring missing values)."""
+        return max(self._values(field), default=math.nan)
+
+    def resample(
+        self, seconds: int, how: str = RESAMPLE_SUM, *, utc_offset: int = 0
+    ) -> "TimeSeries":
+        """Aggregate samples into larger, fixed-size buckets.
+
+        Buckets are aligned to the epoch in the time zone given by ``utc_offset``
+        (e.g., ``-25200`` to align daily buckets to midnight in UTC-7). Missing values
+        are ignored; a bucket with no values for a field is ``NaN``.
+
+        :param seconds: The bucket size in seconds
+        :type seconds: ``int``
+        :param how: How to aggregate values in a bucket ("sum" or "mean")
+        :type how: ``str``
+        :param utc_offset: The UTC offset (in seconds) to align buckets to
+        :type utc_offset: ``int``
+        :rtype: :meth:`aioflo.timeseries.TimeSeries`
+        """
+        if seconds < 1:
+            raise FloError(f"Invalid bucket size: {seconds}")
+        if how not in (RESAMPLE_MEAN, RESAMPLE_SUM):
+            raise FloError(f"Invalid aggregation: {how}")
+
+        bucket_indexes: Dict[int, int] = {}
+        sums: Dict[str, List[float]] = {field: [] for field in self.columns}
+        counts: Dict[str, List[int]] = {field: [] for field in self.columns}
+        timestamps = array("q")
+
+        for idx, timestamp in enumerate(self.timestamps):
+            bucket = timestamp - (timestamp + utc_offset) % seconds
+            bucket_idx = bucket_indexes.get(bucket)
+            if bucket_idx is None:
+                bucket_idx = bucket_indexes[bucket] = len(timestamps)
+                timestamps.append(bucket)
+                for field in self.columns:
+                    sums[field].append(0.0)
+                    counts[field].append(0)
+
+            for field, column in self.columns.items():
+                value = column[idx]
+                if not math.isnan(value):
+                    sums[field][bucket_idx] += value
+                    counts[field][bucket_idx] += 1
+
+        columns = {}
+        for field in self.columns:
+            columns[field] = array(
+                "d",
+                (
+                    math.nan
+                    if not count
+                    else (total if how == RESAMPLE_SUM else total / count)
+                    for total, count in zip(sums[field], counts[field])
+                ),
+            )
+
+        return TimeSeries(timestamps, columns)
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Return the data as NumPy arrays (without copying).
+
+        The ``time`` key holds epoch seconds; every other key is a field. Requires
+        NumPy to be installed.
+
+        :rtype: ``Dict[str, numpy.ndarray]``
+        """
+        try:
+            import numpy  # pylint: disable=import-outside-toplevel
+        except ImportError as err:
+            raise FloError("NumPy must be installed to use to_numpy()") from err
+
+        arrays: Dict[str, Any] = {
+            "time": numpy.frombuffer(self.timestamps, dtype=numpy.int64)
+        }
+        for field, column in self.columns.items():
+            arrays[field] = numpy.frombuffer(column, dtype=numpy.float64)
+        return arrays
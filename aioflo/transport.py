@@ -0,0 +1,456 @@
+"""Define transports that carry HTTP requests to Flo (or a stand-in for it)."""
+from abc import ABC, abstractmethod
+import asyncio
+from json import dumps, loads
+import random
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .errors import RequestError, RequestTimeoutError, ResponseError, TransportError
+from .util import get_endpoint_template
+
+# aiohttp is only imported once a request is made (or a session created), since
+# importing it is a large part of the package's startup time:
+if TYPE_CHECKING:  # pragma: no cover
+    from aiohttp import ClientSession
+
+DEFAULT_CONNECTION_LIMIT: int = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST: int = 0
+DEFAULT_DNS_CACHE_TTL: int = 300
+DEFAULT_KEEPALIVE_TIMEOUT: float = 30
+DEFAULT_TIMEOUT: int = 10
+
+
+class Timeout(NamedTuple):
+    """Define the time limits (in seconds) for a request.
+
+    ``total`` bounds the whole call (including retries, rate limit waits, and token
+    refreshes), ``connect`` bounds getting a connection, and ``read`` bounds each
+    wait for response data; ``None`` leaves a limit to the transport's default.
+    """
+
+    total: Optional[float] = None
+    connect: Optional[float] = None
+    read: Optional[float] = None
+
+
+TimeoutT = Union[float, Timeout]
+
+
+def get_timeout(timeout: Optional[TimeoutT]) -> Optional[Timeout]:
+    """Return a :meth:`Timeout` for a number of seconds (or a ``Timeout``)."""
+    if timeout is None or isinstance(timeout, Timeout):
+        return timeout
+    return Timeout(total=timeout)
+
+
+class TransportResponse(NamedTuple):
+    """Define an HTTP response returned by a transport."""
+
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+
+
+class Transport(ABC):
+    """Define the interface for sending HTTP requests.
+
+    A transport returns a :meth:`TransportResponse` for every HTTP response (whatever
+    its status) and raises a :meth:`aioflo.errors.TransportError` (or
+    :meth:`aioflo.errors.RequestTimeoutError`) if no response could be obtained.
+    """
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        params: Optional[Mapping[str, Any]] = None,
+        json: Any = None,
+        data: Optional[bytes] = None,
+        timeout: Optional[Timeout] = None,
+    ) -> TransportResponse:
+        """Send an HTTP request and return its response.
+
+        If the request is cancelled, its connection must not be left half-open (or
+        returned to a pool with part of a response unread).
+        """
+
+    async def close(self) -> None:
+        """Release any resources held by the transport."""
+
+
+def create_session(
+    *,
+    connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+    connection_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL,
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+) -> "ClientSession":
+    """Create a ``ClientSession`` with a long-lived connection pool.
+
+    :param connection_limit: The max number of pooled connections (0 for no limit)
+    :type connection_limit: ``int``
+    :param connection_limit_per_host: The max number of pooled connections per host
+        (0 for no limit)
+    :type connection_limit_per_host: ``int``
+    :param dns_cache_ttl: The number of seconds to cache DNS lookups (``None`` to
+        cache forever)
+    :type dns_cache_ttl: ``int``
+    :param keepalive_timeout: The number of seconds to keep idle connections alive
+    :type keepalive_timeout: ``float``
+    :rtype: ``aiohttp.client.ClientSession``
+    """
+    # pylint: disable=import-outside-toplevel
+    from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+    return ClientSession(
+        connector=TCPConnector(
+            limit=connection_limit,
+            limit_per_host=connection_limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=dns_cache_ttl,
+        ),
+        timeout=ClientTimeout(total=DEFAULT_TIMEOUT),
+    )
+
+
+class AiohttpTransport(Transport):
+    """Define a transport that uses ``aiohttp``.
+
+    :param session: An ``aiohttp`` ``ClientSession`` (if not provided, a pooled session
+        owned by this object is created on first use)
+    :type session: ``aiohttp.client.ClientSession``
+    :param connection_limit: The max number of pooled connections (0 for no limit)
+    :type connection_limit: ``int``
+    :param connection_limit_per_host: The max number of pooled connections per host
+        (0 for no limit)
+    :type connection_limit_per_host: ``int``
+    :param dns_cache_ttl: The number of seconds to cache DNS lookups (``None`` to
+        cache forever)
+    :type dns_cache_ttl: ``int``
+    :param keepalive_timeout: The number of seconds to keep idle connections alive
+    :type keepalive_timeout: ``float``
+    """
+
+    def __init__(
+        self,
+        *,
+        session: Optional["ClientSession"] = None,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        connection_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    ) -> None:
+        """Initialize."""
+        self._connection_limit: int = connection_limit
+        self._connection_limit_per_host: int = connection_limit_per_host
+        self._dns_cache_ttl: Optional[int] = dns_cache_ttl
+        self._keepalive_timeout: float = keepalive_timeout
+        self._owned_session: Optional["ClientSession"] = None
+        self._session: Optional["ClientSession"] = session
+
+    def _get_session(self) -> "ClientSession":
+        """Return the session to use, creating a pooled one if needed.
+
+        A session passed in by the caller is always preferred; otherwise, the
+        transport lazily creates (and owns) a single long-lived session so that
+        connections are kept alive and reused across requests.
+        """
+        if self._session and not self._session.closed:
+            return self._session
+
+        if not self._owned_session or self._owned_session.closed:
+            self._owned_session = create_session(
+                connection_limit=self._connection_limit,
+                connection_limit_per_host=self._connection_limit_per_host,
+                dns_cache_ttl=self._dns_cache_ttl,
+                keepalive_timeout=self._keepalive_timeout,
+            )
+
+        return self._owned_session
+
+    async def close(self) -> None:
+        """Close the connection pool owned by this object (if any).
+
+        Sessions passed in by the caller are left untouched.
+        """
+        if self._owned_session and not self._owned_session.closed:
+            await self._owned_session.close()
+        self._owned_session = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        params: Optional[Mapping[str, Any]] = None,
+        json: Any = None,
+        data: Optional[bytes] = None,
+        timeout: Optional[Timeout] = None,
+    ) -> TransportResponse:
+        """Send an HTTP request and return its response."""
+        # pylint: disable=import-outside-toplevel
+        from aiohttp import (
+            ClientConnectionError,
+            ClientError,
+            ClientPayloadError,
+            ClientResponseError,
+            ClientTimeout,
+        )
+
+        session = self._get_session()
+
+        client_timeout = session.timeout
+        if timeout is not None:
+            # Limits that aren't set fall back to the session's:
+            client_timeout = ClientTimeout(
+                total=client_timeout.total if timeout.total is None else timeout.total,
+                connect=(
+                    client_timeout.connect
+                    if timeout.connect is None
+                    else timeout.connect
+                ),
+                sock_connect=client_timeout.sock_connect,
+                sock_read=(
+                    client_timeout.sock_read if timeout.read is None else timeout.read
+                ),
+            )
+
+        try:
+            async with session.request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                json=json,
+                data=data,
+                timeout=client_timeout,
+            ) as resp:
+                try:
+                    body = await resp.read()
+                except BaseException:
+                    # Never hand a connection with part of a response unread back to
+                    # the pool:
+                    resp.close()
+                    raise
+                return TransportResponse(resp.status, resp.headers, body)
+        except ClientResponseError as err:
+            raise ResponseError(
+                f"There was an error while requesting {url}", err.status
+            ) from err
+        except asyncio.TimeoutError as err:
+            # This comes first since aiohttp's socket timeouts are also connection
+            # errors:
+            raise RequestTimeoutError(f"Timed out while requesting {url}") from err
+        except (ClientConnectionError, ClientPayloadError) as err:
+            raise TransportError(f"Unable to communicate with {url}") from err
+        except ClientError as err:
+            raise RequestError(f"There was an error while requesting {url}") from err
+
+
+class FakeRequest(NamedTuple):
+    """Define a request received by a :meth:`FakeTransport`."""
+
+    method: str
+    url: str
+    endpoint: str
+    headers: Mapping[str, str]
+    params: Optional[Mapping[str, Any]]
+    json: Any
+
+
+FakeHandler = Callable[[FakeRequest], TransportResponse]
+
+
+def _get_headers(headers: Optional[Mapping[str, str]] = None) -> Mapping[str, str]:
+    """Return case-insensitive response headers (like aiohttp's)."""
+    from multidict import CIMultiDict  # pylint: disable=import-outside-toplevel
+
+    return CIMultiDict(headers or {})
+
+
+def _to_body(payload: Union[bytes, str, Any]) -> bytes:
+    """Convert a route's payload into a response body."""
+    if isinstance(payload, bytes):
+        return payload
+    if isinstance(payload, str):
+        return payload.encode()
+    return dumps(payload).encode()
+
+
+class FakeTransport(Transport):
+    """Define an in-process transport that serves canned responses.
+
+    Routes are matched on method and endpoint template (e.g., ``devices/{id}``), so
+    a single fixture can stand in for any number of devices. Latency, jitter, and
+    failures can be injected to simulate a real network. Unmatched requests get an
+    HTTP 404.
+
+    :param latency: The mean number of seconds each request takes
+    :type latency: ``float``
+    :param jitter: The max number of seconds to randomly add to or subtract from the
+        latency
+    :type jitter: ``float``
+    :param error_rate: The fraction of requests that get an HTTP ``error_status``
+    :type error_rate: ``float``
+    :param error_status: The HTTP status to inject
+    :type error_status: ``int``
+    :param drop_rate: The fraction of requests that fail with a transport error
+    :type drop_rate: ``float``
+    :param seed: An optional seed for reproducible latency and failures
+    :type seed: ``int``
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        drop_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Initialize."""
+        self._drop_rate: float = drop_rate
+        self._error_rate: float = error_rate
+        self._error_status: int = error_status
+        self._jitter: float = jitter
+        self._latency: float = latency
+        self._random: random.Random = random.Random(seed)
+        self._routes: Dict[Tuple[str, str], FakeHandler] = {}
+
+        self.requests: int = 0
+
+    def add_route(
+        self,
+        method: str,
+        endpoint: str,
+        response: Union[bytes, str, Any, FakeHandler],
+        *,
+        status: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """Serve a response for an endpoint.
+
+        :param method: An HTTP method
+        :type method: ``str``
+        :param endpoint: An endpoint template (e.g., ``"devices/{id}"``)
+        :type endpoint: ``str``
+        :param response: A body (bytes, text, or JSON-serializable data) or a function
+            that takes a :meth:`FakeRequest` and returns a :meth:`TransportResponse`
+        :type response: ``Union[bytes, str, Any, Callable]``
+        :param status: The HTTP status to respond with (for non-function responses)
+        :type status: ``int``
+        :param headers: Headers to respond with (for non-function responses); if
+            these include an ``ETag``, matching conditional requests get HTTP 304
+        :type headers: ``Mapping[str, str]``
+        """
+        if callable(response):
+            handler = response
+        else:
+            canned = TransportResponse(
+                status, _get_headers(headers), _to_body(response)
+            )
+            not_modified = TransportResponse(304, canned.headers, b"")
+            etag = canned.headers.get("ETag")
+
+            def handler(request: FakeRequest) -> TransportResponse:
+                """Return the canned response (honoring ``If-None-Match``)."""
+                if etag and request.headers.get("If-None-Match") == etag:
+                    return not_modified
+                return canned
+
+        self._routes[(method.lower(), endpoint)] = handler
+
+    def add_auth_route(
+        self, *, token: str = "fake-token", expires_in: int = 86400
+    ) -> None:
+        """Serve successful authentication responses.
+
+        :param token: The access token to hand out
+        :type token: ``str``
+        :param expires_in: The number of seconds until the token expires
+        :type expires_in: ``int``
+        """
+
+        def handler(request: FakeRequest) -> TransportResponse:
+            """Return a token that is valid from now."""
+            now = round(time.time())
+            return TransportResponse(
+                200,
+                _get_headers(),
+                _to_body(
+                    {
+                        "token": token,
+                        "tokenPayload": {
+                            "user": {
+                                "user_id": "fake-user",
+                                "email": (request.json or {}).get("username"),
+                            },
+                            "timestamp": now,
+                        },
+                        "tokenExpiration": expires_in,
+                        "timeNow": now,
+                    }
+                ),
+            )
+
+        self.add_route("post", "users/auth", handler)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        params: Optional[Mapping[str, Any]] = None,
+        json: Any = None,
+        data: Optional[bytes] = None,
+        timeout: Optional[Timeout] = None,
+    ) -> TransportResponse:
+        """Send an HTTP request and return its response."""
+        self.requests += 1
+
+        delay = self._latency + self._random.uniform(-self._jitter, self._jitter)
+        if timeout is not None:
+            # Simulated latency is spent waiting for the response, so it counts
+            # against both the total and read limits:
+            limits = [
+                limit for limit in (timeout.total, timeout.read) if limit is not None
+            ]
+            if limits and delay > min(limits):
+                await asyncio.sleep(min(limits))
+                raise RequestTimeoutError(f"Timed out while requesting {url}")
+        await asyncio.sleep(max(0.0, delay))
+
+        if self._drop_rate and self._random.random() < self._drop_rate:
+            raise TransportError(f"Unable to communicate with {url}")
+        if self._error_rate and self._random.random() < self._error_rate:
+            return TransportResponse(self._error_status, _get_headers(), b"")
+
+        if json is None and data:
+            json = loads(data)
+
+        endpoint = get_endpoint_template(url)
+        handler = self._routes.get((method.lower(), endpoint))
+        if handler is None:
+            return TransportResponse(404, _get_headers(), b"")
+
+        return handler(
+            FakeRequest(method.upper(), url, endpoint, headers, params, json)
+        )
@@ -1,7 +1,8 @@
 """Define /user endpoints."""
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, Literal, Optional, Union, overload
 
 from .const import API_V2_BASE
+from .transport import TimeoutT
 
 
 class User:  # pylint: disable=too-few-public-methods
@@ -12,16 +13,48 @@ class User:  # pylint: disable=too-few-public-methods
         self._request: Callable[..., Awaitable] = request
         self._user_id: str = user_id
 
+    @overload
     async def get_info(
-        self, include_alarm_settings: bool = False, include_location_info: bool = False
+        self,
+        include_alarm_settings: bool = ...,
+        include_location_info: bool = ...,
+        *,
+        raw: Literal[False] = ...,
+        timeout: Optional[TimeoutT] = ...,
     ) -> dict:
+        ...
+
+    @overload
+    async def get_info(
+        self,
+        include_alarm_settings: bool = ...,
+        include_location_info: bool = ...,
+        *,
+        raw: bool = ...,
+        timeout: Optional[TimeoutT] = ...,
+    ) -> Union[dict, bytes]:
+        ...
+
+    async def get_info(
+        self,
+        include_alarm_settings: bool = False,
+        include_location_info: bool = False,
+        *,
+        raw: bool = False,
+        timeout: Optional[TimeoutT] = None,
+    ) -> Union[dict, bytes]:
         """Return user account data.
 
         :param include_alarm_settings: Include expanded alarm information
         :type include_alarm_settings: ``bool``
         :param include_location_info: Include expanded location info
         :type include_location_info: ``bool``
-        :rtype: ``dict``
+        :param raw: Return the undecoded response body
+        :type raw: ``bool``
+        :param timeout: A time limit for the request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
+        :rtype: ``dict`` (or ``bytes`` if ``raw``)
         """
         additional_info = []
         if include_alarm_settings:
@@ -34,5 +67,9 @@ class User:  # pylint: disable=too-few-public-methods
             params["expand"] = ",".join(additional_info)
 
         return await self._request(
-            "get", f"{API_V2_BASE}/users/{self._user_id}", params=params
+            "get",
+            f"{API_V2_BASE}/users/{self._user_id}",
+            params=params,
+            raw=raw,
+            timeout=timeout,
         )
@@ -1,5 +1,73 @@
 """Define general utilities."""
-from ..errors import RequestError
+import asyncio
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlsplit
+
+from ..errors import FloError, RequestError
+
+# Path segments that are followed by a resource ID (e.g., /devices/<device_id>):
+RESOURCE_COLLECTIONS = {"devices", "locations", "users"}
+# Path segments that would otherwise look like resource IDs:
+NON_ID_SEGMENTS = {"auth"}
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ResultT = TypeVar("ResultT")
+
+
+def _get_path_segments(url: str) -> List[str]:
+    """Return the path segments of a URL, minus any "/api/vX" prefix."""
+    segments = urlsplit(url).path.strip("/").split("/")
+    if len(segments) >= 2 and segments[0] == "api":
+        return segments[2:]
+    return segments
+
+
+def get_endpoint_template(url: str) -> str:
+    """Return the endpoint template for a URL (e.g., ``devices/{id}/healthTest/run``).
+
+    Resource IDs are replaced with ``{id}`` so that requests to the same endpoint can
+    be grouped together.
+    """
+    segments = _get_path_segments(url)
+    for idx in range(1, len(segments)):
+        if (
+            segments[idx - 1] in RESOURCE_COLLECTIONS
+            and segments[idx] not in NON_ID_SEGMENTS
+        ):
+            segments[idx] = "{id}"
+    return "/".join(segments)
+
+
+def get_request_key(method: str, url: str, params: Optional[dict] = None) -> Hashable:
+    """Return a hashable key that uniquely identifies a request."""
+    return (
+        method.lower(),
+        url,
+        tuple(sorted((params or {}).items())),
+    )
+
+
+def get_resource(url: str) -> Optional[str]:
+    """Return the resource (e.g., ``devices/<device_id>``) that a URL refers to."""
+    segments = _get_path_segments(url)
+    if (
+        len(segments) >= 2
+        and segments[0] in RESOURCE_COLLECTIONS
+        and segments[1] not in NON_ID_SEGMENTS
+    ):
+        return "/".join(segments[:2])
+    return None
 
 
 def raise_on_invalid_argument(value, options):
@@ -8,3 +76,39 @@ def raise_on_invalid_argument(value, options):
         raise RequestError(
             f"Invalid keyword argument: {value} (valid options: {options})"
         )
+
+
+async def async_iter_bounded(
+    func: Callable[[KeyT], Awaitable[ResultT]],
+    keys: Iterable[KeyT],
+    concurrency: int,
+) -> AsyncIterator[Tuple[KeyT, Union[ResultT, FloError]]]:
+    """Run a coroutine function for many keys with bounded concurrency.
+
+    Results are yielded as ``(key, result)`` tuples in order of completion. A
+    ``FloError`` raised for a key is yielded in place of its result so that one
+    failure doesn't abort the rest of the batch. If the consumer stops iterating
+    early, all outstanding work is cancelled.
+    """
+    if concurrency < 1:
+        raise RequestError(f"Invalid concurrency: {concurrency}")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(key: KeyT) -> Tuple[KeyT, Union[ResultT, FloError]]:
+        """Run the coroutine function for a single key."""
+        async with semaphore:
+            try:
+                return key, await func(key)
+            except FloError as err:
+                return key, err
+
+    tasks = [asyncio.create_task(run(key)) for key in keys]
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
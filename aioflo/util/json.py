@@ -0,0 +1,29 @@
+"""Define JSON decoding utilities."""
+import json
+from typing import Any, Callable, Tuple, Union
+
+JSONLoads = Callable[[Union[bytes, str]], Any]
+
+
+def _get_fastest_loads() -> Tuple[str, JSONLoads]:
+    """Return the fastest available JSON decoder (and the name of its library)."""
+    try:
+        import orjson  # type: ignore[import]  # pylint: disable=import-outside-toplevel
+
+        return "orjson", orjson.loads  # pylint: disable=no-member
+    except ImportError:
+        pass
+
+    try:
+        import ujson  # type: ignore[import]  # pylint: disable=import-outside-toplevel
+
+        return "ujson", ujson.loads
+    except ImportError:
+        pass
+
+    return "json", json.loads
+
+
+# orjson or ujson are used automatically when installed; both (like the standard
+# library) raise a ValueError subclass on invalid input:
+JSON_LOADS_LIBRARY, json_loads = _get_fastest_loads()
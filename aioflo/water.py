@@ -1,15 +1,128 @@
 """Define /water endpoints."""
-from datetime import datetime
-from typing import Awaitable, Callable
+from datetime import datetime, timedelta
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
-from .const import API_V2_BASE
-from .util import raise_on_invalid_argument
+from .const import API_V2_BASE, DEFAULT_CONCURRENCY
+from .errors import FloError, RequestError
+from .transport import TimeoutT
+from .util import async_iter_bounded, raise_on_invalid_argument
 
 INTERVAL_DAILY = "1d"
 INTERVAL_HOURLY = "1h"
 INTERVAL_MONTHLY = "1m"
 INTERVALS = {INTERVAL_DAILY, INTERVAL_HOURLY, INTERVAL_MONTHLY}
 
+# The default number of buckets to request per chunk when fetching long ranges:
+DEFAULT_CHUNK_SIZES = {
+    INTERVAL_DAILY: 90,
+    INTERVAL_HOURLY: 168,
+    INTERVAL_MONTHLY: 12,
+}
+
+
+def floor_to_bucket(value: datetime, interval: str) -> datetime:
+    """Return the start of the bucket that a datetime falls in."""
+    if interval == INTERVAL_HOURLY:
+        return value.replace(minute=0, second=0, microsecond=0)
+    if interval == INTERVAL_DAILY:
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_buckets(value: datetime, interval: str, count: int) -> datetime:
+    """Return a datetime advanced by a number of buckets."""
+    if interval == INTERVAL_HOURLY:
+        return value + timedelta(hours=count)
+    if interval == INTERVAL_DAILY:
+        return value + timedelta(days=count)
+    month_index = value.month - 1 + count
+    return value.replace(
+        year=value.year + month_index // 12, month=month_index % 12 + 1
+    )
+
+
+def split_range(
+    start: datetime, end: datetime, interval: str, chunk_size: Optional[int] = None
+) -> List[Tuple[datetime, datetime]]:
+    """Split a datetime range into consecutive chunks of whole buckets.
+
+    Chunk boundaries are aligned to bucket boundaries so that no bucket is split
+    between two chunks; each chunk ends 1 millisecond before the next one starts
+    (mirroring the ``23:59:59.999`` end-of-range convention used by the Flo app).
+
+    :param start: The start datetime of the range
+    :type start: ``datetime.datetime``
+    :param end: The end datetime of the range
+    :type end: ``datetime.datetime``
+    :param interval: The bucket interval ("1h", "1d", or "1m")
+    :type interval: ``str``
+    :param chunk_size: The number of buckets per chunk (defaults per interval)
+    :type chunk_size: ``int``
+    :rtype: ``List[Tuple[datetime.datetime, datetime.datetime]]``
+    """
+    raise_on_invalid_argument(interval, INTERVALS)
+
+    if chunk_size is None:
+        chunk_size = DEFAULT_CHUNK_SIZES[interval]
+    if chunk_size < 1:
+        raise RequestError(f"Invalid chunk size: {chunk_size}")
+
+    chunks = []
+    bucket_start = floor_to_bucket(start, interval)
+    chunk_start = start
+    chunk_number = 1
+
+    while chunk_start <= end:
+        next_start = add_buckets(bucket_start, interval, chunk_size * chunk_number)
+        chunks.append((chunk_start, min(end, next_start - timedelta(milliseconds=1))))
+        chunk_start = next_start
+        chunk_number += 1
+
+    return chunks
+
+
+def merge_responses(responses: List[dict]) -> dict:
+    """Merge chronologically ordered chunk responses into a single response.
+
+    Items are de-duplicated by ``time`` (the first occurrence wins) and, for
+    consumption data, ``aggregations.sumTotalGallonsConsumed`` is recomputed.
+    """
+    items = []
+    seen_times = set()
+    for response in responses:
+        for item in response.get("items", []):
+            if item["time"] in seen_times:
+                continue
+            seen_times.add(item["time"])
+            items.append(item)
+
+    merged: dict = {"items": items}
+
+    if responses and "params" in responses[0]:
+        merged["params"] = {**responses[0]["params"]}
+        if "endDate" in responses[-1].get("params", {}):
+            merged["params"]["endDate"] = responses[-1]["params"]["endDate"]
+
+    if any("aggregations" in response for response in responses):
+        merged["aggregations"] = {
+            "sumTotalGallonsConsumed": round(
+                sum(item.get("gallonsConsumed") or 0 for item in items), 3
+            )
+        }
+
+    return merged
+
 
 class Water:  # pylint: disable=too-few-public-methods
     """Define an object to handle the endpoints."""
@@ -18,13 +131,68 @@ class Water:  # pylint: disable=too-few-public-methods
         """Initialize."""
         self._request: Callable[..., Awaitable] = request
 
+    async def _async_get_history(
+        self,
+        func: Callable[[datetime, datetime], Awaitable[dict]],
+        start: datetime,
+        end: datetime,
+        interval: str,
+        chunk_size: Optional[int],
+        concurrency: int,
+    ) -> dict:
+        """Fetch a long range in concurrent chunks and merge the results."""
+        chunks = split_range(start, end, interval, chunk_size)
+        responses: Dict[int, dict] = {}
+
+        async def get_chunk(index: int) -> dict:
+            """Get the data for a single chunk."""
+            return await func(*chunks[index])
+
+        async for index, result in async_iter_bounded(
+            get_chunk, range(len(chunks)), concurrency
+        ):
+            if isinstance(result, FloError):
+                raise result
+            responses[index] = result
+
+        return merge_responses([responses[index] for index in range(len(chunks))])
+
+    @overload
     async def get_consumption_info(
         self,
         location_id: str,
         start: datetime,
         end: datetime,
-        interval: str = INTERVAL_HOURLY,
+        interval: str = ...,
+        *,
+        raw: Literal[False] = ...,
+        timeout: Optional[TimeoutT] = ...,
     ) -> dict:
+        ...
+
+    @overload
+    async def get_consumption_info(
+        self,
+        location_id: str,
+        start: datetime,
+        end: datetime,
+        interval: str = ...,
+        *,
+        raw: bool = ...,
+        timeout: Optional[TimeoutT] = ...,
+    ) -> Union[dict, bytes]:
+        ...
+
+    async def get_consumption_info(
+        self,
+        location_id: str,
+        start: datetime,
+        end: datetime,
+        interval: str = INTERVAL_HOURLY,
+        *,
+        raw: bool = False,
+        timeout: Optional[TimeoutT] = None,
+    ) -> Union[dict, bytes]:
         """Return user account data.
 
         :param location_id: A Flo location UUID
@@ -33,7 +201,12 @@ class Water:  # pylint: disable=too-few-public-methods
         :type start: ``datetime.datetime``
         :param end: The end datetime of the range to examine
         :type end: ``datetime.datetime``
-        :rtype: ``dict``
+        :param raw: Return the undecoded response body
+        :type raw: ``bool``
+        :param timeout: A time limit for the request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
+        :rtype: ``dict`` (or ``bytes`` if ``raw``)
         """
         raise_on_invalid_argument(interval, INTERVALS)
 
@@ -46,22 +219,99 @@ class Water:  # pylint: disable=too-few-public-methods
                 "locationId": location_id,
                 "startDate": start.isoformat(),
             },
+            raw=raw,
+            timeout=timeout,
+        )
+
+    async def get_consumption_history(
+        self,
+        location_id: str,
+        start: datetime,
+        end: datetime,
+        interval: str = INTERVAL_HOURLY,
+        *,
+        chunk_size: Optional[int] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: Optional[TimeoutT] = None,
+    ) -> dict:
+        """Return consumption data for a long range, fetched in concurrent chunks.
+
+        The response has the same shape as :meth:`get_consumption_info`.
+
+        :param location_id: A Flo location UUID
+        :type location_id: ``str``
+        :param start: The start datetime of the range to examine
+        :type start: ``datetime.datetime``
+        :param end: The end datetime of the range to examine
+        :type end: ``datetime.datetime``
+        :param chunk_size: The number of buckets to request at once
+        :type chunk_size: ``int``
+        :param concurrency: The max number of requests to have in flight at once
+        :type concurrency: ``int``
+        :param timeout: A time limit for each request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
+        :rtype: ``dict``
+        """
+
+        async def get_chunk(chunk_start: datetime, chunk_end: datetime) -> dict:
+            """Get consumption data for a single chunk."""
+            return await self.get_consumption_info(
+                location_id, chunk_start, chunk_end, interval, timeout=timeout
+            )
+
+        return await self._async_get_history(
+            get_chunk, start, end, interval, chunk_size, concurrency
         )
 
+    @overload
     async def get_metrics(
         self,
         device_mac_address: str,
         start: datetime,
         end: datetime,
-        interval: str = INTERVAL_HOURLY,
+        interval: str = ...,
+        *,
+        raw: Literal[False] = ...,
+        timeout: Optional[TimeoutT] = ...,
     ) -> dict:
+        ...
+
+    @overload
+    async def get_metrics(
+        self,
+        device_mac_address: str,
+        start: datetime,
+        end: datetime,
+        interval: str = ...,
+        *,
+        raw: bool = ...,
+        timeout: Optional[TimeoutT] = ...,
+    ) -> Union[dict, bytes]:
+        ...
+
+    async def get_metrics(
+        self,
+        device_mac_address: str,
+        start: datetime,
+        end: datetime,
+        interval: str = INTERVAL_HOURLY,
+        *,
+        raw: bool = False,
+        timeout: Optional[TimeoutT] = None,
+    ) -> Union[dict, bytes]:
         """Return user account data.
 
         :param start: The start datetime of the range to examine
         :type start: ``datetime.datetime``
         :param end: The end datetime of the range to examine
         :type end: ``datetime.datetime``
-        :rtype: ``dict``
+        :param raw: Return the undecoded response body
+        :type raw: ``bool``
+        :param timeout: A time limit for the request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
+        :rtype: ``dict`` (or ``bytes`` if ``raw``)
         """
         raise_on_invalid_argument(interval, INTERVALS)
 
@@ -74,4 +324,90 @@ class Water:  # pylint: disable=too-few-public-methods
                 "macAddress": device_mac_address.replace(":", ""),
                 "startDate": start.isoformat(),
             },
+            raw=raw,
+            timeout=timeout,
+        )
+
+    async def iter_metrics(
+        self,
+        device_mac_address: str,
+        start: datetime,
+        end: datetime,
+        interval: str = INTERVAL_HOURLY,
+        *,
+        chunk_size: Optional[int] = None,
+        timeout: Optional[TimeoutT] = None,
+    ) -> AsyncIterator[dict]:
+        """Yield device metric items for a range, one chunk at a time.
+
+        Only a single chunk is requested (and held in memory) at once, so arbitrarily
+        long ranges can be consumed with bounded memory. Items are yielded in
+        chronological order and de-duplicated by ``time``.
+
+        :param device_mac_address: The MAC address of the device
+        :type device_mac_address: ``str``
+        :param start: The start datetime of the range to examine
+        :type start: ``datetime.datetime``
+        :param end: The end datetime of the range to examine
+        :type end: ``datetime.datetime``
+        :param chunk_size: The number of buckets to request at once
+        :type chunk_size: ``int``
+        :param timeout: A time limit for each request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
+        :rtype: ``AsyncIterator[dict]``
+        """
+        # Since chunks are aligned to bucket boundaries, duplicates can only appear
+        # where two chunks meet:
+        last_time = None
+
+        for chunk_start, chunk_end in split_range(start, end, interval, chunk_size):
+            response = await self.get_metrics(
+                device_mac_address, chunk_start, chunk_end, interval, timeout=timeout
+            )
+            for item in response.get("items", []):
+                if item["time"] == last_time:
+                    continue
+                last_time = item["time"]
+                yield item
+
+    async def get_metrics_history(
+        self,
+        device_mac_address: str,
+        start: datetime,
+        end: datetime,
+        interval: str = INTERVAL_HOURLY,
+        *,
+        chunk_size: Optional[int] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: Optional[TimeoutT] = None,
+    ) -> dict:
+        """Return device metrics for a long range, fetched in concurrent chunks.
+
+        The response has the same shape as :meth:`get_metrics`.
+
+        :param device_mac_address: The MAC address of the device
+        :type device_mac_address: ``str``
+        :param start: The start datetime of the range to examine
+        :type start: ``datetime.datetime``
+        :param end: The end datetime of the range to examine
+        :type end: ``datetime.datetime``
+        :param chunk_size: The number of buckets to request at once
+        :type chunk_size: ``int``
+        :param concurrency: The max number of requests to have in flight at once
+        :type concurrency: ``int``
+        :param timeout: A time limit for each request (in seconds or as a
+            :meth:`aioflo.transport.Timeout`)
+        :type timeout: ``Union[float, aioflo.transport.Timeout]``
+        :rtype: ``dict``
+        """
+
+        async def get_chunk(chunk_start: datetime, chunk_end: datetime) -> dict:
+            """Get metrics for a single chunk."""
+            return await self.get_metrics(
+                device_mac_address, chunk_start, chunk_end, interval, timeout=timeout
+            )
+
+        return await self._async_get_history(
+            get_chunk, start, end, interval, chunk_size, concurrency
         )
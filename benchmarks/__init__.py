@@ -0,0 +1 @@
+"""Define aioflo benchmarks."""
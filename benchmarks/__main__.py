@@ -0,0 +1,102 @@
+"""Run the benchmark suite and write machine-readable results.
+
+Usage::
+
+    python -m benchmarks [--quick] [--output results.json] [name ...]
+
+Every benchmark (or just the named ones) is run in turn; the combined results, along
+with details of the environment they were collected in, are printed as JSON and,
+optionally, written to a file so that runs can be compared over time.
+"""
+import argparse
+import asyncio
+from datetime import datetime, timezone
+import importlib
+import json
+import platform
+import sys
+from typing import Any, Dict, List, Optional
+
+from aioflo.util.json import JSON_LOADS_LIBRARY
+
+BENCHMARKS = (
+    "startup",
+    "request_overhead",
+    "session_pool",
+    "concurrent_get_info",
+    "token_refresh",
+    "json_decoding",
+    "parse_cost",
+)
+
+
+def get_version() -> Optional[str]:
+    """Return the installed version of aioflo (if it is installed)."""
+    try:
+        # pylint: disable=import-outside-toplevel
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # pragma: no cover
+        return None
+
+    try:
+        return version("aioflo")
+    except PackageNotFoundError:
+        return None
+
+
+def run_benchmark(name: str, quick: bool = False) -> Dict[str, Any]:
+    """Run a single benchmark module and return its results."""
+    module = importlib.import_module(f"benchmarks.{name}")
+    kwargs = getattr(module, "QUICK", {}) if quick else {}
+
+    if hasattr(module, "async_run"):
+        return asyncio.run(module.async_run(**kwargs))
+    return module.run(**kwargs)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        metavar="name",
+        help=f"benchmarks to run (default: all of {', '.join(BENCHMARKS)})",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="use fewer iterations (for smoke tests)"
+    )
+    parser.add_argument("--output", help="a file to write the JSON results to")
+    args = parser.parse_args(argv)
+
+    if unknown := set(args.benchmarks) - set(BENCHMARKS):
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    results: Dict[str, Any] = {}
+    for name in args.benchmarks or BENCHMARKS:
+        print(f"Running {name}...", file=sys.stderr)
+        results[name] = run_benchmark(name, quick=args.quick)
+
+    report = json.dumps(
+        {
+            "metadata": {
+                "aioflo_version": get_version(),
+                "json_library": JSON_LOADS_LIBRARY,
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "quick": args.quick,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+            "results": results,
+        },
+        indent=2,
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fptr:
+            fptr.write(report)
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Define common benchmark utilities."""
+from contextlib import asynccontextmanager
+import json
+import os
+import statistics
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Union
+
+from aiohttp import web
+
+from aioflo.api import API_V1_BASE
+from aioflo.const import API_V2_BASE
+from aioflo.transport import AiohttpTransport, TransportResponse
+
+FIXTURES_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "tests", "fixtures"
+)
+
+
+def load_fixture(filename: str) -> str:
+    """Load a fixture from the test suite."""
+    with open(os.path.join(FIXTURES_PATH, filename), encoding="utf-8") as fptr:
+        return fptr.read()
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Summarize a list of per-iteration timings (in seconds)."""
+    ordered = sorted(samples)
+    return {
+        "iterations": len(ordered),
+        "mean_ms": statistics.mean(ordered) * 1000,
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[int(len(ordered) * 0.95) - 1] * 1000,
+        "min_ms": ordered[0] * 1000,
+    }
+
+
+async def async_time(func: Callable[[], Awaitable], iterations: int) -> List[float]:
+    """Time a number of sequential awaits of a coroutine function."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def get_auth_response(expires_in: int = 86400) -> str:
+    """Return a successful authentication response that is valid from now."""
+    now = round(time.time())
+    return json.dumps(
+        {
+            "token": "benchmark-token",
+            "tokenPayload": {
+                "user": {"user_id": "benchmark-user", "email": "user@example.com"},
+                "timestamp": now,
+            },
+            "tokenExpiration": expires_in,
+            "timeNow": now,
+        }
+    )
+
+
+@asynccontextmanager
+async def stub_server(
+    routes: Dict[str, Union[str, Callable]], *, method: str = "GET"
+) -> AsyncIterator[str]:
+    """Run a local HTTP server that serves static JSON bodies.
+
+    ``routes`` maps paths (optionally prefixed with a method, e.g. ``"POST /auth"``)
+    to response bodies or ``aiohttp`` handlers; the base URL is yielded.
+    """
+
+    def make_handler(body: str) -> Callable:
+        async def handler(_: web.Request) -> web.Response:
+            return web.Response(text=body, content_type="application/json")
+
+        return handler
+
+    app = web.Application()
+    for route, body in routes.items():
+        route_method, _, path = route.rpartition(" ")
+        app.router.add_route(
+            route_method or method,
+            path,
+            body if callable(body) else make_handler(body),
+        )
+
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        await runner.cleanup()
+
+
+class StubTransport(AiohttpTransport):
+    """Define a transport that sends Flo API requests to a local stub server.
+
+    Paths are kept intact (e.g., ``/api/v2/devices/{id}``), so the stub server's
+    routes mirror the real API's.
+    """
+
+    def __init__(self, base_url: str, **kwargs: Any) -> None:
+        """Initialize."""
+        super().__init__(**kwargs)
+        self._rewrites = (
+            (API_V1_BASE, f"{base_url}/api/v1"),
+            (API_V2_BASE, f"{base_url}/api/v2"),
+        )
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> TransportResponse:
+        """Send a request to the stub server instead of Flo."""
+        for prefix, replacement in self._rewrites:
+            if url.startswith(prefix):
+                url = f"{replacement}{url[len(prefix):]}"
+                break
+        return await super().request(method, url, **kwargs)
+
+
+def dump_results(name: str, results: Dict) -> None:
+    """Print benchmark results as a single JSON document."""
+    print(json.dumps({"benchmark": name, "results": results}, indent=2))
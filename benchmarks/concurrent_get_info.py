@@ -0,0 +1,70 @@
+"""Benchmark throughput of many concurrent ``Device.get_info`` calls.
+
+Each run fetches the same number of distinct devices from a local stub server with a
+different concurrency limit, so the results show how well the client scales as more
+requests are in flight at once. Run with ``python -m benchmarks.concurrent_get_info``.
+"""
+import asyncio
+import time
+from typing import Dict, Sequence
+
+from aioflo import async_get_api
+
+from .common import (
+    StubTransport,
+    dump_results,
+    get_auth_response,
+    load_fixture,
+    stub_server,
+)
+
+CONCURRENCY_LEVELS = (1, 10, 50, 200)
+DEVICES = 2000
+
+QUICK = {"devices": 200, "concurrency_levels": (1, 10, 50)}
+
+
+async def async_run(
+    devices: int = DEVICES, concurrency_levels: Sequence[int] = CONCURRENCY_LEVELS
+) -> Dict:
+    """Run the benchmark."""
+    results: Dict = {"devices": devices}
+    device_ids = [str(idx) for idx in range(devices)]
+
+    async with stub_server(
+        {
+            "POST /api/v1/users/auth": get_auth_response(),
+            "/api/v2/devices/{device_id}": load_fixture("device_info_response.json"),
+        }
+    ) as base_url:
+        for concurrency in concurrency_levels:
+            transport = StubTransport(base_url, connection_limit=concurrency)
+            async with await async_get_api(
+                "user@example.com", "password", transport=transport
+            ) as api:
+                # Warm up the connection pool before measuring:
+                async for _ in api.device.get_info_many(
+                    device_ids[:concurrency], concurrency=concurrency
+                ):
+                    pass
+
+                start = time.perf_counter()
+                async for _, result in api.device.get_info_many(
+                    device_ids, concurrency=concurrency
+                ):
+                    if isinstance(result, Exception):
+                        raise result
+                elapsed = time.perf_counter() - start
+
+            await transport.close()
+            results[f"concurrency_{concurrency}"] = {
+                "elapsed_s": elapsed,
+                "requests_per_s": devices / elapsed,
+                "mean_ms": elapsed / devices * 1000,
+            }
+
+    return results
+
+
+if __name__ == "__main__":
+    dump_results("concurrent_get_info", asyncio.run(async_run()))
@@ -0,0 +1,62 @@
+"""Benchmark decoding the repo's fixtures with each available JSON library.
+
+The metrics fixture is scaled up (by repeating its items) to approximate a long-range
+response. Run with ``python -m benchmarks.json_decoding``.
+"""
+import importlib
+import json
+import time
+from typing import Callable, Dict
+
+from aioflo.util.json import JSON_LOADS_LIBRARY
+
+from .common import dump_results, load_fixture
+
+ITERATIONS = 200
+METRICS_SCALE = 1000
+
+QUICK = {"iterations": 20}
+
+
+def get_payloads(metrics_scale: int = METRICS_SCALE) -> Dict[str, bytes]:
+    """Return the payloads to decode."""
+    metrics = json.loads(load_fixture("water_metric_info_response.json"))
+    metrics["items"] = metrics["items"] * metrics_scale
+
+    return {
+        "device_info": load_fixture("device_info_response.json").encode(),
+        "water_metrics_scaled": json.dumps(metrics).encode(),
+    }
+
+
+def get_decoders() -> Dict[str, Callable]:
+    """Return the JSON decoders that are installed."""
+    decoders: Dict[str, Callable] = {"json": json.loads}
+    for name in ("orjson", "ujson"):
+        try:
+            decoders[name] = importlib.import_module(name).loads
+        except ImportError:
+            continue
+    return decoders
+
+
+def run(iterations: int = ITERATIONS) -> Dict:
+    """Run the benchmark."""
+    results: Dict = {"default": JSON_LOADS_LIBRARY}
+
+    for payload_name, payload in get_payloads().items():
+        results[payload_name] = {"bytes": len(payload)}
+        for decoder_name, loads in get_decoders().items():
+            start = time.perf_counter()
+            for _ in range(iterations):
+                loads(payload)
+            elapsed = time.perf_counter() - start
+            results[payload_name][decoder_name] = {
+                "mean_us": elapsed / iterations * 1_000_000
+            }
+
+    return results
+
+
+if __name__ == "__main__":
+    dump_results("json_decoding", run())
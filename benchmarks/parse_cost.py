@@ -0,0 +1,63 @@
+"""Benchmark the cost of turning fixture payloads into usable data.
+
+The metrics fixture is scaled up (by repeating its items) to approximate long-range
+responses, then decoded and loaded into a ``TimeSeries``; the device fixture is
+decoded and loaded into a ``DeviceInfo`` model. Run with
+``python -m benchmarks.parse_cost``.
+"""
+import json
+import time
+from typing import Callable, Dict, Sequence
+
+from aioflo.models import DeviceInfo
+from aioflo.timeseries import TimeSeries
+from aioflo.util.json import JSON_LOADS_LIBRARY, json_loads
+
+from .common import dump_results, load_fixture
+
+ITERATIONS = 200
+METRICS_SCALES = (1, 10, 100, 1000)
+
+QUICK = {"iterations": 20, "metrics_scales": (1, 10, 100)}
+
+
+def _time(func: Callable[[], object], iterations: int) -> float:
+    """Return the mean time (in microseconds) of a function call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def run(
+    iterations: int = ITERATIONS, metrics_scales: Sequence[int] = METRICS_SCALES
+) -> Dict:
+    """Run the benchmark."""
+    results: Dict = {"json_library": JSON_LOADS_LIBRARY}
+
+    device_body = load_fixture("device_info_response.json").encode()
+    device_data = json_loads(device_body)
+    results["device_info"] = {
+        "bytes": len(device_body),
+        "decode_us": _time(lambda: json_loads(device_body), iterations),
+        "model_us": _time(lambda: DeviceInfo.from_dict(device_data), iterations),
+    }
+
+    metrics = json.loads(load_fixture("water_metric_info_response.json"))
+    for scale in metrics_scales:
+        body = json.dumps({**metrics, "items": metrics["items"] * scale}).encode()
+        data = json_loads(body)
+        results[f"water_metrics_x{scale}"] = {
+            "bytes": len(body),
+            "items": len(data["items"]),
+            "decode_us": _time(lambda: json_loads(body), iterations),
+            "timeseries_us": _time(
+                lambda: TimeSeries.from_metrics(data), iterations  # noqa: B023
+            ),
+        }
+
+    return results
+
+
+if __name__ == "__main__":
+    dump_results("parse_cost", run())
@@ -0,0 +1,49 @@
+"""Benchmark per-request latency with and without the pooled session.
+
+Without the pool, every request pays for a new connection (as ``API._request`` used to
+do by creating a ``ClientSession`` per call); with the pool, connections are kept
+alive and reused. Against the real API, the gap is larger still since each new
+connection also pays for a TLS handshake.
+
+Run with ``python -m benchmarks.session_pool``.
+"""
+import asyncio
+from typing import Dict
+
+from aioflo.api import API
+
+from .common import async_time, dump_results, load_fixture, stub_server, summarize
+
+ITERATIONS = 500
+
+
+async def async_run(iterations: int = ITERATIONS) -> Dict:
+    """Run the benchmark."""
+    async with stub_server(
+        {"/devices/98765": load_fixture("device_info_response.json")}
+    ) as base_url:
+        url = f"{base_url}/devices/98765"
+
+        async def unpooled() -> None:
+            async with API("user", "password") as api:
+                await api._request("get", url)  # pylint: disable=protected-access
+
+        async with API("user", "password") as pooled_api:
+
+            async def pooled() -> None:
+                await pooled_api._request(  # pylint: disable=protected-access
+                    "get", url
+                )
+
+            # Warm up both paths before measuring:
+            await unpooled()
+            await pooled()
+
+            return {
+                "unpooled": summarize(await async_time(unpooled, iterations)),
+                "pooled": summarize(await async_time(pooled, iterations)),
+            }
+
+
+if __name__ == "__main__":
+    dump_results("session_pool", asyncio.run(async_run()))
@@ -0,0 +1,87 @@
+"""Benchmark how long it takes to import aioflo.
+
+Each statement is run in a fresh interpreter with ``-X importtime``, which reports the
+time spent importing every module; modules that the interpreter imports on its own
+(e.g., ``site``) aren't counted. Importing the package itself should stay cheap, with
+heavier dependencies (like ``aiohttp``) only imported once they're needed. Run with
+``python -m benchmarks.startup``.
+"""
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Sequence, Set, Tuple
+
+ITERATIONS = 10
+STATEMENTS = (
+    "import aioflo",
+    "from aioflo import async_get_api",
+    # What the first request adds on top:
+    "from aioflo import async_get_api; import aiohttp",
+)
+SLOWEST_MODULES = 5
+
+QUICK = {"iterations": 3}
+
+
+def get_import_times(statement: str) -> Tuple[List[Tuple[str, int]], str]:
+    """Run a statement and return the time taken by each top-level import.
+
+    Times are cumulative (i.e., they include nested imports) and in microseconds. The
+    statement's output is also returned.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    times = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        # Nested imports are indented:
+        if not module[1:].startswith(" "):
+            times.append((module.strip(), int(cumulative)))
+
+    return times, proc.stdout
+
+
+def time_statement(statement: str, iterations: int, baseline: Set[str]) -> Dict:
+    """Time the imports made by a statement."""
+    # Also report whether aiohttp ended up being imported:
+    check = f"{statement}; import sys; print('aiohttp' in sys.modules)"
+    totals = []
+
+    for _ in range(iterations):
+        times, output = get_import_times(check)
+        times = [item for item in times if item[0] not in baseline]
+        totals.append(sum(cumulative for _, cumulative in times))
+
+    return {
+        "median_ms": statistics.median(totals) / 1000,
+        "min_ms": min(totals) / 1000,
+        "imports_aiohttp": output.strip() == "True",
+        "slowest_ms": {
+            module: cumulative / 1000
+            for module, cumulative in sorted(times, key=lambda item: -item[1])[
+                :SLOWEST_MODULES
+            ]
+        },
+    }
+
+
+def run(iterations: int = ITERATIONS, statements: Sequence[str] = STATEMENTS) -> Dict:
+    """Run the benchmark."""
+    baseline = {module for module, _ in get_import_times("pass")[0]}
+    return {
+        statement: time_statement(statement, iterations, baseline)
+        for statement in statements
+    }
+
+
+if __name__ == "__main__":
+    from .common import dump_results  # pylint: disable=import-outside-toplevel
+
+    dump_results("startup", run())
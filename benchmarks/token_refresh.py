@@ -0,0 +1,82 @@
+"""Benchmark token-refresh contention.
+
+Many requests arrive at once just after the access token has expired. Only a single
+authentication request should reach the server per round, no matter how many
+requests are waiting; this measures how long the burst takes and how many
+authentication requests were actually made. Run with
+``python -m benchmarks.token_refresh``.
+"""
+import asyncio
+from datetime import datetime, timedelta
+import time
+from typing import Dict, Sequence
+
+from aiohttp import web
+
+from aioflo import async_get_api
+
+from .common import (
+    StubTransport,
+    dump_results,
+    get_auth_response,
+    load_fixture,
+    stub_server,
+)
+
+BURST_SIZES = (1, 10, 100, 1000)
+ROUNDS = 20
+
+QUICK = {"burst_sizes": (1, 10, 100), "rounds": 5}
+
+
+async def async_run(
+    burst_sizes: Sequence[int] = BURST_SIZES, rounds: int = ROUNDS
+) -> Dict:
+    """Run the benchmark."""
+    results: Dict = {"rounds": rounds}
+    auth_requests = 0
+
+    async def auth_handler(_: web.Request) -> web.Response:
+        """Count authentication requests."""
+        nonlocal auth_requests
+        auth_requests += 1
+        return web.Response(text=get_auth_response(), content_type="application/json")
+
+    async with stub_server(
+        {
+            "POST /api/v1/users/auth": auth_handler,
+            "/api/v2/devices/{device_id}": load_fixture("device_info_response.json"),
+        }
+    ) as base_url:
+        for burst_size in burst_sizes:
+            transport = StubTransport(base_url)
+            async with await async_get_api(
+                "user@example.com",
+                "password",
+                transport=transport,
+                coalesce_requests=False,
+            ) as api:
+                auth_requests = 0
+                elapsed = 0.0
+
+                for _ in range(rounds):
+                    expired = datetime.now() - timedelta(seconds=1)
+                    api._token_expiration = expired  # pylint: disable=protected-access
+
+                    start = time.perf_counter()
+                    await asyncio.gather(
+                        *(api.device.get_info(str(idx)) for idx in range(burst_size))
+                    )
+                    elapsed += time.perf_counter() - start
+
+            await transport.close()
+            results[f"burst_{burst_size}"] = {
+                "auth_requests_per_round": auth_requests / rounds,
+                "mean_round_ms": elapsed / rounds * 1000,
+            }
+
+    return results
+
+
+if __name__ == "__main__":
+    dump_results("token_refresh", asyncio.run(async_run()))
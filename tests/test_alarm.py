@@ -1,10 +1,13 @@
 """Define tests for alarm-related endpoints."""
+import asyncio
 import json
 
 import aiohttp
 import pytest
 
 from aioflo import async_get_api
+from aioflo.alarm import AlarmCatalog
+from aioflo.transport import FakeTransport
 
 from .common import TEST_EMAIL_ADDRESS, TEST_PASSWORD, load_fixture
 
@@ -52,3 +55,87 @@ async def test_get_user_info_no_session(aresponses, auth_success_response):
     alarm_info = await api.alarm.get_all()
     assert len(alarm_info["items"]) == 1
     assert alarm_info["items"][0]["name"] == "health_test_skipped"
+
+    await api.close()
+
+
+def test_alarm_catalog():
+    """Test looking up alarm definitions in a catalog."""
+    catalog = AlarmCatalog.from_response(
+        {
+            "items": [
+                {"id": 1, "name": "a", "severity": "critical", "isShutoff": True},
+                {"id": 2, "name": "b", "severity": "critical", "isShutoff": False},
+                {"id": 3, "name": "c", "severity": "info", "isShutoff": False},
+            ]
+        }
+    )
+    assert len(catalog) == 3
+    assert 2 in catalog
+    assert catalog.get(2).name == "b"
+    assert catalog.get(4) is None
+    assert catalog.get_by_name("c").id == 3
+    assert [alarm.id for alarm in catalog.get_by_severity("critical")] == [1, 2]
+    assert catalog.get_by_severity("warning") == ()
+    assert [alarm.id for alarm in catalog.get_by_shutoff()] == [1]
+    assert [alarm.id for alarm in catalog.get_by_shutoff(False)] == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_get_alarm_catalog(aresponses, auth_success_response):
+    """Test that the alarm catalog is stored and refreshed in the background."""
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/alarms",
+        "get",
+        aresponses.Response(text=load_fixture("alarms_response.json"), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/alarms",
+        "get",
+        aresponses.Response(text=None, status=500),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session)
+        catalog = await api.alarm.get_catalog()
+        assert catalog.get_by_name("health_test_skipped").id == 3
+
+        # A fresh catalog is returned without another request:
+        assert await api.alarm.get_catalog() is catalog
+
+        # A stale catalog is returned immediately and kept if the refresh fails:
+        assert await api.alarm.get_catalog(max_age=0) is catalog
+        await asyncio.sleep(0.05)
+        assert await api.alarm.get_catalog() is catalog
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_get_alarm_catalog_cancelled(caplog):
+    """Test that a first fetch's error is handled even if its caller is cancelled."""
+    transport = FakeTransport(latency=0.05)
+    transport.add_auth_route()
+    transport.add_route("get", "alarms", b"", status=500)
+
+    api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, transport=transport)
+    get_catalog = asyncio.create_task(api.alarm.get_catalog())
+    await asyncio.sleep(0.01)
+    get_catalog.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await get_catalog
+
+    # The shared fetch carries on and its error is logged (rather than never being
+    # retrieved):
+    refresh_task = api.alarm._catalog_refresh_task  # pylint: disable=protected-access
+    await asyncio.wait([refresh_task])
+    assert not refresh_task.cancelled()
+    assert "Unable to retrieve the alarm catalog" in caplog.text
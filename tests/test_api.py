@@ -1,5 +1,6 @@
 """Define general tests for the API."""
 # pylint: disable=protected-access
+import asyncio
 from datetime import datetime, timedelta
 import json
 import logging
@@ -8,9 +9,18 @@ import aiohttp
 import pytest
 
 from aioflo import async_get_api
-from aioflo.errors import RequestError
+from aioflo.errors import RequestError, RequestTimeoutError
+from aioflo.retry import RetryPolicy
+from aioflo.transport import FakeTransport, Timeout
 
-from .common import TEST_EMAIL_ADDRESS, TEST_PASSWORD, TEST_TOKEN, TEST_USER_ID
+from .common import (
+    TEST_DEVICE_ID,
+    TEST_EMAIL_ADDRESS,
+    TEST_PASSWORD,
+    TEST_TOKEN,
+    TEST_USER_ID,
+    load_fixture,
+)
 
 
 @pytest.mark.asyncio
@@ -68,6 +78,94 @@ async def test_expired_api_token(aresponses, auth_success_response, caplog):
         assert any("Requesting new access token" in e.message for e in caplog.records)
 
 
+@pytest.mark.asyncio
+async def test_expired_api_token_single_flight(aresponses, auth_success_response):
+    """Test that concurrent requests with an expired token only authenticate once."""
+
+    async def slow_auth_response(_):
+        """Return an auth response slowly enough for requests to pile up."""
+        await asyncio.sleep(0.1)
+        return aresponses.Response(text=json.dumps(auth_success_response), status=200)
+
+    def endpoint_response(request):
+        """Return a response that echoes the Authorization header."""
+        return aresponses.Response(
+            text=json.dumps({"token": request.headers.get("Authorization")}),
+            status=200,
+        )
+
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add("api.meetflo.com", "/api/v1/users/auth", "post", slow_auth_response)
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/random_good_endpoint",
+        "get",
+        endpoint_response,
+        repeat=50,
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session)
+        api._token_expiration = datetime.now() - timedelta(days=1)
+
+        responses = await asyncio.gather(
+            *[
+                api._request(
+                    "get",
+                    "https://api.meetflo.com/api/v1/random_good_endpoint",
+                    params={"idx": idx},
+                )
+                for idx in range(50)
+            ]
+        )
+
+    assert all(response["token"] == TEST_TOKEN for response in responses)
+    assert (
+        len([e for e in aresponses.history if e.request.path == "/api/v1/users/auth"])
+        == 2
+    )
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_expiring_api_token_background_refresh(aresponses, auth_success_response):
+    """Test that a token close to expiring is refreshed without blocking requests."""
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+        repeat=2,
+    )
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/random_good_endpoint",
+        "get",
+        aresponses.Response(text=None, status=200),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(
+            TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session, token_refresh_margin=600
+        )
+        expiring = datetime.now() + timedelta(seconds=60)
+        api._token_expiration = expiring
+
+        await api._request("get", "https://api.meetflo.com/api/v1/random_good_endpoint")
+        assert api._token_refresh_task is not None
+        await api._token_refresh_task
+        assert api._token_expiration > expiring
+
+    # The request shouldn't have waited for the refresh, so routes are hit out of order:
+    aresponses.assert_no_unused_routes()
+    aresponses.assert_all_requests_matched()
+
+
 @pytest.mark.asyncio
 async def test_get_api(aresponses, auth_success_response):
     """Test instantiating an authenticated API object."""
@@ -82,3 +180,286 @@ async def test_get_api(aresponses, auth_success_response):
         api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session)
         assert api._token == TEST_TOKEN
         assert api._user_id == TEST_USER_ID
+
+
+@pytest.mark.asyncio
+async def test_pooled_session(aresponses, auth_success_response):
+    """Test that an API object without a session reuses a single pooled session."""
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/random_good_endpoint",
+        "get",
+        aresponses.Response(text=None, status=200),
+        repeat=2,
+    )
+
+    async with await async_get_api(
+        TEST_EMAIL_ADDRESS, TEST_PASSWORD, connection_limit=5
+    ) as api:
+        session = api.transport._owned_session
+        assert session is not None
+        assert session.connector.limit == 5
+
+        await api._request("get", "https://api.meetflo.com/api/v1/random_good_endpoint")
+        await api._request("get", "https://api.meetflo.com/api/v1/random_good_endpoint")
+        assert api.transport._owned_session is session
+
+    assert session.closed
+    assert api.transport._owned_session is None
+
+
+@pytest.mark.asyncio
+async def test_close_leaves_provided_session_open(aresponses, auth_success_response):
+    """Test that closing the API object doesn't close a caller-provided session."""
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session)
+        await api.close()
+        assert not session.closed
+        assert api.transport._owned_session is None
+
+
+@pytest.mark.asyncio
+async def test_coalesced_reads(aresponses, auth_success_response):
+    """Test that identical, concurrent reads share a single round trip."""
+
+    async def slow_response(_):
+        """Return a response slowly enough for requests to pile up."""
+        await asyncio.sleep(0.1)
+        return aresponses.Response(text=json.dumps({"value": 1}), status=200)
+
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add(
+        "api.meetflo.com", "/api/v1/random_good_endpoint", "get", slow_response
+    )
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/bad",
+        "get",
+        aresponses.Response(text=None, status=500),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session)
+
+        responses = await asyncio.gather(
+            *[
+                api._request(
+                    "get", "https://api.meetflo.com/api/v1/random_good_endpoint"
+                )
+                for _ in range(10)
+            ]
+        )
+        assert all(response is responses[0] for response in responses)
+
+        errors = await asyncio.gather(
+            *[
+                api._request("get", "https://api.meetflo.com/api/v1/bad")
+                for _ in range(10)
+            ],
+            return_exceptions=True,
+        )
+        assert all(isinstance(error, RequestError) for error in errors)
+        assert all(error is errors[0] for error in errors)
+        assert not api._in_flight_reads
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_json_decoding(aresponses, auth_success_response):
+    """Test custom decoders, raw response bodies, and invalid JSON."""
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/98765",
+        "get",
+        aresponses.Response(text=load_fixture("device_info_response.json"), status=200),
+        repeat=2,
+    )
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/not_json",
+        "get",
+        aresponses.Response(text="<html></html>", status=200),
+    )
+
+    decoded_bodies = []
+
+    def json_loads(body):
+        """Decode JSON with the standard library (and record the body)."""
+        decoded_bodies.append(body)
+        return json.loads(body)
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(
+            TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session, json_loads=json_loads
+        )
+
+        raw_device_info = await api.device.get_info(TEST_DEVICE_ID, raw=True)
+        assert isinstance(raw_device_info, bytes)
+        assert json.loads(raw_device_info)["fwVersion"] == "6.1.1"
+
+        device_info = await api.device.get_info(TEST_DEVICE_ID)
+        assert device_info["fwVersion"] == "6.1.1"
+        assert decoded_bodies[-1] == raw_device_info
+
+        with pytest.raises(RequestError):
+            await api._request("get", "https://api.meetflo.com/api/v1/not_json")
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_request_headers(aresponses, auth_success_response):
+    """Test that per-request headers are merged without touching the defaults."""
+
+    def echo_headers(request):
+        """Return the request's headers."""
+        return aresponses.Response(text=json.dumps(dict(request.headers)), status=200)
+
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add("api-gw.meetflo.com", "/api/v2/echo", "get", echo_headers)
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session)
+        headers = await api._request(
+            "get",
+            "https://api-gw.meetflo.com/api/v2/echo",
+            headers={"X-Custom": "value"},
+        )
+
+    assert headers["Host"] == "api-gw.meetflo.com"
+    assert headers["Authorization"] == TEST_TOKEN
+    assert headers["X-Custom"] == "value"
+    assert headers["User-Agent"].startswith("Mozilla/5.0")
+
+    default_headers = api._default_headers["https://api-gw.meetflo.com"]
+    assert default_headers["Host"] == "api-gw.meetflo.com"
+    assert "Authorization" not in default_headers
+    assert "X-Custom" not in default_headers
+
+
+@pytest.mark.asyncio
+async def test_timeouts():
+    """Test that per-call and default timeouts bound requests."""
+    transport = FakeTransport(latency=0.2)
+    transport.add_auth_route()
+    transport.add_route(
+        "get", "devices/{id}", load_fixture("device_info_response.json")
+    )
+
+    api = await async_get_api(
+        TEST_EMAIL_ADDRESS, TEST_PASSWORD, transport=transport, timeout=1
+    )
+
+    start = asyncio.get_running_loop().time()
+    with pytest.raises(RequestTimeoutError):
+        await api.device.get_info(TEST_DEVICE_ID, timeout=0.05)
+    # The abandoned read is cancelled rather than left running:
+    assert not api._in_flight_reads
+    with pytest.raises(RequestTimeoutError):
+        await api.device.get_info(TEST_DEVICE_ID, timeout=Timeout(read=0.05))
+    assert not api._in_flight_reads
+    assert asyncio.get_running_loop().time() - start < 0.3
+
+    # The default timeout is long enough:
+    data = await api.device.get_info(TEST_DEVICE_ID)
+    assert data["nickname"] == "Smart Water Shutoff"
+
+    results = dict(
+        [
+            result
+            async for result in api.device.get_info_many(
+                ["1", "2"], timeout=Timeout(total=0.05)
+            )
+        ]
+    )
+    assert all(isinstance(result, RequestTimeoutError) for result in results.values())
+    assert not api._in_flight_reads
+
+    await api.close()
+
+
+@pytest.mark.asyncio
+async def test_coalesced_reads_with_timeouts():
+    """Test that one caller's timeout doesn't apply to identical, concurrent reads."""
+    transport = FakeTransport(latency=0.2)
+    transport.add_auth_route()
+    transport.add_route(
+        "get", "devices/{id}", load_fixture("device_info_response.json")
+    )
+
+    api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, transport=transport)
+
+    short, default, long, also_long = await asyncio.gather(
+        api.device.get_info(TEST_DEVICE_ID, timeout=Timeout(read=0.05)),
+        api.device.get_info(TEST_DEVICE_ID),
+        api.device.get_info(TEST_DEVICE_ID, timeout=5),
+        api.device.get_info(TEST_DEVICE_ID, timeout=5),
+        return_exceptions=True,
+    )
+    assert isinstance(short, RequestTimeoutError)
+    assert default["nickname"] == "Smart Water Shutoff"
+    assert long is also_long
+    assert long["nickname"] == "Smart Water Shutoff"
+    # Auth, plus one read per distinct timeout:
+    assert transport.requests == 4
+    assert not api._in_flight_reads
+
+    # Closing the API cancels reads that are still in flight:
+    read = asyncio.create_task(api.device.get_info(TEST_DEVICE_ID))
+    await asyncio.sleep(0.01)
+    assert api._in_flight_reads
+    await api.close()
+    assert not api._in_flight_reads
+    with pytest.raises(asyncio.CancelledError):
+        await read
+
+
+@pytest.mark.asyncio
+async def test_timeout_includes_retries():
+    """Test that a call's total timeout covers all of its retries."""
+    transport = FakeTransport()
+    transport.add_auth_route()
+    transport.add_route("get", "devices/{id}", b"", status=503)
+
+    api = await async_get_api(
+        TEST_EMAIL_ADDRESS,
+        TEST_PASSWORD,
+        transport=transport,
+        retry_policy=RetryPolicy(max_attempts=100, backoff_base=0.02, jitter=False),
+    )
+
+    with pytest.raises(RequestTimeoutError):
+        await api.device.get_info(TEST_DEVICE_ID, timeout=0.1)
+    assert 2 < transport.requests < 10
+
+    await api.close()
@@ -0,0 +1,93 @@
+"""Define tests for batched commands."""
+import asyncio
+
+import pytest
+
+from aioflo.batch import (
+    COMMAND_FAILED,
+    COMMAND_SUCCEEDED,
+    COMMAND_TIMED_OUT,
+    async_run_batch,
+)
+from aioflo.errors import RequestError, RequestTimeoutError, ResponseError
+
+
+@pytest.mark.asyncio
+async def test_run_batch():
+    """Test that every target gets a result, with bounded concurrency."""
+    calls = []
+    in_flight = 0
+    max_in_flight = 0
+
+    async def command(target_id):
+        """Run a command that succeeds, fails, or hangs depending on the target."""
+        nonlocal in_flight, max_in_flight
+        calls.append(target_id)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            if target_id == "bad":
+                raise ResponseError("Nope", 500)
+            if target_id == "request_timeout":
+                raise RequestTimeoutError("Too slow")
+            await asyncio.sleep(10 if target_id == "hung" else 0.01)
+        finally:
+            in_flight -= 1
+
+    result = await async_run_batch(
+        command,
+        ["1", "2", "bad", "hung", "request_timeout", "3", "1"],
+        concurrency=2,
+        timeout=0.1,
+    )
+
+    assert sorted(calls) == ["1", "2", "3", "bad", "hung", "request_timeout"]
+    assert max_in_flight == 2
+    assert len(result) == 6
+    assert result.succeeded == ["1", "2", "3"]
+    assert result.failed == ["bad"]
+    assert result.timed_out == ["hung", "request_timeout"]
+    assert result["1"].status == COMMAND_SUCCEEDED
+    assert result["1"].error is None
+    assert result["bad"].status == COMMAND_FAILED
+    assert isinstance(result["bad"].error, ResponseError)
+    assert result["hung"].status == COMMAND_TIMED_OUT
+    assert isinstance(result["hung"].error, RequestTimeoutError)
+    assert result["hung"].elapsed >= 0.1
+    assert result.elapsed >= result["hung"].elapsed
+    assert [item.target_id for item in result][:2] == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_run_batch_invalid_concurrency():
+    """Test that an invalid concurrency is rejected."""
+
+    async def command(_):
+        """Do nothing."""
+
+    with pytest.raises(RequestError):
+        await async_run_batch(command, ["1"], concurrency=0, timeout=None)
+
+
+@pytest.mark.asyncio
+async def test_run_batch_cancelled():
+    """Test that cancelling a batch cancels its outstanding commands."""
+    cancelled = []
+
+    async def command(target_id):
+        """Hang until cancelled."""
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(target_id)
+            raise
+
+    task = asyncio.create_task(
+        async_run_batch(command, ["1", "2"], concurrency=2, timeout=None)
+    )
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert sorted(cancelled) == ["1", "2"]
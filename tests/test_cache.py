@@ -0,0 +1,332 @@
+"""Define tests for the response cache."""
+import asyncio
+import json
+
+import aiohttp
+import pytest
+
+from aioflo import async_get_api
+from aioflo.cache import ResponseCache, ValidatorCache
+from aioflo.const import API_V2_BASE
+from aioflo.transport import FakeTransport, TransportResponse
+
+from .common import (
+    TEST_DEVICE_ID,
+    TEST_EMAIL_ADDRESS,
+    TEST_LOCATION_ID,
+    TEST_PASSWORD,
+    TEST_USER_ID,
+    load_fixture,
+)
+
+DEVICE_URL = f"{API_V2_BASE}/devices/{TEST_DEVICE_ID}"
+LOCATION_URL = f"{API_V2_BASE}/locations/{TEST_LOCATION_ID}"
+
+
+def test_cache_expiration(monkeypatch):
+    """Test that cached responses expire according to their endpoint's TTL."""
+    now = 1000.0
+    monkeypatch.setattr("aioflo.cache.time.monotonic", lambda: now)
+
+    cache = ResponseCache(ttls={"devices/{id}": 10})
+    cache.set("get", DEVICE_URL, None, {"id": TEST_DEVICE_ID})
+    assert cache.get("get", DEVICE_URL) == (True, {"id": TEST_DEVICE_ID})
+
+    now += 10
+    assert cache.get("get", DEVICE_URL) == (False, None)
+    assert len(cache) == 0
+
+    # Endpoints without a TTL are never cached (or counted):
+    cache.set("get", f"{API_V2_BASE}/water/consumption", None, {})
+    assert cache.get("get", f"{API_V2_BASE}/water/consumption") == (False, None)
+    assert cache.get_stats() == {
+        "entries": 0,
+        "evictions": 0,
+        "hits": 1,
+        "misses": 1,
+        "endpoints": {"devices/{id}": {"hits": 1, "misses": 1}},
+    }
+
+
+def test_cache_lru_eviction():
+    """Test that the least recently used response is evicted first."""
+    cache = ResponseCache(max_entries=2)
+    cache.set("get", f"{API_V2_BASE}/devices/1", None, 1)
+    cache.set("get", f"{API_V2_BASE}/devices/2", None, 2)
+    cache.get("get", f"{API_V2_BASE}/devices/1")
+    cache.set("get", f"{API_V2_BASE}/devices/3", None, 3)
+
+    assert cache.get("get", f"{API_V2_BASE}/devices/1") == (True, 1)
+    assert cache.get("get", f"{API_V2_BASE}/devices/2") == (False, None)
+    assert cache.get("get", f"{API_V2_BASE}/devices/3") == (True, 3)
+    assert cache.evictions == 1
+
+
+def test_cache_params_and_invalidation():
+    """Test that params are part of the key and that invalidation is per resource."""
+    cache = ResponseCache()
+    cache.set("get", LOCATION_URL, {}, "base")
+    cache.set("get", LOCATION_URL, {"expand": "devices"}, "expanded")
+    cache.set("get", f"{API_V2_BASE}/locations/other", None, "other")
+    cache.set("get", f"{API_V2_BASE}/alarms", None, "alarms")
+
+    assert cache.get("get", LOCATION_URL, {}) == (True, "base")
+    assert cache.get("get", LOCATION_URL, {"expand": "devices"}) == (True, "expanded")
+
+    cache.invalidate(f"{LOCATION_URL}/systemMode")
+    assert len(cache) == 2
+    assert cache.get("get", f"{API_V2_BASE}/locations/other") == (True, "other")
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_cache_dependent_invalidation():
+    """Test that a write invalidates responses that can embed the resource's state."""
+    cache = ResponseCache()
+    cache.set("get", LOCATION_URL, {"expand": "devices"}, "location")
+    cache.set("get", f"{API_V2_BASE}/users/{TEST_USER_ID}", None, "user")
+    cache.set("get", f"{API_V2_BASE}/alarms", None, "alarms")
+    cache.set("get", DEVICE_URL, None, "device")
+    cache.set("get", f"{API_V2_BASE}/devices/other", None, "other device")
+
+    # A device write leaves other devices (and unrelated endpoints) alone:
+    cache.invalidate(f"{DEVICE_URL}/healthTest/run")
+    assert len(cache) == 2
+    assert cache.get("get", f"{API_V2_BASE}/devices/other") == (True, "other device")
+    assert cache.get("get", f"{API_V2_BASE}/alarms") == (True, "alarms")
+
+    # A location write invalidates every device:
+    cache.invalidate(f"{LOCATION_URL}/systemMode")
+    assert len(cache) == 1
+
+
+def test_cache_generations():
+    """Test that responses read before an invalidation aren't cached."""
+    cache = ResponseCache()
+    generation = cache.get_generation(DEVICE_URL)
+    location_generation = cache.get_generation(LOCATION_URL)
+    other_generation = cache.get_generation(f"{API_V2_BASE}/devices/other")
+    alarms_generation = cache.get_generation(f"{API_V2_BASE}/alarms")
+
+    cache.invalidate(f"{DEVICE_URL}/healthTest/run")
+    cache.set("get", DEVICE_URL, None, "stale", generation=generation)
+    cache.set("get", LOCATION_URL, None, "stale", generation=location_generation)
+    cache.set(
+        "get",
+        f"{API_V2_BASE}/devices/other",
+        None,
+        "other device",
+        generation=other_generation,
+    )
+    cache.set(
+        "get", f"{API_V2_BASE}/alarms", None, "alarms", generation=alarms_generation
+    )
+    assert cache.get("get", DEVICE_URL) == (False, None)
+    assert cache.get("get", LOCATION_URL) == (False, None)
+    assert cache.get("get", f"{API_V2_BASE}/devices/other") == (True, "other device")
+    assert cache.get("get", f"{API_V2_BASE}/alarms") == (True, "alarms")
+
+    location_generation = cache.get_generation(LOCATION_URL)
+    cache.invalidate()
+    cache.set("get", LOCATION_URL, None, "stale", generation=location_generation)
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_device_write_invalidates_location():
+    """Test that closing a valve invalidates cached locations that embed it."""
+    location_reads = []
+
+    def location_handler(request):
+        """Record the request and return the expanded location."""
+        location_reads.append(request.params)
+        return TransportResponse(
+            200, {}, load_fixture("location_info_expand_devices_response.json").encode()
+        )
+
+    transport = FakeTransport()
+    transport.add_auth_route()
+    transport.add_route("get", "locations/{id}", location_handler)
+    transport.add_route(
+        "post", "devices/{id}", load_fixture("device_close_valve_response.json")
+    )
+
+    api = await async_get_api(
+        TEST_EMAIL_ADDRESS, TEST_PASSWORD, transport=transport, cache=ResponseCache()
+    )
+    await api.location.get_info(TEST_LOCATION_ID, include_device_info=True)
+    await api.location.get_info(TEST_LOCATION_ID, include_device_info=True)
+    assert len(location_reads) == 1
+
+    await api.device.close_valve(TEST_DEVICE_ID)
+    await api.location.get_info(TEST_LOCATION_ID, include_device_info=True)
+    assert len(location_reads) == 2
+
+
+@pytest.mark.asyncio
+async def test_write_during_read():
+    """Test that reads in flight during a write are neither cached nor shared."""
+
+    class SlowReadTransport(FakeTransport):
+        """Define a transport whose reads finish well after they are answered."""
+
+        async def request(self, method, url, **kwargs):
+            """Delay the response to reads."""
+            response = await super().request(method, url, **kwargs)
+            if method.lower() == "get":
+                await asyncio.sleep(0.1)
+            return response
+
+    valve = {"target": "open"}
+
+    def info_handler(_):
+        """Return the current valve state."""
+        return TransportResponse(200, {}, json.dumps({"valve": dict(valve)}).encode())
+
+    def valve_handler(request):
+        """Update the valve state."""
+        valve.update(request.json["valve"])
+        return TransportResponse(200, {}, json.dumps(request.json).encode())
+
+    transport = SlowReadTransport()
+    transport.add_auth_route()
+    transport.add_route("get", "devices/{id}", info_handler)
+    transport.add_route("post", "devices/{id}", valve_handler)
+
+    api = await async_get_api(
+        TEST_EMAIL_ADDRESS, TEST_PASSWORD, transport=transport, cache=ResponseCache()
+    )
+
+    stale_read = asyncio.create_task(api.device.get_info(TEST_DEVICE_ID))
+    await asyncio.sleep(0.01)
+    await api.device.close_valve(TEST_DEVICE_ID)
+
+    assert (await api.device.get_info(TEST_DEVICE_ID))["valve"]["target"] == "closed"
+    assert (await stale_read)["valve"]["target"] == "open"
+    assert (await api.device.get_info(TEST_DEVICE_ID))["valve"]["target"] == "closed"
+    assert not api._in_flight_reads
+
+    await api.close()
+
+
+@pytest.mark.asyncio
+async def test_cached_api_requests(aresponses, auth_success_response):
+    """Test that reads are served from the cache until a write invalidates them."""
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/98765",
+        "get",
+        aresponses.Response(text=load_fixture("device_info_response.json"), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/98765",
+        "post",
+        aresponses.Response(
+            text=load_fixture("device_close_valve_response.json"), status=200
+        ),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/98765",
+        "get",
+        aresponses.Response(
+            text=load_fixture("device_close_valve_response.json"), status=200
+        ),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(
+            TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session, cache=ResponseCache()
+        )
+        first = await api.device.get_info(TEST_DEVICE_ID)
+        second = await api.device.get_info(TEST_DEVICE_ID)
+        assert first is second
+
+        await api.device.close_valve(TEST_DEVICE_ID)
+        device_info = await api.device.get_info(TEST_DEVICE_ID)
+        assert device_info["valve"]["target"] == "closed"
+
+        stats = api.cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_conditional_requests(aresponses, auth_success_response):
+    """Test that stored validators are sent and the body is reused on HTTP 304."""
+    alarms = load_fixture("alarms_response.json")
+    conditional_headers = []
+
+    async def alarms_response(request):
+        """Return 304 if the client already has the current alarms."""
+        conditional_headers.append(
+            (
+                request.headers.get("If-None-Match"),
+                request.headers.get("If-Modified-Since"),
+            )
+        )
+        if request.headers.get("If-None-Match") == '"v1"':
+            return aresponses.Response(status=304)
+        return aresponses.Response(
+            text=alarms,
+            status=200,
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        )
+
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com", "/api/v2/alarms", "get", alarms_response, repeat=3
+    )
+
+    validator_cache = ValidatorCache()
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(
+            TEST_EMAIL_ADDRESS,
+            TEST_PASSWORD,
+            session=session,
+            validator_cache=validator_cache,
+        )
+        first = await api.alarm.get_all()
+        second = await api.alarm.get_all()
+        assert second is first
+        assert await api.alarm.get_all(raw=True) == alarms.encode()
+
+    assert conditional_headers == [
+        (None, None),
+        ('"v1"', "Wed, 21 Oct 2015 07:28:00 GMT"),
+        ('"v1"', "Wed, 21 Oct 2015 07:28:00 GMT"),
+    ]
+    assert validator_cache.not_modified["alarms"] == 2
+    aresponses.assert_plan_strictly_followed()
+
+
+def test_validator_cache():
+    """Test that only responses with validators are stored."""
+    cache = ValidatorCache(max_entries=1)
+    assert cache.set("get", DEVICE_URL, None, None, None, b"{}") is None
+    assert not cache
+
+    cache.set("get", DEVICE_URL, None, '"a"', None, b"{}")
+    assert cache.get("get", DEVICE_URL).get_headers() == {"If-None-Match": '"a"'}
+
+    cache.set("get", LOCATION_URL, None, None, "yesterday", b"{}")
+    assert cache.get("get", DEVICE_URL) is None
+    assert cache.get("get", LOCATION_URL).get_headers() == {
+        "If-Modified-Since": "yesterday"
+    }
@@ -1,10 +1,15 @@
 """Define tests for device-related endpoints."""
+import asyncio
 import json
 
 import aiohttp
 import pytest
 
 from aioflo import async_get_api
+from aioflo.batch import MAX_VERIFY_ATTEMPTS
+from aioflo.cache import ResponseCache
+from aioflo.errors import RequestError, RequestTimeoutError
+from aioflo.transport import FakeTransport, TransportResponse
 
 from .common import TEST_DEVICE_ID, TEST_EMAIL_ADDRESS, TEST_PASSWORD, load_fixture
 
@@ -34,6 +39,58 @@ async def test_get_device_info(aresponses, auth_success_response):
         assert device_info["nickname"] == "Smart Water Shutoff"
 
 
+@pytest.mark.asyncio
+async def test_get_device_info_many(aresponses, auth_success_response):
+    """Test retrieving info for many devices with bounded concurrency."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def device_info_response(_):
+        """Return device info after tracking how many requests are in flight."""
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return aresponses.Response(
+            text=load_fixture("device_info_response.json"), status=200
+        )
+
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/bad",
+        "get",
+        aresponses.Response(text=None, status=404),
+    )
+    for idx in range(10):
+        aresponses.add(
+            "api-gw.meetflo.com",
+            f"/api/v2/devices/{idx}",
+            "get",
+            device_info_response,
+        )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session)
+        results = {
+            device_id: result
+            async for device_id, result in api.device.get_info_many(
+                ["bad", *(str(idx) for idx in range(10))], concurrency=3
+            )
+        }
+
+    assert len(results) == 11
+    assert isinstance(results.pop("bad"), RequestError)
+    assert all(result["fwVersion"] == "6.1.1" for result in results.values())
+    assert max_in_flight == 3
+
+
 @pytest.mark.asyncio
 async def test_device_run_health_test(aresponses, auth_success_response):
     """Test successfully running a health test."""
@@ -113,3 +170,136 @@ async def test_device_valve_close(aresponses, auth_success_response):
         assert device_info["nickname"] == "Smart Water Shutoff"
         assert device_info["valve"]["target"] == "closed"
         assert device_info["valve"]["lastKnown"] == "open"
+
+
+@pytest.mark.asyncio
+async def test_device_valve_close_many(aresponses, auth_success_response):
+    """Test closing many valves at once (and verifying that they closed)."""
+    closing = json.loads(load_fixture("device_info_response.json"))
+    closed = json.loads(load_fixture("device_info_response.json"))
+    closed["valve"]["lastKnown"] = "closed"
+
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    for device_id in ("1", "2"):
+        aresponses.add(
+            "api-gw.meetflo.com",
+            f"/api/v2/devices/{device_id}",
+            "post",
+            aresponses.Response(
+                text=load_fixture("device_close_valve_response.json"), status=200
+            ),
+        )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/bad",
+        "post",
+        aresponses.Response(text=None, status=500),
+    )
+    # Device 1 reports its valve closed on the second read; device 2 never does:
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/1",
+        "get",
+        aresponses.Response(text=json.dumps(closing), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/1",
+        "get",
+        aresponses.Response(text=json.dumps(closed), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/2",
+        "get",
+        aresponses.Response(text=json.dumps(closing), status=200),
+        repeat=100,
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session)
+        result = await api.device.close_valve_many(
+            ["1", "2", "bad"], timeout=0.5, verify=True, verify_interval=0.01
+        )
+
+    assert result.succeeded == ["1"]
+    assert result.failed == ["bad"]
+    assert result.timed_out == ["2"]
+
+
+@pytest.mark.asyncio
+async def test_device_valve_verification():
+    """Test that verification reads skip the cache and give up without a timeout."""
+    reads = []
+    decoded = []
+
+    def info_handler(request):
+        """Report the valve closed on device 1's second read (and never on 2's)."""
+        reads.append(request.url)
+        info = json.loads(load_fixture("device_info_response.json"))
+        if request.url.endswith("/1") and reads.count(request.url) > 1:
+            info["valve"]["lastKnown"] = "closed"
+        return TransportResponse(200, {}, json.dumps(info).encode())
+
+    def json_loads(body):
+        """Record every decoded response."""
+        decoded.append(body)
+        return json.loads(body)
+
+    transport = FakeTransport()
+    transport.add_auth_route()
+    transport.add_route(
+        "post", "devices/{id}", load_fixture("device_close_valve_response.json")
+    )
+    transport.add_route("get", "devices/{id}", info_handler)
+
+    api = await async_get_api(
+        TEST_EMAIL_ADDRESS,
+        TEST_PASSWORD,
+        transport=transport,
+        cache=ResponseCache(),
+        json_loads=json_loads,
+    )
+    result = await api.device.close_valve_many(
+        ["1", "2"], timeout=None, verify=True, verify_interval=0
+    )
+
+    assert result.succeeded == ["1"]
+    assert result.timed_out == ["2"]
+    assert isinstance(result["2"].error, RequestTimeoutError)
+    assert len([url for url in reads if url.endswith("/2")]) == MAX_VERIFY_ATTEMPTS
+    # Every read was decoded with the API's decoder (auth, 2 writes, and the reads):
+    assert len(decoded) == 3 + len(reads)
+
+
+@pytest.mark.asyncio
+async def test_device_valve_open_many(aresponses, auth_success_response):
+    """Test opening many valves at once."""
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    for device_id in ("1", "2"):
+        aresponses.add(
+            "api-gw.meetflo.com",
+            f"/api/v2/devices/{device_id}",
+            "post",
+            aresponses.Response(
+                text=load_fixture("device_open_valve_response.json"), status=200
+            ),
+        )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session)
+        result = await api.device.open_valve_many(["1", "2"])
+
+    assert result.succeeded == ["1", "2"]
+    assert not result.failed
+    assert not result.timed_out
@@ -0,0 +1,36 @@
+"""Define tests for the package itself."""
+import subprocess
+import sys
+
+import pytest
+
+import aioflo
+from aioflo.api import API, async_get_api
+from aioflo.device import Device
+
+
+def test_lazy_attributes():
+    """Test that public names are importable from the package."""
+    assert aioflo.async_get_api is async_get_api
+    assert aioflo.API is API
+    assert aioflo.Device is Device
+    assert "APIManager" in dir(aioflo)
+
+    with pytest.raises(AttributeError):
+        aioflo.Unknown  # pylint: disable=no-member,pointless-statement
+
+
+def test_lazy_imports():
+    """Test that aiohttp isn't imported until it's needed."""
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from aioflo import async_get_api; "
+            "print('aiohttp' in sys.modules)",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert proc.stdout.strip() == "False"
@@ -0,0 +1,278 @@
+"""Define tests for request instrumentation."""
+# pylint: disable=protected-access
+import gc
+import json
+import sys
+
+import aiohttp
+import pytest
+
+from aioflo import async_get_api
+from aioflo.cache import ResponseCache
+from aioflo.errors import RequestError
+from aioflo.instrumentation import (
+    HistogramCollector,
+    Instrumentation,
+    OpenTelemetryInstrumentation,
+    RequestEvent,
+)
+from aioflo.ratelimit import RateLimiter
+from aioflo.retry import RetryPolicy
+from aioflo.transport import FakeTransport
+
+from .common import TEST_DEVICE_ID, TEST_EMAIL_ADDRESS, TEST_PASSWORD, load_fixture
+
+
+@pytest.mark.asyncio
+async def test_histogram_collector(aresponses, auth_success_response):
+    """Test collecting per-endpoint metrics from real requests."""
+    device_info = load_fixture("device_info_response.json")
+
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        f"/api/v2/devices/{TEST_DEVICE_ID}",
+        "get",
+        aresponses.Response(text=None, status=503),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        f"/api/v2/devices/{TEST_DEVICE_ID}",
+        "get",
+        aresponses.Response(text=device_info, status=200),
+    )
+
+    collector = HistogramCollector()
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(
+            TEST_EMAIL_ADDRESS,
+            TEST_PASSWORD,
+            session=session,
+            cache=ResponseCache(),
+            instrumentation=collector,
+            retry_policy=RetryPolicy(backoff_base=0.01),
+        )
+        await api.device.get_info(TEST_DEVICE_ID)
+        await api.device.get_info(TEST_DEVICE_ID)
+
+    stats = collector.get_stats()
+
+    auth_stats = stats["POST users/auth"]
+    assert auth_stats["count"] == 1
+    assert auth_stats["bytes_sent"] == len(
+        json.dumps({"username": TEST_EMAIL_ADDRESS, "password": TEST_PASSWORD})
+    )
+    assert auth_stats["statuses"] == {200: 1}
+
+    device_stats = stats["GET devices/{id}"]
+    assert device_stats["count"] == 2
+    assert device_stats["errors"] == 1
+    assert device_stats["retries"] == 1
+    assert device_stats["cache_hits"] == 1
+    assert device_stats["statuses"] == {200: 1, 503: 1}
+    assert device_stats["bytes_received"] == len(device_info.encode())
+    assert 0 < device_stats["latency_p50"] <= device_stats["latency_max"]
+
+
+def test_histogram_percentiles():
+    """Test estimating latency percentiles from buckets."""
+    collector = HistogramCollector(buckets=(0.1, 1.0))
+    for latency in (0.05, 0.05, 0.5, 3.0):
+        event = RequestEvent("get", "https://api-gw.meetflo.com/api/v2/alarms")
+        event.latency = latency
+        collector.on_request_end(event)
+
+    assert collector.get_percentile("GET", "alarms", 50) == 0.1
+    assert collector.get_percentile("GET", "alarms", 75) == 1.0
+    assert collector.get_percentile("GET", "alarms", 100) == 3.0
+    assert collector.get_percentile("GET", "unknown", 50) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_queue_time_excluded_from_latency():
+    """Test that time spent waiting for the rate limiter isn't counted as latency."""
+    events = []
+
+    class EventRecorder(Instrumentation):
+        """Define hooks that record completed requests."""
+
+        def on_request_end(self, event):
+            """Record the event."""
+            events.append(event)
+
+    transport = FakeTransport(latency=0.02)
+    transport.add_auth_route()
+    transport.add_route(
+        "get", "devices/{id}", load_fixture("device_info_response.json")
+    )
+
+    api = await async_get_api(
+        TEST_EMAIL_ADDRESS,
+        TEST_PASSWORD,
+        transport=transport,
+        instrumentation=EventRecorder(),
+        rate_limiter=RateLimiter(5, burst=1),
+    )
+    await api.device.get_info(TEST_DEVICE_ID)
+
+    auth_event, device_event = events
+    assert auth_event.queued < 0.02
+    assert device_event.queued >= 0.1
+    assert 0.02 <= device_event.latency < 0.1
+
+
+@pytest.mark.asyncio
+async def test_broken_hooks_are_ignored(aresponses, auth_success_response):
+    """Test that an error in a hook doesn't break the request."""
+
+    class BrokenInstrumentation(Instrumentation):
+        """Define hooks that always fail."""
+
+        def on_request_end(self, event):
+            """Fail."""
+            raise ValueError("Whoops")
+
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(
+            TEST_EMAIL_ADDRESS,
+            TEST_PASSWORD,
+            session=session,
+            instrumentation=BrokenInstrumentation(),
+        )
+        assert api._token
+
+
+def test_opentelemetry_not_installed(monkeypatch):
+    """Test that the OpenTelemetry adapter is a no-op if it isn't installed."""
+    monkeypatch.setitem(sys.modules, "opentelemetry", None)
+
+    instrumentation = OpenTelemetryInstrumentation()
+    assert not instrumentation.enabled
+
+    event = RequestEvent("get", "https://api-gw.meetflo.com/api/v2/alarms")
+    instrumentation.on_request_start(event)
+    event.finish()
+    instrumentation.on_request_error(event, RequestError("Whoops"))
+    instrumentation.on_cache_hit("get", event.url)
+    instrumentation.on_retry("get", event.url, 1, 0.5)
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_adapter():
+    """Test reporting requests to an OpenTelemetry meter and tracer."""
+    recorded = []
+
+    class FakeInstrument:
+        """Define a fake counter/histogram."""
+
+        def __init__(self, name):
+            """Initialize."""
+            self.name = name
+
+        def add(self, value, attributes):
+            """Record a counter increment."""
+            recorded.append((self.name, value, attributes))
+
+        record = add
+
+    class FakeMeter:
+        """Define a fake meter."""
+
+        def create_counter(self, name, unit=""):
+            """Create a counter."""
+            return FakeInstrument(name)
+
+        create_histogram = create_counter
+
+    class FakeSpan:
+        """Define a fake span."""
+
+        def __init__(self):
+            """Initialize."""
+            self.attributes = {}
+            self.ended = False
+
+        def set_attributes(self, attributes):
+            """Set attributes."""
+            self.attributes.update(attributes)
+
+        def record_exception(self, err):
+            """Record an exception."""
+
+        def end(self):
+            """End the span."""
+            self.ended = True
+
+    class FakeTracer:
+        """Define a fake tracer."""
+
+        def __init__(self):
+            """Initialize."""
+            self.spans = []
+
+        def start_span(self, name, attributes=None):
+            """Start a span."""
+            span = FakeSpan()
+            self.spans.append((name, span))
+            return span
+
+    tracer = FakeTracer()
+    instrumentation = OpenTelemetryInstrumentation(meter=FakeMeter(), tracer=tracer)
+    assert instrumentation.enabled
+
+    event = RequestEvent("get", f"https://api-gw.meetflo.com/api/v2/devices/{1}")
+    instrumentation.on_request_start(event)
+    event.status = 200
+    event.bytes_received = 100
+    event.finish()
+    instrumentation.on_request_end(event)
+
+    name, span = tracer.spans[0]
+    assert name == "GET devices/{id}"
+    assert span.ended
+    assert span.attributes["http.response.status_code"] == 200
+    assert ("aioflo.client.response.size", 100, span.attributes) in recorded
+    assert not instrumentation._spans
+
+    # A span can't outlive its request, even if it's never finished:
+    event = RequestEvent("get", f"https://api-gw.meetflo.com/api/v2/devices/{1}")
+    instrumentation.on_request_start(event)
+    assert len(instrumentation._spans) == 1
+    del event
+    gc.collect()
+    assert not instrumentation._spans
+
+    def broken_handler(_):
+        """Fail with an unexpected error."""
+        raise ValueError("Whoops")
+
+    # Requests that fail with any exception end their spans:
+    transport = FakeTransport()
+    transport.add_auth_route()
+    transport.add_route("get", "devices/{id}", broken_handler)
+    api = await async_get_api(
+        TEST_EMAIL_ADDRESS,
+        TEST_PASSWORD,
+        transport=transport,
+        instrumentation=instrumentation,
+    )
+    with pytest.raises(ValueError):
+        await api.device.get_info(TEST_DEVICE_ID)
+
+    name, span = tracer.spans[-1]
+    assert name == "GET devices/{id}"
+    assert span.ended
+    assert not instrumentation._spans
@@ -50,6 +50,43 @@ async def test_get_location_info(aresponses, auth_success_response):
         assert location_info["devices"][0]["fwVersion"]
 
 
+@pytest.mark.asyncio
+async def test_get_location_info_many(aresponses, auth_success_response):
+    """Test retrieving info for many locations."""
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/locations/mmnnoopp",
+        "get",
+        aresponses.Response(
+            text=load_fixture("location_info_expand_devices_response.json"), status=200
+        ),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/locations/bad",
+        "get",
+        aresponses.Response(text=None, status=500),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session)
+        results = {
+            location_id: result
+            async for location_id, result in api.location.get_info_many(
+                [TEST_LOCATION_ID, "bad"], include_device_info=True
+            )
+        }
+
+    assert results[TEST_LOCATION_ID]["devices"][0]["fwVersion"]
+    assert isinstance(results["bad"], RequestError)
+
+
 @pytest.mark.asyncio
 async def test_system_modes(aresponses, auth_success_response):
     """Test setting system modes.
@@ -110,3 +147,49 @@ async def test_system_modes(aresponses, auth_success_response):
 
         with pytest.raises(RequestError):
             await api.location.set_mode_sleep(TEST_LOCATION_ID, 120, revert_mode="away")
+
+
+@pytest.mark.asyncio
+async def test_system_modes_many(aresponses, auth_success_response):
+    """Test setting the system mode for many locations at once."""
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    for location_id in ("1", "2"):
+        aresponses.add(
+            "api-gw.meetflo.com",
+            f"/api/v2/locations/{location_id}/systemMode",
+            "post",
+            aresponses.Response(text=None, status=204),
+            body_pattern='{"target": "away"}',
+        )
+        aresponses.add(
+            "api-gw.meetflo.com",
+            f"/api/v2/locations/{location_id}/systemMode",
+            "post",
+            aresponses.Response(text=None, status=204),
+            body_pattern='{"target": "home"}',
+        )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/locations/bad/systemMode",
+        "post",
+        aresponses.Response(text=None, status=404),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session)
+
+        result = await api.location.set_mode_away_many(["1", "2", "bad"])
+        assert result.succeeded == ["1", "2"]
+        assert result.failed == ["bad"]
+        assert isinstance(result["bad"].error, RequestError)
+
+        result = await api.location.set_mode_home_many(["1", "2"], concurrency=1)
+        assert result.succeeded == ["1", "2"]
+
+    aresponses.assert_all_requests_matched()
+    aresponses.assert_no_unused_routes()
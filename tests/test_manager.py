@@ -0,0 +1,182 @@
+"""Define tests for managing many accounts."""
+# pylint: disable=protected-access
+import asyncio
+import json
+
+import aiohttp
+import pytest
+
+from aioflo.errors import FloError
+from aioflo.manager import APIManager, FairConcurrencyLimiter
+
+from .common import TEST_DEVICE_ID, TEST_PASSWORD, load_fixture
+
+
+@pytest.mark.asyncio
+async def test_limiter_round_robin():
+    """Test that waiting requests are served round-robin between accounts."""
+    limiter = FairConcurrencyLimiter(1)
+    order = []
+
+    async def run(account, idx):
+        """Hold a slot and record the order in which slots are granted."""
+        async with limiter.slot(account):
+            order.append((account, idx))
+            await asyncio.sleep(0)
+
+    tasks = [asyncio.create_task(run("a", idx)) for idx in range(3)]
+    tasks.append(asyncio.create_task(run("b", 0)))
+    await asyncio.gather(*tasks)
+
+    assert order == [("a", 0), ("a", 1), ("b", 0), ("a", 2)]
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_cancelled_waiter():
+    """Test that cancelling a waiting request doesn't leak a slot."""
+    limiter = FairConcurrencyLimiter(1)
+    release = asyncio.Event()
+
+    async def hold():
+        """Hold the only slot until released."""
+        async with limiter.slot("a"):
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    release.set()
+    await holder
+    assert limiter.in_flight == 0
+    assert not limiter._waiters
+
+
+@pytest.mark.asyncio
+async def test_manager_accounts(aresponses, auth_success_response):
+    """Test adding and removing accounts at runtime."""
+    for _ in range(2):
+        aresponses.add(
+            "api.meetflo.com",
+            "/api/v1/users/auth",
+            "post",
+            aresponses.Response(text=json.dumps(auth_success_response), status=200),
+        )
+
+    async with aiohttp.ClientSession() as session:
+        async with APIManager(
+            session=session, token_refresh_margin=300, refresh_stagger=600
+        ) as manager:
+            api_1 = await manager.async_add_account("user1@address.com", TEST_PASSWORD)
+            api_2 = await manager.async_add_account("user2@address.com", TEST_PASSWORD)
+
+            assert len(manager) == 2
+            assert "user1@address.com" in manager
+            assert manager["user2@address.com"] is api_2
+            assert api_1.transport is api_2.transport
+            assert api_1.transport._get_session() is session
+            for api in (api_1, api_2):
+                margin = api._token_refresh_margin.total_seconds()
+                assert 300 <= margin <= 900
+
+            # Adding an account that's already managed doesn't authenticate again:
+            assert (
+                await manager.async_add_account("user1@address.com", TEST_PASSWORD)
+                is api_1
+            )
+
+            await manager.async_remove_account("user1@address.com")
+            assert manager.usernames == ["user2@address.com"]
+
+            with pytest.raises(FloError):
+                await manager.async_remove_account("user1@address.com")
+
+        assert not manager.usernames
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_manager_add_many(aresponses, auth_success_response):
+    """Test that a failed account doesn't abort adding the others."""
+
+    async def auth_response(request):
+        """Reject one of the accounts."""
+        data = await request.json()
+        if data["username"] == "bad@address.com":
+            return aresponses.Response(text=None, status=401)
+        return aresponses.Response(text=json.dumps(auth_success_response), status=200)
+
+    aresponses.add(
+        "api.meetflo.com", "/api/v1/users/auth", "post", auth_response, repeat=3
+    )
+
+    async with aiohttp.ClientSession() as session:
+        async with APIManager(session=session) as manager:
+            results = await manager.async_add_accounts(
+                {
+                    "user1@address.com": TEST_PASSWORD,
+                    "bad@address.com": TEST_PASSWORD,
+                    "user2@address.com": TEST_PASSWORD,
+                }
+            )
+
+            assert isinstance(results["bad@address.com"], FloError)
+            assert sorted(manager.usernames) == [
+                "user1@address.com",
+                "user2@address.com",
+            ]
+
+
+@pytest.mark.asyncio
+async def test_manager_global_concurrency(aresponses, auth_success_response):
+    """Test that requests from all accounts share a global concurrency cap."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def device_info_response(_):
+        """Return device info after tracking how many requests are in flight."""
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return aresponses.Response(
+            text=load_fixture("device_info_response.json"), status=200
+        )
+
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+        repeat=2,
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        f"/api/v2/devices/{TEST_DEVICE_ID}",
+        "get",
+        device_info_response,
+        repeat=6,
+    )
+
+    async with aiohttp.ClientSession() as session:
+        async with APIManager(
+            session=session, max_concurrency=2, coalesce_requests=False
+        ) as manager:
+            apis = [
+                await manager.async_add_account(username, TEST_PASSWORD)
+                for username in ("user1@address.com", "user2@address.com")
+            ]
+            await asyncio.gather(
+                *(api.device.get_info(TEST_DEVICE_ID) for api in apis for _ in range(3))
+            )
+
+    assert max_in_flight == 2
+    aresponses.assert_plan_strictly_followed()
@@ -0,0 +1,100 @@
+"""Define tests for typed models."""
+# pylint: disable=protected-access
+from datetime import datetime, timezone
+import gc
+import json
+import tracemalloc
+
+import pytest
+
+from aioflo.models import AlarmDefinition, DeviceInfo, LocationInfo, UserInfo
+
+from .common import (
+    TEST_ACCOUNT_ID,
+    TEST_DEVICE_ID,
+    TEST_EMAIL_ADDRESS,
+    TEST_LOCATION_ID,
+    TEST_USER_ID,
+    load_fixture,
+)
+
+
+def test_device_info():
+    """Test creating a device and lazily parsing its sub-objects."""
+    device = DeviceInfo.from_dict(json.loads(load_fixture("device_info_response.json")))
+    assert device.fw_version == "6.1.1"
+    assert device.is_connected is True
+    assert device.mac_address == "111111111111"
+    assert device.nickname == "Smart Water Shutoff"
+    assert device.valve_state == "open"
+    assert not hasattr(device, "__dict__")
+
+    assert isinstance(device._telemetry, dict)
+    assert device.telemetry.psi == pytest.approx(54.2)
+    assert device.telemetry.updated == datetime(
+        2020, 7, 24, 12, 20, 58, tzinfo=timezone.utc
+    )
+    assert device.telemetry is device.telemetry
+
+    assert device.last_heard_from_time.tzinfo == timezone.utc
+    assert len(device.fw_properties) == 169
+    with pytest.raises(TypeError):
+        device.fw_properties["alarm_snooze_enabled"] = False
+
+
+def test_device_info_memory():
+    """Test that a device holds far less memory than its decoded payload."""
+
+    def get_retained_size(func):
+        """Return the bytes still allocated after decoding a payload and dropping it."""
+        gc.collect()
+        tracemalloc.start()
+        try:
+            data = json.loads(load_fixture("device_info_response.json"))
+            result = func(data)
+            del data
+            gc.collect()
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        assert result is not None
+        return size
+
+    payload_size = get_retained_size(lambda data: data)
+    device_size = get_retained_size(DeviceInfo.from_dict)
+    assert device_size < payload_size / 3
+
+
+def test_location_info():
+    """Test creating a location."""
+    location = LocationInfo.from_dict(
+        json.loads(load_fixture("location_info_base_response.json"))
+    )
+    assert location.id == TEST_LOCATION_ID
+    assert location.account_id == TEST_ACCOUNT_ID
+    assert location.device_ids == (TEST_DEVICE_ID,)
+    assert location.devices[0].id == TEST_DEVICE_ID
+    assert location.devices[0].mac_address == "123456abcdef"
+
+
+def test_user_info():
+    """Test creating a user."""
+    user = UserInfo.from_dict(
+        json.loads(load_fixture("user_info_expand_alarm_settings_response.json"))
+    )
+    assert user.id == TEST_USER_ID
+    assert user.email == TEST_EMAIL_ADDRESS
+    assert user.location_ids == (TEST_LOCATION_ID,)
+    assert len(user.alarm_settings) == 1
+
+
+def test_alarm_definition():
+    """Test creating an alarm definition."""
+    alarm = AlarmDefinition.from_dict(
+        json.loads(load_fixture("alarms_response.json"))["items"][0]
+    )
+    assert alarm.id == 3
+    assert alarm.name == "health_test_skipped"
+    assert alarm.severity == "info"
+    assert alarm.is_shutoff is False
+    assert alarm.user_actions["displayTitle"] == "Clear this Alert"
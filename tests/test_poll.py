@@ -0,0 +1,194 @@
+"""Define tests for the polling coordinator."""
+import asyncio
+
+import pytest
+
+from aioflo.errors import FloError, RequestError, RequestTimeoutError
+from aioflo.poll import PollCoordinator
+from aioflo.snapshot import MISSING, Change, SnapshotStore
+
+
+@pytest.mark.asyncio
+async def test_poll_callbacks_and_queues():
+    """Test that updates are delivered to callbacks and queues."""
+    received = []
+
+    async def poll():
+        """Return some data."""
+        return {"isConnected": True}
+
+    async def async_callback(update):
+        """Record an update."""
+        received.append(update)
+
+    coordinator = PollCoordinator()
+    coordinator.add_job(("device", "98765"), poll, 0.01)
+    remove = coordinator.add_callback(async_callback)
+    queue = coordinator.subscribe()
+
+    async with coordinator:
+        update = await asyncio.wait_for(queue.get(), 1)
+        assert update.key == ("device", "98765")
+        assert update.data == {"isConnected": True}
+        assert update.error is None
+
+        remove()
+        count = len(received)
+        await asyncio.wait_for(queue.get(), 1)
+        assert len(received) == count
+
+    assert received
+
+
+@pytest.mark.asyncio
+async def test_poll_errors():
+    """Test that a failed poll is delivered as an error and polling continues."""
+    calls = 0
+
+    async def poll():
+        """Fail the first poll."""
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RequestError("Whoops")
+        return calls
+
+    coordinator = PollCoordinator()
+    coordinator.add_job("device", poll, 0.01)
+    queue = coordinator.subscribe()
+
+    async with coordinator:
+        first = await asyncio.wait_for(queue.get(), 1)
+        second = await asyncio.wait_for(queue.get(), 1)
+
+    assert isinstance(first.error, FloError)
+    assert second.data == 2
+
+
+@pytest.mark.asyncio
+async def test_poll_unexpected_errors(caplog):
+    """Test that an unexpected exception in a poll is still delivered as an error."""
+    calls = 0
+
+    async def poll():
+        """Fail the first poll while parsing the payload."""
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return {}["missing"]
+        return calls
+
+    coordinator = PollCoordinator()
+    coordinator.add_job("device", poll, 0.01)
+    queue = coordinator.subscribe()
+
+    async with coordinator:
+        first = await asyncio.wait_for(queue.get(), 1)
+        second = await asyncio.wait_for(queue.get(), 1)
+
+    assert isinstance(first.error, FloError)
+    assert isinstance(first.error.__cause__, KeyError)
+    assert first.data is None
+    assert second.data == 2
+    assert "Unexpected error while polling device" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_poll_timeout():
+    """Test that a poll that overruns its timeout is cancelled and reported."""
+    cancelled = False
+
+    async def poll():
+        """Hang until cancelled."""
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    coordinator = PollCoordinator()
+    coordinator.add_job("device", poll, 0.01, timeout=0.01)
+    queue = coordinator.subscribe()
+
+    async with coordinator:
+        update = await asyncio.wait_for(queue.get(), 1)
+
+    assert isinstance(update.error, RequestTimeoutError)
+    assert cancelled
+
+
+@pytest.mark.asyncio
+async def test_poll_skip_if_running():
+    """Test that polls are skipped while a previous poll is still running."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def poll():
+        """Take longer than the interval."""
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            in_flight -= 1
+
+    coordinator = PollCoordinator(jitter=0)
+    job = coordinator.add_job("slow", poll, 0.01)
+
+    async with coordinator:
+        await asyncio.sleep(0.15)
+
+    assert max_in_flight == 1
+    assert job.skipped > 0
+    assert in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_poll_add_remove_at_runtime():
+    """Test scheduling and unscheduling jobs while polling."""
+
+    async def poll():
+        """Return nothing."""
+
+    coordinator = PollCoordinator()
+    queue = coordinator.subscribe(maxsize=1)
+
+    async with coordinator:
+        coordinator.add_job("device", poll, 0.01)
+        assert "device" in coordinator
+        await asyncio.wait_for(queue.get(), 1)
+
+        coordinator.remove_job("device")
+        assert not coordinator
+
+    with pytest.raises(RequestError):
+        coordinator.add_job("bad", poll, 0)
+
+
+@pytest.mark.asyncio
+async def test_poll_only_changes():
+    """Test that only polls with changes are delivered when using snapshots."""
+    payloads = iter([{"valve": "open"}, {"valve": "open"}, {"valve": "closed"}])
+
+    async def poll():
+        """Return the next payload (repeating the last one)."""
+        try:
+            return next(payloads)
+        except StopIteration:
+            return {"valve": "closed"}
+
+    coordinator = PollCoordinator(snapshot_store=SnapshotStore())
+    coordinator.add_job("device", poll, 0.01)
+    queue = coordinator.subscribe()
+
+    async with coordinator:
+        first = await asyncio.wait_for(queue.get(), 1)
+        second = await asyncio.wait_for(queue.get(), 1)
+        await asyncio.sleep(0.05)
+
+    assert first.changes == [Change((), MISSING, {"valve": "open"})]
+    assert second.data == {"valve": "closed"}
+    assert second.changes == [Change(("valve",), "open", "closed")]
+    assert queue.empty()
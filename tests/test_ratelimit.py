@@ -0,0 +1,127 @@
+"""Define tests for the client-side rate limiter."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import json
+import time
+
+import aiohttp
+import pytest
+
+from aioflo import async_get_api
+from aioflo.errors import FloError, RateLimitError, ResponseError
+from aioflo.ratelimit import RateLimiter, parse_retry_after
+
+from .common import TEST_DEVICE_ID, TEST_EMAIL_ADDRESS, TEST_PASSWORD, load_fixture
+
+
+def test_parse_retry_after():
+    """Test parsing both forms of the Retry-After header."""
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("not a date") is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 28 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+
+
+@pytest.mark.asyncio
+async def test_token_bucket():
+    """Test that requests beyond the burst are spread out at the allowed rate."""
+    limiter = RateLimiter(20, burst=2)
+
+    start = time.monotonic()
+    for _ in range(4):
+        await limiter.acquire()
+
+    # Two requests are free; the next two wait ~1/20th of a second each:
+    assert time.monotonic() - start >= 0.09
+
+
+def test_adaptive_rate():
+    """Test that the rate backs off on throttling and recovers on success."""
+    limiter = RateLimiter(8, min_rate=1)
+    limiter.on_response(429)
+    assert limiter.rate == 4
+    limiter.on_response(503)
+    limiter.on_response(503)
+    limiter.on_response(503)
+    assert limiter.rate == 1
+
+    for _ in range(50):
+        limiter.on_response(200)
+    assert limiter.rate == pytest.approx(5)
+
+    # Other errors don't affect the rate:
+    limiter.on_response(404)
+    assert limiter.rate == pytest.approx(5)
+
+
+def test_rate_probing():
+    """Test that the rate climbs past its initial value until throttled."""
+    limiter = RateLimiter(10)
+    for _ in range(100):
+        limiter.on_response(200)
+    assert limiter.rate == pytest.approx(20)
+
+    for _ in range(1000):
+        limiter.on_response(200)
+    assert limiter.rate == 40
+
+    limiter.on_response(429)
+    assert limiter.rate == 20
+
+    limiter = RateLimiter(10, max_rate=12)
+    for _ in range(1000):
+        limiter.on_response(200)
+    assert limiter.rate == 12
+
+    with pytest.raises(FloError):
+        RateLimiter(10, max_rate=5)
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_api_requests(aresponses, auth_success_response):
+    """Test that a 429 raises the right error and pauses subsequent requests."""
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/98765",
+        "get",
+        aresponses.Response(
+            text="Too Many Requests", status=429, headers={"Retry-After": "0.2"}
+        ),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/98765",
+        "get",
+        aresponses.Response(text=load_fixture("device_info_response.json"), status=200),
+    )
+
+    limiter = RateLimiter(100)
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(
+            TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session, rate_limiter=limiter
+        )
+
+        with pytest.raises(RateLimitError) as err:
+            await api.device.get_info(TEST_DEVICE_ID)
+        assert isinstance(err.value, ResponseError)
+        assert err.value.status == 429
+        assert err.value.retry_after == 0.2
+        # The successful authentication nudged the rate up before it was halved:
+        assert limiter.rate == pytest.approx(50.5)
+
+        start = asyncio.get_running_loop().time()
+        device_info = await api.device.get_info(TEST_DEVICE_ID)
+        assert asyncio.get_running_loop().time() - start >= 0.19
+        assert device_info["fwVersion"] == "6.1.1"
+
+    aresponses.assert_plan_strictly_followed()
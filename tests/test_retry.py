@@ -0,0 +1,144 @@
+"""Define tests for retrying failed requests."""
+import json
+
+import aiohttp
+import pytest
+
+from aioflo import async_get_api
+from aioflo.errors import (
+    RateLimitError,
+    RequestError,
+    RequestTimeoutError,
+    ResponseError,
+)
+from aioflo.retry import RetryPolicy
+
+from .common import TEST_DEVICE_ID, TEST_EMAIL_ADDRESS, TEST_PASSWORD, load_fixture
+
+
+def test_retry_classification():
+    """Test which errors are considered retryable."""
+    policy = RetryPolicy()
+    assert policy.is_retryable(ResponseError("Server error", 503))
+    assert policy.is_retryable(RateLimitError("Rate limited"))
+    assert policy.is_retryable(RequestTimeoutError("Timed out"))
+    assert not policy.is_retryable(ResponseError("Not found", 404))
+    assert not policy.is_retryable(RequestError("Invalid argument"))
+
+    policy = RetryPolicy(retry_statuses={404}, retry_exceptions=())
+    assert policy.is_retryable(ResponseError("Not found", 404))
+    assert not policy.is_retryable(RequestTimeoutError("Timed out"))
+
+
+def test_retry_delays():
+    """Test exponential backoff with jitter."""
+    policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=False)
+    err = ResponseError("Server error", 503)
+    assert [policy.get_delay(attempt, err) for attempt in range(1, 6)] == [
+        1,
+        2,
+        4,
+        5,
+        5,
+    ]
+
+    policy = RetryPolicy(backoff_base=1, backoff_max=5)
+    assert all(0 <= policy.get_delay(3, err) <= 4 for _ in range(100))
+
+    # A server-provided Retry-After is never undercut:
+    assert policy.get_delay(1, RateLimitError("Rate limited", retry_after=10)) >= 10
+
+
+@pytest.mark.asyncio
+async def test_retried_requests(aresponses, auth_success_response):
+    """Test that reads and idempotent writes are retried (and other writes aren't)."""
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/98765",
+        "get",
+        aresponses.Response(text="Bad Gateway", status=502),
+        repeat=2,
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/98765",
+        "get",
+        aresponses.Response(text=load_fixture("device_info_response.json"), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/98765",
+        "post",
+        aresponses.Response(text="Service Unavailable", status=503),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/98765",
+        "post",
+        aresponses.Response(
+            text=load_fixture("device_close_valve_response.json"), status=200
+        ),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/98765/healthTest/run",
+        "post",
+        aresponses.Response(text="Service Unavailable", status=503),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(
+            TEST_EMAIL_ADDRESS,
+            TEST_PASSWORD,
+            session=session,
+            retry_policy=RetryPolicy(backoff_base=0.01),
+        )
+
+        device_info = await api.device.get_info(TEST_DEVICE_ID)
+        assert device_info["fwVersion"] == "6.1.1"
+
+        device_info = await api.device.close_valve(TEST_DEVICE_ID)
+        assert device_info["valve"]["target"] == "closed"
+
+        with pytest.raises(ResponseError) as err:
+            await api.device.run_health_test(TEST_DEVICE_ID)
+        assert err.value.status == 503
+
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_retries_exhausted(aresponses, auth_success_response):
+    """Test that the last error is raised once all attempts fail."""
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/devices/98765",
+        "get",
+        aresponses.Response(text="Internal Server Error", status=500),
+        repeat=2,
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(
+            TEST_EMAIL_ADDRESS,
+            TEST_PASSWORD,
+            session=session,
+            retry_policy=RetryPolicy(max_attempts=2, backoff_base=0.01),
+        )
+
+        with pytest.raises(ResponseError):
+            await api.device.get_info(TEST_DEVICE_ID)
+
+    aresponses.assert_plan_strictly_followed()
@@ -0,0 +1,44 @@
+"""Define tests for change detection between payloads."""
+import copy
+import json
+
+from aioflo.snapshot import MISSING, Change, SnapshotStore, diff
+
+from .common import TEST_DEVICE_ID, load_fixture
+
+
+def test_diff():
+    """Test diffing nested payloads."""
+    old = {"a": 1, "b": {"c": [1, 2, 3], "d": "x"}, "e": True, "f": None}
+    new = {"a": 1, "b": {"c": [1, 5], "d": "x"}, "e": 1, "g": "new"}
+
+    assert diff(old, new) == [
+        Change(("b", "c", 1), 2, 5),
+        Change(("b", "c", 2), 3, MISSING),
+        Change(("e",), True, 1),
+        Change(("f",), None, MISSING),
+        Change(("g",), MISSING, "new"),
+    ]
+    assert diff(old, copy.deepcopy(old)) == []
+    assert diff([1], {"a": 1}) == [Change((), [1], {"a": 1})]
+
+
+def test_snapshot_store():
+    """Test that the store reports only what changed between polls."""
+    key = ("device", TEST_DEVICE_ID)
+    first = json.loads(load_fixture("device_info_response.json"))
+    second = copy.deepcopy(first)
+    second["valve"]["lastKnown"] = "closed"
+
+    store = SnapshotStore()
+    assert store.update(key, first) == [Change((), MISSING, first)]
+    assert store.update(key, copy.deepcopy(first)) == []
+    assert store.update(key, second) == [
+        Change(("valve", "lastKnown"), "open", "closed")
+    ]
+    assert store.get(key) is second
+    assert key in store
+
+    store.remove(key)
+    assert not store
+    assert store.get(key) is None
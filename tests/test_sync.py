@@ -0,0 +1,134 @@
+"""Define tests for incremental consumption syncing."""
+from datetime import datetime
+import json
+
+import aiohttp
+import pytest
+
+from aioflo import async_get_api
+from aioflo.sync import (
+    ConsumptionSync,
+    HighWaterMarkStore,
+    JSONFileStore,
+    MemoryStore,
+    SQLiteStore,
+)
+
+from .common import TEST_EMAIL_ADDRESS, TEST_LOCATION_ID, TEST_PASSWORD
+
+
+@pytest.mark.parametrize("store_type", ["json", "sqlite"])
+def test_persistent_stores(store_type, tmp_path):
+    """Test that high-water marks survive re-opening a persistent store."""
+    if store_type == "json":
+        path = str(tmp_path / "marks.json")
+        store = JSONFileStore(path)
+    else:
+        path = str(tmp_path / "marks.db")
+        store = SQLiteStore(path)
+
+    assert store.get("mmnnoopp:1h") is None
+    store.set("mmnnoopp:1h", datetime(2020, 1, 16, 8, 0))
+    store.set("mmnnoopp:1h", datetime(2020, 1, 16, 9, 0))
+
+    if store_type == "json":
+        store = JSONFileStore(path)
+    else:
+        store.close()
+        store = SQLiteStore(path)
+
+    assert store.get("mmnnoopp:1h") == datetime(2020, 1, 16, 9, 0)
+
+
+def test_abstract_store():
+    """Test that a store must implement both get and set."""
+
+    class IncompleteStore(HighWaterMarkStore):
+        """Define a store that can't set high-water marks."""
+
+        def get(self, key):
+            """Return nothing."""
+            return None
+
+    with pytest.raises(TypeError):
+        IncompleteStore()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("store_type", ["memory", "sqlite"])
+async def test_incremental_sync(
+    aresponses, auth_success_response, store_type, tmp_path
+):
+    """Test that each sync only requests data after the last complete bucket."""
+    requested_ranges = []
+
+    def consumption_response(request):
+        """Return the requested hours (up to the open one)."""
+        requested_ranges.append((request.query["startDate"], request.query["endDate"]))
+        start = datetime.fromisoformat(request.query["startDate"])
+        end = datetime.fromisoformat(request.query["endDate"])
+        return aresponses.Response(
+            text=json.dumps(
+                {
+                    "aggregations": {"sumTotalGallonsConsumed": 0},
+                    "items": [
+                        {
+                            "time": start.replace(hour=hour).isoformat(),
+                            "gallonsConsumed": 1.0,
+                        }
+                        for hour in range(start.hour, end.hour + 1)
+                    ],
+                }
+            ),
+            status=200,
+        )
+
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/water/consumption",
+        "get",
+        consumption_response,
+        repeat=2,
+    )
+
+    # Blocking stores are called from the default executor's threads:
+    if store_type == "memory":
+        store = MemoryStore()
+    else:
+        store = SQLiteStore(str(tmp_path / "marks.db"))
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session)
+        sync = ConsumptionSync(api.water, store)
+
+        items = await sync.async_sync(
+            TEST_LOCATION_ID, now=datetime(2020, 1, 16, 2, 30)
+        )
+        assert [item["time"] for item in items] == [
+            "2020-01-16T00:00:00",
+            "2020-01-16T01:00:00",
+            "2020-01-16T02:00:00",
+        ]
+        assert store.get(f"{TEST_LOCATION_ID}:1h") == datetime(2020, 1, 16, 1, 0)
+
+        # The previously open bucket (02:00) is requested again:
+        items = await sync.async_sync(
+            TEST_LOCATION_ID, now=datetime(2020, 1, 16, 3, 15)
+        )
+        assert [item["time"] for item in items] == [
+            "2020-01-16T02:00:00",
+            "2020-01-16T03:00:00",
+        ]
+        assert store.get(f"{TEST_LOCATION_ID}:1h") == datetime(2020, 1, 16, 2, 0)
+
+    assert requested_ranges == [
+        ("2020-01-16T00:00:00", "2020-01-16T02:30:00"),
+        ("2020-01-16T02:00:00", "2020-01-16T03:15:00"),
+    ]
+    aresponses.assert_plan_strictly_followed()
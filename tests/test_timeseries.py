@@ -0,0 +1,67 @@
+"""Define tests for the columnar time-series container."""
+import json
+import math
+
+import pytest
+
+from aioflo.errors import FloError
+from aioflo.timeseries import RESAMPLE_MEAN, TimeSeries, parse_timestamp
+
+from .common import load_fixture
+
+
+def test_parse_timestamp():
+    """Test parsing the timestamp formats returned by the API."""
+    assert parse_timestamp("2020-01-16T00:00:00-07:00") == 1579158000
+    assert parse_timestamp("2020-01-16T07:00:00.000Z") == 1579158000
+    assert parse_timestamp("2020-01-16T07:00:00") == 1579158000
+
+
+def test_consumption_series():
+    """Test building and aggregating a consumption series."""
+    series = TimeSeries.from_consumption(
+        json.loads(load_fixture("water_consumption_info_response.json"))
+    )
+    assert len(series) == 5
+    assert series.timestamps.typecode == "q"
+    assert series.columns["gallonsConsumed"].typecode == "d"
+    assert series.sum("gallonsConsumed") == pytest.approx(3.674)
+    assert series.min("gallonsConsumed") == 0.04
+    assert series.max("gallonsConsumed") == 1.499
+
+    # Bucket into days in the location's time zone (UTC-7):
+    daily = series.resample(86400, utc_offset=-7 * 3600)
+    assert list(daily.timestamps) == [parse_timestamp("2020-01-16T00:00:00-07:00")]
+    assert daily.sum("gallonsConsumed") == pytest.approx(3.674)
+
+    with pytest.raises(FloError):
+        series.sum("averagePsi")
+    with pytest.raises(FloError):
+        series.resample(0)
+
+
+def test_metrics_series():
+    """Test that missing metric values are stored as NaN and ignored."""
+    series = TimeSeries.from_metrics(
+        json.loads(load_fixture("water_metric_info_response.json"))
+    )
+    assert len(series) == 3
+    assert all(math.isnan(value) for value in series.columns["averageGpm"])
+    assert math.isnan(series.mean("averageGpm"))
+    assert math.isnan(series.max("averageGpm"))
+    assert series.mean("averagePsi") == pytest.approx(78.1)
+
+    two_hourly = series.resample(7200, RESAMPLE_MEAN, utc_offset=-7 * 3600)
+    assert list(two_hourly.columns["averageTempF"]) == pytest.approx([59.6, 61.4])
+    assert math.isnan(two_hourly.columns["averageGpm"][0])
+
+
+def test_to_numpy():
+    """Test exporting the series to NumPy arrays."""
+    numpy = pytest.importorskip("numpy")
+    series = TimeSeries.from_metrics(
+        json.loads(load_fixture("water_metric_info_response.json"))
+    )
+    arrays = series.to_numpy()
+    assert arrays["time"].dtype == numpy.int64
+    assert numpy.nanmean(arrays["averagePsi"]) == pytest.approx(78.1)
@@ -0,0 +1,162 @@
+"""Define tests for transports."""
+import asyncio
+import json
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from aioflo import async_get_api
+from aioflo.cache import ValidatorCache
+from aioflo.errors import RequestTimeoutError, ResponseError, TransportError
+from aioflo.transport import (
+    AiohttpTransport,
+    FakeTransport,
+    Timeout,
+    Transport,
+    TransportResponse,
+)
+
+from .common import TEST_DEVICE_ID, TEST_EMAIL_ADDRESS, TEST_PASSWORD, load_fixture
+
+
+@pytest.mark.asyncio
+async def test_custom_transport():
+    """Test that a custom transport must implement request (but not close)."""
+
+    class IncompleteTransport(Transport):
+        """Define a transport that can't send requests."""
+
+    class EchoTransport(Transport):
+        """Define a transport that echoes request bodies."""
+
+        async def request(self, method, url, **kwargs):
+            """Return the request's JSON payload."""
+            return TransportResponse(200, {}, json.dumps(kwargs["json"]).encode())
+
+    with pytest.raises(TypeError):
+        IncompleteTransport()
+
+    transport = EchoTransport()
+    response = await transport.request("post", "/echo", headers={}, json={"a": 1})
+    assert response == (200, {}, b'{"a": 1}')
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_fake_transport():
+    """Test serving fixtures to many simulated devices without a network."""
+    transport = FakeTransport()
+    transport.add_auth_route()
+    transport.add_route(
+        "get", "devices/{id}", load_fixture("device_info_response.json")
+    )
+
+    api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, transport=transport)
+    results = [
+        result
+        async for _, result in api.device.get_info_many(
+            [str(idx) for idx in range(100)], concurrency=20
+        )
+    ]
+
+    assert len(results) == 100
+    assert all(result["nickname"] == "Smart Water Shutoff" for result in results)
+    assert transport.requests == 101
+
+    with pytest.raises(ResponseError) as err:
+        await api.location.get_info("unknown")
+    assert err.value.status == 404
+
+
+@pytest.mark.asyncio
+async def test_fake_transport_handlers():
+    """Test serving dynamic responses and honoring validators."""
+    received = []
+
+    def valve_handler(request):
+        """Record the request and echo the target valve state."""
+        received.append(request)
+        return TransportResponse(200, {}, json.dumps(request.json).encode())
+
+    transport = FakeTransport()
+    transport.add_auth_route()
+    transport.add_route("post", "devices/{id}", valve_handler)
+    transport.add_route(
+        "get", "alarms", load_fixture("alarms_response.json"), headers={"ETag": '"a"'}
+    )
+
+    api = await async_get_api(
+        TEST_EMAIL_ADDRESS,
+        TEST_PASSWORD,
+        transport=transport,
+        validator_cache=ValidatorCache(),
+    )
+    assert await api.device.close_valve(TEST_DEVICE_ID) == {
+        "valve": {"target": "closed"}
+    }
+    assert received[0].endpoint == "devices/{id}"
+
+    first = await api.alarm.get_all()
+    assert await api.alarm.get_all() is first
+    assert api.validator_cache.not_modified["alarms"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fake_transport_latency_and_errors():
+    """Test injecting latency, HTTP errors, and dropped requests."""
+    transport = FakeTransport(latency=0.02, jitter=0.01, seed=1)
+    transport.add_auth_route()
+
+    start = time.perf_counter()
+    api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, transport=transport)
+    assert time.perf_counter() - start >= 0.01
+
+    transport = FakeTransport(error_rate=1, error_status=503)
+    with pytest.raises(ResponseError) as err:
+        await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, transport=transport)
+    assert err.value.status == 503
+
+    transport = FakeTransport(drop_rate=1)
+    with pytest.raises(TransportError):
+        await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, transport=transport)
+
+    await api.close()
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_transport_timeouts_and_cancellation():
+    """Test that stalled responses time out and cancelled requests are cleaned up."""
+
+    async def stall(request):
+        """Start a response, then stall."""
+        resp = web.StreamResponse()
+        await resp.prepare(request)
+        await resp.write(b'{"partial": ')
+        await asyncio.sleep(10)
+        return resp
+
+    app = web.Application()
+    app.router.add_get("/stall", stall)
+
+    async with TestServer(app) as server:
+        transport = AiohttpTransport()
+        url = str(server.make_url("/stall"))
+
+        with pytest.raises(RequestTimeoutError):
+            await transport.request("get", url, headers={}, timeout=Timeout(read=0.05))
+
+        task = asyncio.create_task(transport.request("get", url, headers={}))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # Neither half-read connection is held or pooled for reuse:
+        # pylint: disable=protected-access
+        connector = transport._get_session().connector
+        assert not connector._acquired
+        assert not connector._conns
+
+        await transport.close()
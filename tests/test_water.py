@@ -1,5 +1,5 @@
 """Define tests for water-related endpoints."""
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 
 import aiohttp
@@ -7,6 +7,7 @@ import pytest
 
 from aioflo import async_get_api
 from aioflo.errors import RequestError
+from aioflo.water import INTERVAL_DAILY, INTERVAL_MONTHLY, split_range
 
 from .common import (
     TEST_EMAIL_ADDRESS,
@@ -89,3 +90,178 @@ async def test_get_metrics(aresponses, auth_success_response):
                 end,
                 interval="a_totally_fake_interval",
             )
+
+
+def test_split_range():
+    """Test splitting a range into chunks aligned to bucket boundaries."""
+    assert split_range(
+        datetime(2020, 1, 1, 5, 30), datetime(2020, 1, 3, 23, 59, 59, 999000), "1h", 24
+    ) == [
+        (datetime(2020, 1, 1, 5, 30), datetime(2020, 1, 2, 4, 59, 59, 999000)),
+        (datetime(2020, 1, 2, 5, 0), datetime(2020, 1, 3, 4, 59, 59, 999000)),
+        (datetime(2020, 1, 3, 5, 0), datetime(2020, 1, 3, 23, 59, 59, 999000)),
+    ]
+    assert split_range(
+        datetime(2020, 11, 15), datetime(2021, 2, 28), INTERVAL_MONTHLY, 2
+    ) == [
+        (datetime(2020, 11, 15), datetime(2020, 12, 31, 23, 59, 59, 999000)),
+        (datetime(2021, 1, 1), datetime(2021, 2, 28)),
+    ]
+    assert len(split_range(datetime(2020, 1, 1), datetime(2020, 12, 31), "1d")) == 5
+
+    with pytest.raises(RequestError):
+        split_range(datetime(2020, 1, 1), datetime(2020, 1, 2), INTERVAL_DAILY, 0)
+
+
+@pytest.mark.asyncio
+async def test_get_consumption_history(aresponses, auth_success_response):
+    """Test retrieving consumption data for a long range in chunks."""
+
+    def consumption_response(request):
+        """Return one bucket per chunk, plus one that overlaps the next chunk."""
+        start = datetime.fromisoformat(request.query["startDate"])
+        return aresponses.Response(
+            text=json.dumps(
+                {
+                    "params": {
+                        "startDate": request.query["startDate"],
+                        "endDate": request.query["endDate"],
+                    },
+                    "aggregations": {"sumTotalGallonsConsumed": 0},
+                    "items": [
+                        {"time": start.isoformat(), "gallonsConsumed": 1.5},
+                        {
+                            "time": (start + timedelta(days=1)).isoformat(),
+                            "gallonsConsumed": 100,
+                        },
+                    ],
+                }
+            ),
+            status=200,
+        )
+
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/water/consumption",
+        "get",
+        consumption_response,
+        repeat=4,
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session)
+        consumption_info = await api.water.get_consumption_history(
+            TEST_LOCATION_ID,
+            datetime(2020, 1, 1),
+            datetime(2020, 1, 4, 23, 59, 59, 999000),
+            chunk_size=24,
+            concurrency=2,
+        )
+
+    assert [item["time"] for item in consumption_info["items"]] == [
+        "2020-01-01T00:00:00",
+        "2020-01-02T00:00:00",
+        "2020-01-03T00:00:00",
+        "2020-01-04T00:00:00",
+        "2020-01-05T00:00:00",
+    ]
+    assert consumption_info["aggregations"]["sumTotalGallonsConsumed"] == 401.5
+    assert consumption_info["params"] == {
+        "startDate": "2020-01-01T00:00:00",
+        "endDate": "2020-01-04T23:59:59.999000",
+    }
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_history(aresponses, auth_success_response):
+    """Test retrieving metrics for a long range in chunks."""
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/water/metrics",
+        "get",
+        aresponses.Response(
+            text=load_fixture("water_metric_info_response.json"), status=200
+        ),
+        repeat=2,
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(
+            TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session, coalesce_requests=False
+        )
+        metrics = await api.water.get_metrics_history(
+            TEST_MAC_ADDRESS,
+            datetime(2020, 1, 16, 0, 0),
+            datetime(2020, 1, 16, 23, 59, 59, 999000),
+            chunk_size=12,
+        )
+
+    # Both chunks return the same fixture, so its items should be de-duplicated:
+    assert len(metrics["items"]) == 3
+    assert "aggregations" not in metrics
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.asyncio
+async def test_iter_metrics(aresponses, auth_success_response):
+    """Test iterating over metrics one chunk at a time."""
+    requested_starts = []
+
+    def metrics_response(request):
+        """Return one bucket per chunk and record which chunk was requested."""
+        requested_starts.append(request.query["startDate"])
+        return aresponses.Response(
+            text=json.dumps(
+                {"items": [{"time": request.query["startDate"], "averagePsi": 78.3}]}
+            ),
+            status=200,
+        )
+
+    aresponses.add(
+        "api.meetflo.com",
+        "/api/v1/users/auth",
+        "post",
+        aresponses.Response(text=json.dumps(auth_success_response), status=200),
+    )
+    aresponses.add(
+        "api-gw.meetflo.com",
+        "/api/v2/water/metrics",
+        "get",
+        metrics_response,
+        repeat=3,
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = await async_get_api(TEST_EMAIL_ADDRESS, TEST_PASSWORD, session=session)
+
+        times = []
+        async for item in api.water.iter_metrics(
+            TEST_MAC_ADDRESS,
+            datetime(2020, 1, 1),
+            datetime(2020, 1, 3, 23, 59, 59, 999000),
+            INTERVAL_DAILY,
+            chunk_size=1,
+        ):
+            # Chunks should be requested lazily, as items are consumed:
+            assert len(requested_starts) == len(times) + 1
+            times.append(item["time"])
+
+    assert times == [
+        "2020-01-01T00:00:00",
+        "2020-01-02T00:00:00",
+        "2020-01-03T00:00:00",
+    ]
+    aresponses.assert_plan_strictly_followed()